@@ -0,0 +1,28 @@
+"""
+Offline benchmarks for the data layer, one module per area:
+
+    synthetic   synthetic tables (same column names and dtypes as the production Parquet files)
+    loading     copies per rerun, null treatment, cold start, GCS sync
+    backends    DuckDB and Polars against pandas
+    dates       date-window filters
+    filters     FilterPlan, filter result cache, AI Labs filters
+    facets      cascading option lists, facet catalogue
+    importtime  import cost of the page modules
+
+Usage (from the app root):
+    python -m benchmarks copies --rows 100000
+    python -m benchmarks nulls --rows 100000
+    python -m benchmarks startup --rows 5000 --scales 1 10 100
+    python -m benchmarks duckdb --rows 100000
+    python -m benchmarks polars --rows 100000
+    python -m benchmarks dates --rows 1000000
+    python -m benchmarks sync --rows 100000
+    python -m benchmarks filters --rows 1000000
+    python -m benchmarks filtercache --rows 1000000 --sessions 300
+    python -m benchmarks facets --rows 1000000
+    python -m benchmarks labs --rows 100000
+    python -m benchmarks importtime --budget-ms 500
+
+The numbers are comparable between runs but not with production sizes. Correctness (same
+results as the code each benchmark replaces) is tested in tests/, not here.
+"""
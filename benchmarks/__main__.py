@@ -0,0 +1,102 @@
+"""
+Command line of the benchmarks: python -m benchmarks <name> [options] (see benchmarks/__init__.py).
+"""
+
+import argparse
+import sys
+
+import benchmarks
+from benchmarks import backends, dates, facets, filters, importtime, loading
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=benchmarks.__doc__.strip().splitlines()[0]
+    )
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    copies_parser = sub.add_parser("copies", help="bytes copied per rerun by get_user_dataframe")
+    copies_parser.add_argument("--rows", type=int, default=100_000)
+
+    nulls_parser = sub.add_parser("nulls", help="null-token normalisation pass")
+    nulls_parser.add_argument("--rows", type=int, default=100_000)
+
+    startup_parser = sub.add_parser("startup", help="cold load: Parquet+prepare vs mmap snapshot")
+    startup_parser.add_argument("--rows", type=int, default=5_000)
+    startup_parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+
+    duck_parser = sub.add_parser("duckdb", help="duckdb vs pandas filters/groupbys")
+    duck_parser.add_argument("--rows", type=int, default=100_000)
+
+    polars_parser = sub.add_parser(
+        "polars", help="polars vs pandas filters/groupbys and lazy scans"
+    )
+    polars_parser.add_argument("--rows", type=int, default=100_000)
+
+    dates_parser = sub.add_parser(
+        "dates", help="date-window filters on unsorted vs date-sorted tables"
+    )
+    dates_parser.add_argument("--rows", type=int, default=1_000_000)
+
+    sync_parser = sub.add_parser("sync", help="GCS sync against a local directory-backed bucket")
+    sync_parser.add_argument("--rows", type=int, default=100_000)
+
+    filters_parser = sub.add_parser(
+        "filters", help="rows/s per filter type: FilterPlan vs slicing"
+    )
+    filters_parser.add_argument("--rows", type=int, default=1_000_000)
+
+    filtercache_parser = sub.add_parser(
+        "filtercache", help="shared filter result cache vs FilterPlan"
+    )
+    filtercache_parser.add_argument("--rows", type=int, default=1_000_000)
+    filtercache_parser.add_argument("--sessions", type=int, default=300)
+    filtercache_parser.add_argument("--budget-mb", type=float, default=32)
+
+    facets_parser = sub.add_parser(
+        "facets", help="cascading option lists: table scan vs facet index"
+    )
+    facets_parser.add_argument("--rows", type=int, default=1_000_000)
+
+    labs_parser = sub.add_parser(
+        "labs", help="AI Labs filters: hand-rolled vs declarative FilterPlan"
+    )
+    labs_parser.add_argument("--rows", type=int, default=100_000)
+
+    importtime_parser = sub.add_parser("importtime", help="import cost of each page module")
+    importtime_parser.add_argument("--pages", nargs="*", help="page keys (default: every page)")
+    importtime_parser.add_argument(
+        "--budget-ms", type=float, help="fail when a page imports slower"
+    )
+    importtime_parser.add_argument("--top", type=int, default=5, help="heaviest packages to list")
+
+    args = parser.parse_args()
+    if args.bench == "copies":
+        loading.bench_copies(args.rows)
+    elif args.bench == "nulls":
+        loading.bench_nulls(args.rows)
+    elif args.bench == "startup":
+        loading.bench_startup(args.rows, args.scales)
+    elif args.bench == "duckdb":
+        backends.bench_duckdb(args.rows)
+    elif args.bench == "polars":
+        backends.bench_polars(args.rows)
+    elif args.bench == "dates":
+        dates.bench_dates(args.rows)
+    elif args.bench == "sync":
+        loading.bench_sync(args.rows)
+    elif args.bench == "filters":
+        filters.bench_filters(args.rows)
+    elif args.bench == "filtercache":
+        filters.bench_filtercache(args.rows, args.sessions, args.budget_mb)
+    elif args.bench == "facets":
+        facets.bench_facets(args.rows)
+    elif args.bench == "labs":
+        filters.bench_labs(args.rows)
+    elif args.bench == "importtime":
+        if not importtime.bench_importtime(args.pages, args.budget_ms, args.top):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Query backend benchmarks: DuckDB and Polars against pandas.
+"""
+
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import prepared_table
+from utils.duckdb_backend import filter_frame, group_aggregate
+from utils.polars_engine import lazy_frame, predicate_expr, to_pandas
+from utils.snapshot import write_snapshot
+
+
+# Typical page filter and groupby on tbl_nerdalytics, shared by the backend benchmarks
+BENCH_PREDICATES = [
+    ("channel_title", "in", ["Channel 1", "Channel 3", "Channel 5"]),
+    ("published_at", ">=", pd.Timestamp("2022-01-01")),
+    ("published_at", "<", pd.Timestamp("2024-01-01")),
+    ("video_type", "==", "Shorts"),
+    ("view_count", "between", (1_000, 4_000_000)),
+]
+BENCH_GROUP_BY = ["channel_title", "video_type"]
+BENCH_AGGREGATIONS = {
+    "views": ("view_count", "sum"),
+    "videos": ("video_id", "nunique"),
+    "avg_likes": ("like_count", "mean"),
+}
+
+
+def _time_backends(df, backends):
+    """Time BENCH_PREDICATES and the BENCH_GROUP_BY aggregation on each backend."""
+    for backend in backends:
+        start = time.perf_counter()
+        filtered = filter_frame(df, BENCH_PREDICATES, backend)
+        filter_s = time.perf_counter() - start
+        start = time.perf_counter()
+        group_aggregate(df, BENCH_GROUP_BY, BENCH_AGGREGATIONS, backend)
+        group_s = time.perf_counter() - start
+        print(
+            f"  {backend:<8} filter {filter_s * 1000:>8,.1f} ms ({len(filtered):,} rows)"
+            f"  groupby {group_s * 1000:>8,.1f} ms"
+        )
+
+
+def bench_duckdb(rows):
+    """
+    Time a typical filter and groupby on the DuckDB backend and on pandas (parity with
+    pandas is tested in tests/test_duckdb_backend.py).
+    """
+    df = prepared_table("tbl_nerdalytics", rows)
+    print(f"tbl_nerdalytics synthetic: {rows:,} rows")
+    _time_backends(df, ["pandas", "duckdb"])
+
+
+def bench_polars(rows):
+    """
+    Time a typical filter and groupby on the Polars engine and on pandas, and the lazy path
+    (Arrow snapshot scanned by Polars, filtered, converted back to pandas). Parity with pandas
+    is tested in tests/test_polars_engine.py.
+    """
+    df = prepared_table("tbl_nerdalytics", rows)
+    print(f"tbl_nerdalytics synthetic: {rows:,} rows")
+    _time_backends(df, ["pandas", "polars"])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_snapshot(df, tmp, "tbl_nerdalytics", "bench")
+        predicates = BENCH_PREDICATES[1:3]
+        for label, source in [("snapshot", path), ("pandas table", None)]:
+            start = time.perf_counter()
+            result = to_pandas(lazy_frame(df, snapshot=source).filter(predicate_expr(predicates)))
+            elapsed = time.perf_counter() - start
+            print(f"  lazy {label:<13} {elapsed * 1000:>8,.1f} ms ({len(result):,} rows)")
@@ -0,0 +1,70 @@
+"""
+Date-window filter benchmarks: date layout, timestamp index and Parquet row groups.
+"""
+
+import datetime
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import prepared_table
+from utils.date_layout import (
+    date_range_rows,
+    read_date_range,
+    sort_by_date,
+    write_sorted_parquet,
+)
+from utils.row_index import build_table_indexes, date_mask, index_bytes
+
+
+def dt_date_rows(frame, column, start, end):
+    """Reference: the previous FilterManager date_range path (per-row .dt.date comparison)."""
+    frame = frame.dropna(subset=[column])
+    dates = frame[column].dt.date
+    return frame[(dates >= start) & (dates <= end)]
+
+
+def bench_dates(rows):
+    """
+    Date-window filters: per-row .dt.date comparison vs date_range_rows on an unsorted and a
+    date-sorted table, date_mask on the timestamp index of the unsorted table, and Parquet
+    row groups skipped by read_date_range (same rows: tests/test_date_layout.py).
+    """
+    df = prepared_table("tbl_nerdalytics", rows)
+    df.loc[df.sample(frac=0.01, random_state=0).index, "published_at"] = pd.NaT
+    sorted_df = sort_by_date(df, "published_at")
+    start, end = datetime.date(2024, 1, 1), datetime.date(2024, 12, 31)
+
+    begin = time.perf_counter()
+    build_table_indexes(("bench_dates", None, 0), df)
+    index_ms = (time.perf_counter() - begin) * 1000
+    index_mb = index_bytes(("bench_dates", None, 0)) / 1e6
+    selected = len(dt_date_rows(df, "published_at", start, end))
+    print(f"tbl_nerdalytics synthetic: {rows:,} rows, {selected:,} in {start}..{end}")
+    print(f"  timestamp index built in {index_ms:,.1f} ms, {index_mb:,.1f} MB")
+
+    for label, func, frame in [
+        (".dt.date", lambda f: dt_date_rows(f, "published_at", start, end), df),
+        ("int64 mask", lambda f: date_range_rows(f, "published_at", start, end), df),
+        ("sorted slice", lambda f: date_range_rows(f, "published_at", start, end), sorted_df),
+        ("ts index", lambda f: f[date_mask(f["published_at"], start, end)], df),
+    ]:
+        begin = time.perf_counter()
+        func(frame)
+        print(f"  {label:<13} {(time.perf_counter() - begin) * 1000:>9,.2f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tbl_nerdalytics.parquet")
+        write_sorted_parquet(df, path, "published_at")
+        begin = time.perf_counter()
+        window = read_date_range(path, "published_at", start, end)
+        read_s = time.perf_counter() - begin
+        begin = time.perf_counter()
+        pd.read_parquet(path)
+        full_s = time.perf_counter() - begin
+        print(
+            f"  parquet       full read {full_s * 1000:,.1f} ms, "
+            f"read_date_range {read_s * 1000:,.1f} ms ({len(window):,} rows)"
+        )
@@ -0,0 +1,68 @@
+"""
+Facet benchmarks: cascading option lists and the facet catalogue.
+"""
+
+import time
+
+from benchmarks.synthetic import prepared_table
+from utils.facets import build_table_facets, child_counts, child_options, facet_bytes
+from utils.filter_manager_v2 import create_filter_config
+
+
+def scanned_children(df, parent, child, selected, counts=False):
+    """Reference: children of the selected parents from a scan of the table (no facet index)."""
+    selected_rows = df[df[parent].isin(selected)][child]
+    if counts:
+        return {k: int(v) for k, v in selected_rows.value_counts().items() if v > 0}
+    return selected_rows.dropna().unique().tolist()
+
+
+def bench_facets(rows, repeat=20):
+    """
+    Cascading option lists (playlists of the selected channels) and facet counts: a scan of
+    the filtered table per rerun vs the facet index built at load (utils/facets.py), and
+    create_filter_config with the facet catalogue (same lists: tests/test_facets.py).
+    """
+    df = prepared_table("tbl_playlist_full_dedup", rows)
+    start = time.perf_counter()
+    build_table_facets(("bench_facets", None, 0), df)
+    build_ms = (time.perf_counter() - start) * 1000
+    channels = df["playlist_channel_title"].dropna().unique().tolist()
+    print(
+        f"tbl_playlist_full_dedup synthetic: {len(df):,} rows, facets built in "
+        f"{build_ms:,.1f} ms, {facet_bytes(('bench_facets', None, 0)) / 2**20:,.2f} MB"
+    )
+    print(f"  {'lookup':<28} {'scan ms':>9} {'facets ms':>10} {'speedup':>8}")
+    playlist = df["playlist_title"].iloc[:1].tolist()
+    for label, parent, child, selected, counts in [
+        ("playlists of 1 channel", "playlist_channel_title", "playlist_title", channels[:1], False),
+        ("playlists of 5 channels", "playlist_channel_title", "playlist_title", channels[:5], False),
+        ("videos of 1 playlist", "playlist_title", "video_id", playlist, False),
+        ("playlist counts, 5 channels", "playlist_channel_title", "playlist_title", channels[:5], True),
+    ]:
+        def scan():
+            return scanned_children(df, parent, child, selected, counts)
+
+        def lookup():
+            if counts:
+                return child_counts(df, parent, child, selected)
+            return child_options(df, parent, child, selected)
+
+        timings = []
+        for func in (scan, lookup):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                func()
+            timings.append((time.perf_counter() - start) * 1000 / repeat)
+        print(f"  {label:<28} {timings[0]:>9,.2f} {timings[1]:>10,.3f} {timings[0] / timings[1]:>7,.0f}x")
+
+    # Facet catalogue: options computed on the first rerun of a table version only
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        create_filter_config("tbl_playlist_full_dedup", df)
+        timings.append((time.perf_counter() - start) * 1000)
+    print(
+        f"  create_filter_config: first call {timings[0]:,.2f} ms, "
+        f"later calls {min(timings[1:]):,.3f} ms (facet catalogue)"
+    )
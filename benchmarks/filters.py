@@ -0,0 +1,265 @@
+"""
+Filter benchmarks: FilterPlan against per-filter slicing, the filter result cache and the
+AI Labs filters. The reference implementations are also used by the tests.
+"""
+
+import datetime
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import prepared_table
+from utils.date_layout import sort_by_date
+from utils.dtype_optimizer import drop_unused_categories
+from utils.facets import build_table_facets
+from utils.filter_cache import FilterResultCache, filter_cache_key
+from utils.filter_manager_v2 import create_filter_config
+from utils.filter_plan import FilterPlan
+from utils.row_index import build_table_indexes, index_bytes
+
+
+# FilterManager configuration of tbl_nerdalytics (create_filter_config) plus a slider
+BENCH_FILTER_CONFIG = {
+    "channel_title": {"type": "multiselect"},
+    "video_type": {"type": "segmented"},
+    "default_audio_language": {"type": "multiselect"},
+    "published_at": {"type": "date_range"},
+    "caption": {"type": "boolean"},
+    "view_count": {"type": "slider"},
+}
+BENCH_FILTER_STATES = {
+    "multiselect": {"channel_title": ["Channel 1", "Channel 3", "Channel 5"]},
+    "segmented": {"video_type": "Shorts"},
+    "boolean": {"caption": True},
+    "slider": {"view_count": (1_000, 4_000_000)},
+    "date_range": {"published_at": (datetime.date(2022, 1, 1), datetime.date(2023, 12, 31))},
+}
+BENCH_FILTER_STATES["all"] = {
+    col: value for state in BENCH_FILTER_STATES.values() for col, value in state.items()
+}
+
+
+def sliced_filters(df, filter_config, filters):
+    """Reference: the previous apply_filters (full copy, one slice per filter, .dt.date)."""
+    df_filtered = df.copy()
+    for col_name, value in filters.items():
+        filter_type = filter_config[col_name]["type"]
+        if filter_type == "multiselect":
+            df_filtered = df_filtered[df_filtered[col_name].isin(value)]
+        elif filter_type == "slider":
+            df_filtered = df_filtered[
+                (df_filtered[col_name] >= value[0]) & (df_filtered[col_name] <= value[1])
+            ]
+        elif filter_type == "date_range":
+            df_filtered[col_name] = pd.to_datetime(df_filtered[col_name], errors="coerce")
+            dates = df_filtered[col_name].dt.date
+            df_filtered = df_filtered[(dates >= value[0]) & (dates <= value[1])]
+        else:
+            df_filtered = df_filtered[df_filtered[col_name] == value]
+    return drop_unused_categories(df_filtered)
+
+
+def bench_filters(rows, repeat=3):
+    """
+    Rows per second of each FilterManager filter type: compiled FilterPlan (masks over the
+    base frame, one take), without and with the row-id indexes built at load
+    (utils/row_index.py), against per-filter slicing of a copy, on an unsorted and a
+    date-sorted tbl_nerdalytics (same rows: tests/test_filter_plan.py).
+    """
+    unsorted = prepared_table("tbl_nerdalytics", rows)
+    layouts = {
+        "unsorted": unsorted,
+        "date-sorted": sort_by_date(unsorted, "published_at"),
+    }
+
+    def best_of(func):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    print(f"tbl_nerdalytics synthetic: {rows:,} rows, best of {repeat}, million rows/s")
+    print(
+        f"  {'layout':<12} {'filter':<12} {'sliced':>9} {'plan':>9} {'indexed':>9}"
+        f" {'speedup':>8}  rows kept"
+    )
+    for layout, df in layouts.items():
+        timings = {}
+        for name, filters in BENCH_FILTER_STATES.items():
+            plan = FilterPlan.compile(BENCH_FILTER_CONFIG, filters, df.columns)
+            sliced_s, _ = best_of(lambda: sliced_filters(df, BENCH_FILTER_CONFIG, filters))
+            plan_s, _ = best_of(lambda: plan.apply(df))
+            timings[name] = (sliced_s, plan_s)
+        index_start = time.perf_counter()
+        build_table_indexes(("bench", layout), df)
+        index_s = time.perf_counter() - index_start
+        for name, filters in BENCH_FILTER_STATES.items():
+            sliced_s, plan_s = timings[name]
+            plan = FilterPlan.compile(BENCH_FILTER_CONFIG, filters, df.columns)
+            indexed_s, result = best_of(lambda: plan.apply(df))
+            print(
+                f"  {layout:<12} {name:<12} {rows / sliced_s / 1e6:>9,.1f} "
+                f"{rows / plan_s / 1e6:>9,.1f} {rows / indexed_s / 1e6:>9,.1f} "
+                f"{sliced_s / indexed_s:>7,.1f}x  {len(result):,}"
+            )
+        print(
+            f"  {layout:<12} row indexes built in {index_s * 1000:,.1f} ms, "
+            f"{index_bytes(('bench', layout)) / 2**20:,.1f} MB"
+        )
+    plan = FilterPlan.compile(
+        BENCH_FILTER_CONFIG, BENCH_FILTER_STATES["all"], layouts["date-sorted"].columns
+    )
+    print(plan.explain(layouts["date-sorted"]))
+
+
+def bench_filtercache(rows, sessions=300, budget_mb=32):
+    """
+    Reruns of many sessions picking popular filter states (Zipf-like): FilterPlan.apply on
+    every rerun vs the process-wide filter cache (utils/filter_cache.py), which stores row
+    positions per (table version, canonical filter state). Cached rows are tested in
+    tests/test_filter_cache.py.
+    """
+    df = prepared_table("tbl_nerdalytics", rows)
+    build_table_indexes(("bench_filtercache", None, 0), df)
+    channels = sorted(df["channel_title"].dropna().unique())
+    windows = [
+        (datetime.date(year, 1, 1), datetime.date(year + span, 12, 31))
+        for year in (2020, 2021, 2022, 2023)
+        for span in (0, 1)
+    ]
+    states = []
+    for i, window in enumerate(windows):
+        for j in range(len(channels)):
+            selected = [channels[j], channels[(j + i + 1) % len(channels)]]
+            states.append({"published_at": window, "channel_title": selected})
+    rng = np.random.default_rng(0)
+    weights = 1 / np.arange(1, len(states) + 1)
+    picks = rng.choice(len(states), size=sessions, p=weights / weights.sum())
+
+    cache = FilterResultCache(int(budget_mb * 2**20))
+    load = ("tbl_nerdalytics", None, "bench")
+    plain_s = select_s = cached_s = cached_select_s = 0.0
+    for pick in picks:
+        start = time.perf_counter()
+        plan = FilterPlan.compile(BENCH_FILTER_CONFIG, states[pick], df.columns)
+        selected = plan.rows(df)
+        select_s += time.perf_counter() - start
+        plan.apply(df, rows=selected)
+        plain_s += time.perf_counter() - start
+    for pick in picks:
+        start = time.perf_counter()
+        # Sessions list their selection in any order: same canonical state
+        filters = {**states[pick], "channel_title": states[pick]["channel_title"][::-1]}
+        plan = FilterPlan.compile(BENCH_FILTER_CONFIG, filters, df.columns)
+        key = filter_cache_key(load, df, filters, ["channel_title"], BENCH_FILTER_CONFIG)
+        selected = cache.rows(key, lambda: plan.rows(df))
+        cached_select_s += time.perf_counter() - start
+        plan.apply(df, rows=selected)
+        cached_s += time.perf_counter() - start
+
+    stats = cache.stats()
+    print(
+        f"tbl_nerdalytics synthetic: {rows:,} rows, {sessions} reruns over "
+        f"{len(set(picks.tolist()))} distinct filter states"
+    )
+    print(f"  {'':<22} {'rows ms':>9} {'total ms':>9}  (per rerun, total includes the take)")
+    for label, select, total in [
+        ("FilterPlan every rerun", select_s, plain_s),
+        ("filter cache", cached_select_s, cached_s),
+    ]:
+        print(f"  {label:<22} {select * 1000 / sessions:>9,.2f} {total * 1000 / sessions:>9,.2f}")
+    print(
+        f"  hits {stats['hits']}, misses {stats['misses']}, hit rate {stats['hit_rate']:.0%}, "
+        f"{stats['entries']} entries, {stats['mb']:,.2f} MB of {stats['max_mb']:,.0f} MB, "
+        f"{stats['evictions']} evictions"
+    )
+
+
+def hand_rolled_labs(df, filters):
+    """Reference: the previous AI Labs filtering (plan, chained str.contains, top-N of a sort)."""
+    plan = FilterPlan(
+        [
+            ("published_at", "date_range", "date_range", filters["published_at"]),
+            ("video_type", "multiselect", "in", filters["video_type"]),
+            ("duration_formatted_seconds", "slider", "between", filters["duration_formatted_seconds"]),
+            ("default_audio_language", "multiselect", "in", filters["default_audio_language"]),
+            ("channel_title", "multiselect", "in", filters["channel_title"]),
+        ],
+        custom=[],
+        warnings=[],
+    )
+    filtered = plan.apply(df)
+    for col_name in ["title", "description", "video_id"]:
+        if filters[col_name]:
+            filtered = filtered[
+                filtered[col_name].str.contains(filters[col_name], case=False, regex=False, na=False)
+            ]
+    latest = (
+        filtered.sort_values("slope_date", kind="stable")
+        .groupby("video_id", as_index=False, observed=True)
+        .last()
+    )
+    top_ids = latest.nlargest(filters["view_count_slope"], "view_count_slope")["video_id"]
+    return filtered, filtered[filtered["video_id"].isin(top_ids)]
+
+
+def labs_filter_states(df, config):
+    """AI Labs filter states of the benchmark: the defaults, title searches, fewer channels."""
+    defaults = {col_name: entry["default"] for col_name, entry in config.items()}
+    duration = df["duration_formatted_seconds"]
+    defaults["duration_formatted_seconds"] = (int(duration.min()), int(duration.max()))
+    titles = FilterPlan.compile(config, defaults, df.columns).apply(df)["title"].dropna()
+    word = str(titles.iloc[len(titles) // 2]).split()[-1][:4] if len(titles) else "a"
+    return {
+        "defaults": defaults,
+        "title search": {**defaults, "title": word.upper()},
+        "title + top 3": {**defaults, "title": word, "view_count_slope": 3},
+        "2 channels": {**defaults, "channel_title": defaults["channel_title"][:2]},
+    }
+
+
+def declarative_labs(df, config, filters):
+    """AI Labs filtering through FilterManager: (matching rows, rows of the top-N videos)."""
+    plan = FilterPlan.compile(config, filters, df.columns)
+    rows = plan.rows(df, top_n=False)
+    return plan.apply(df, rows=rows), plan.apply(df, rows=plan.select_top_n(df, rows))
+
+
+def bench_labs(rows, repeat=5):
+    """
+    AI Labs filters (date range, multiselects, duration range, text searches, top-N videos):
+    the previous hand-rolled filtering vs the declarative FilterManager configuration
+    (create_filter_config("tbl_slope_full")) compiled into one FilterPlan, on the indexed
+    table (same rows: tests/test_filter_plan.py).
+    """
+    df = sort_by_date(prepared_table("tbl_slope_full", rows), "published_at")
+    build_table_indexes(("bench_labs", None, 0), df)
+    build_table_facets(("bench_labs", None, 0), df)
+    config = create_filter_config("tbl_slope_full", df)
+    states = labs_filter_states(df, config)
+    print(f"tbl_slope_full synthetic: {len(df):,} rows, best of {repeat}")
+    print(f"  {'state':<16} {'hand-rolled ms':>15} {'plan ms':>9} {'speedup':>8}  rows, top-N rows")
+    for name, filters in states.items():
+        timings = []
+        for func in (
+            lambda: hand_rolled_labs(df, filters),
+            lambda: declarative_labs(df, config, filters),
+        ):
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = func()
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings.append((best * 1000, result))
+        (hand_ms, _), (plan_ms, result) = timings
+        print(
+            f"  {name:<16} {hand_ms:>15,.2f} {plan_ms:>9,.2f} {hand_ms / plan_ms:>7,.1f}x"
+            f"  {len(result[0]):,}, {len(result[1]):,}"
+        )
+    plan = FilterPlan.compile(config, states["title + top 3"], df.columns)
+    print(plan.explain(df))
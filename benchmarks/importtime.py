@@ -0,0 +1,87 @@
+"""
+Import cost of the page modules.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+# App root (parent of benchmarks/): page modules import utils.*, modules.*, config.*
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Child process for bench_importtime: shared imports first (main.py has them loaded before
+# any page), then the page module alone, then what the page import left behind
+_IMPORTTIME_CHILD = """
+import sys
+import pandas, streamlit
+sys.stderr.write("--- page import ---\\n")
+__import__(sys.argv[1])  # import statement path: importlib.import_module is not timed
+sys.stderr.write("--- done ---\\n")
+from utils.lazy_imports import loaded_heavy_modules
+dataloader = sys.modules.get("utils.dataloader")
+print(json.dumps({
+    "heavy": loaded_heavy_modules(),
+    "loads_data": bool(dataloader and dataloader.REQUESTED_PROJECTIONS),
+}))
+"""
+
+
+def _page_import_time(module):
+    """(cumulative import ms, {top-level package: self ms}, child report) of one page module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import json" + _IMPORTTIME_CHILD, module],
+        capture_output=True,
+        text=True,
+        cwd=APP_ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    lines = result.stderr.split("--- page import ---")[1].split("--- done ---")[0]
+    total_us = 0
+    packages = {}
+    for line in lines.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[12:].split("|"))
+        if not self_us.isdigit():
+            continue  # header line
+        if name == module:
+            total_us = int(cumulative_us)
+        top = name.split(".")[0]
+        packages[top] = packages.get(top, 0) + int(self_us) / 1000
+    return total_us / 1000, packages, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench_importtime(pages, budget_ms, top):
+    """
+    Import cost of each page module, like `python -X importtime`, in a fresh process per page
+    (streamlit and pandas pre-imported, as in main.py). Also reports heavy modules
+    (utils.lazy_imports.HEAVY_MODULES) and data loads triggered by the import itself.
+
+    Returns:
+        False when a page exceeds budget_ms or loads data at import
+    """
+    from config.pages import PAGE_CONFIG
+
+    ok = True
+    print(f"{'page':<12} {'import ms':>10}  heavy / data at import   top packages (self ms)")
+    for key, (_, _, module) in PAGE_CONFIG.items():
+        if pages and key not in pages:
+            continue
+        total_ms, packages, report = _page_import_time(module)
+        heaviest = sorted(packages.items(), key=lambda item: -item[1])[:top]
+        flags = ", ".join(report["heavy"]) or "-"
+        if report["loads_data"]:
+            flags += " + LOADS DATA"
+            ok = False
+        over = budget_ms is not None and total_ms > budget_ms
+        ok = ok and not over
+        print(
+            f"{key:<12} {total_ms:>10,.1f}{' !' if over else '  '} {flags:<24} "
+            + ", ".join(f"{name} {ms:,.0f}" for name, ms in heaviest)
+        )
+    if budget_ms is not None:
+        print(f"budget {budget_ms:,.0f} ms per page: {'OK' if ok else 'EXCEEDED'}")
+    return ok
@@ -0,0 +1,161 @@
+"""
+Loading benchmarks: copies per rerun, null treatment, cold start and GCS sync.
+"""
+
+import os
+import pickle
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_synthetic_tables
+from utils import dataretriever
+from utils.dataloader import TABLE_REGISTRY, _convert_types, shared_view
+from utils.dtype_optimizer import optimize_dtypes
+from utils.local_gcs import LocalDirectoryClient
+from utils.snapshot import read_snapshot, write_snapshot
+from utils.treat_nulls import NULL_REPRESENTATIONS, treat_nulls
+
+
+def _traced_bytes(func):
+    """Run func and return (result, peak bytes allocated while it ran)."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def bench_copies(rows):
+    """
+    Bytes copied per rerun by get_user_dataframe: previous deep-copy path vs shared views.
+
+    Previous path, cache miss: base.copy() + treat_nulls() + st.cache_data pickling.
+    Previous path, cache hit: st.cache_data unpickles a fresh copy.
+    Shared view: shallow copy-on-write view of the cached table.
+    """
+    base = treat_nulls(make_synthetic_tables(rows)["tbl_nerdalytics"])
+    table_bytes = base.memory_usage(deep=True).sum()
+    pickled = pickle.dumps(base)
+
+    def deep_copy_miss():
+        df = treat_nulls(base.copy())
+        return pickle.dumps(df)
+
+    results = [
+        ("deep copy (cache miss)", deep_copy_miss),
+        ("deep copy (cache hit)", lambda: pickle.loads(pickled)),
+        ("shared view", lambda: shared_view(base)),
+    ]
+    print(f"tbl_nerdalytics synthetic: {rows:,} rows, {table_bytes / 1e6:,.1f} MB in memory")
+    for label, func in results:
+        start = time.perf_counter()
+        _, peak = _traced_bytes(func)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<24} {peak / 1e6:>10,.2f} MB allocated  {elapsed * 1000:>8,.1f} ms")
+
+
+def replaced_nulls(df):
+    """Reference: the previous null treatment (Series.replace of every token, per column)."""
+    for col in df.select_dtypes(include=["object"]).columns:
+        df[col] = df[col].replace(NULL_REPRESENTATIONS, np.nan).infer_objects(copy=False)
+    return df
+
+
+def bench_nulls(rows):
+    """
+    Null-token normalisation: previous Series.replace(list) pass vs the factorize-based pass
+    (same frame: tests/test_treat_nulls.py).
+    """
+    raw = make_synthetic_tables(rows)["tbl_nerdalytics"]
+    print(f"tbl_nerdalytics synthetic: {rows:,} rows")
+    for label, func in [
+        ("replace(list)", lambda: replaced_nulls(raw.copy())),
+        ("factorize + mask", lambda: treat_nulls(raw.copy())),
+    ]:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<24} {elapsed * 1000:>8,.1f} ms")
+
+
+def bench_startup(rows, scales):
+    """
+    Cold load of the largest tables: Parquet read + type conversion + null treatment + dtype
+    optimisation (what a new instance does today) vs memory-mapping the Arrow snapshot.
+    """
+    tables = ["tbl_nerdalytics", "tbl_slope_full"]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in scales:
+            raw = make_synthetic_tables(rows * scale)
+            print(f"scale {scale}x ({rows * scale:,} videos)")
+            for name in tables:
+                parquet_path = os.path.join(tmp_dir, f"{name}.parquet")
+                raw[name].to_parquet(parquet_path, index=False)
+                date_columns = TABLE_REGISTRY[name].get("date_columns", [])
+
+                def prepare():
+                    df = pd.read_parquet(parquet_path)
+                    df = _convert_types(df, date_columns)
+                    return optimize_dtypes(treat_nulls(df))
+
+                start = time.perf_counter()
+                df = prepare()
+                parquet_s = time.perf_counter() - start
+
+                path = write_snapshot(df, tmp_dir, name, f"scale{scale}")
+                start = time.perf_counter()
+                snap, _ = read_snapshot(path)
+                snapshot_s = time.perf_counter() - start
+
+                print(
+                    f"  {name:<18} {len(df):>10,} rows  parquet+prepare {parquet_s * 1000:>9,.1f} ms"
+                    f"  snapshot mmap {snapshot_s * 1000:>9,.1f} ms"
+                    f"  ({parquet_s / snapshot_s:,.1f}x)"
+                )
+                del df, snap
+
+
+def bench_sync(rows):
+    """
+    GCS sync against a local directory-backed bucket (utils/local_gcs.py): cold sync, warm
+    sync (everything skipped), one changed object, and a lost manifest (checksum path).
+    The sync behaviour itself is tested in tests/test_dataretriever.py.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        bucket_dir = os.path.join(tmp, "gcs", "bucket")
+        prefix = "data/duckdb_mirror/"
+        os.makedirs(os.path.join(bucket_dir, prefix))
+        names = []
+        for name, df in make_synthetic_tables(rows).items():
+            names.append(f"{prefix}{name}.parquet")
+            df.to_parquet(os.path.join(bucket_dir, names[-1]), index=False)
+        local_dir = os.path.join(tmp, "local")
+        bucket = LocalDirectoryClient(os.path.join(tmp, "gcs")).bucket("bucket")
+        objects = [(name, os.path.join(local_dir, os.path.basename(name))) for name in names]
+
+        def run(label):
+            start = time.perf_counter()
+            counts = dataretriever.sync_objects(bucket, objects, local_dir)
+            elapsed = time.perf_counter() - start
+            print(
+                f"  {label:<16} {elapsed * 1000:>8,.1f} ms  "
+                f"{counts['downloaded']} downloaded, {counts['skipped']} skipped"
+            )
+
+        print(f"{len(names)} synthetic objects ({rows:,} videos)")
+        run("cold")
+        run("warm")
+        # New generation of one object
+        changed = os.path.join(bucket_dir, names[0])
+        pd.read_parquet(changed).head(10).to_parquet(changed, index=False)
+        run("one changed")
+        # Manifest lost: files are compared by checksum instead of re-downloaded
+        os.remove(os.path.join(local_dir, dataretriever.MANIFEST_FILE))
+        run("no manifest")
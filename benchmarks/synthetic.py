@@ -0,0 +1,120 @@
+"""
+Synthetic versions of the production tables, shared by the benchmarks and the tests.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.dataloader import TABLE_REGISTRY, _convert_types
+from utils.dtype_optimizer import optimize_dtypes
+from utils.treat_nulls import treat_nulls
+
+
+def make_synthetic_tables(rows=10_000, seed=0):
+    """
+    Build synthetic versions of the production tables.
+
+    Args:
+        rows: Number of videos in tbl_nerdalytics (other tables scale from it)
+        seed: Random seed
+
+    Returns:
+        Dictionary of table name -> raw DataFrame, as read from Parquet (before dataloader cleaning)
+    """
+    rng = np.random.default_rng(seed)
+    channels = [f"Channel {i}" for i in range(12)]
+    video_ids = np.array([f"vid{i:08d}" for i in range(rows)], dtype=object)
+    published_at = pd.Timestamp("2021-01-01") + pd.to_timedelta(
+        rng.integers(0, 1500, rows), unit="D"
+    )
+    nerdalytics = pd.DataFrame(
+        {
+            "video_id": video_ids,
+            "channel_id": rng.choice([f"UC{i:04d}" for i in range(12)], rows),
+            "channel_title": rng.choice(channels, rows),
+            "title": [f"Video title number {i}" for i in range(rows)],
+            "description": rng.choice(
+                ["Long description text " * 30, "Short description", "null", "", "N/A"],
+                rows,
+            ),
+            "tags": rng.choice(["tag a,tag b,tag c", "tag d,tag e", "null", None], rows),
+            "published_at": published_at,
+            "view_count": rng.integers(0, 5_000_000, rows),
+            "like_count": rng.integers(0, 100_000, rows),
+            "comment_count": rng.integers(0, 10_000, rows),
+            "video_type": rng.choice(["Regular", "Shorts"], rows),
+            "default_audio_language": rng.choice(["pt-BR", "en", "es", "null"], rows),
+            "category_id": rng.choice([22, 24, 26, 27], rows),
+            "live_content": rng.choice(["none", "live", "upcoming"], rows),
+            "duration_formatted_seconds": rng.integers(5, 7200, rows),
+            "caption": rng.choice([True, False], rows),
+            "age_in_days": rng.integers(1, 1500, rows),
+            "ss_adult": rng.integers(0, 6, rows).astype(float),
+            "ss_spoof": rng.integers(0, 6, rows).astype(float),
+            "ss_medical": rng.integers(0, 6, rows).astype(float),
+            "ss_violence": rng.integers(0, 6, rows).astype(float),
+            "ss_racy": rng.integers(0, 6, rows).astype(float),
+        }
+    )
+
+    slope_days = pd.date_range("2025-05-01", periods=30)
+    slope_rows = nerdalytics.sample(min(rows, max(rows // 10, 1)), random_state=seed)
+    slope_parts = []
+    for day in slope_days:
+        part = slope_rows.copy()
+        part["slope_date"] = day
+        part["slope_timestamp"] = day + pd.Timedelta(hours=3)
+        for col in ["view_count_slope", "like_count_slope", "comment_count_slope"]:
+            part[col] = rng.integers(0, 50_000, len(part))
+        for col in ["linear_view_count_speed", "slope_view_count_speed"]:
+            part[col] = rng.random(len(part)) * 1000
+        slope_parts.append(part)
+    slope_full = pd.concat(slope_parts, ignore_index=True)
+
+    playlist_rows = rows * 2
+    playlist_ids = rng.integers(0, 300, playlist_rows)
+    video_added_at = pd.Timestamp("2021-01-01") + pd.to_timedelta(
+        rng.integers(0, 1500, playlist_rows), unit="D"
+    )
+    playlist = pd.DataFrame(
+        {
+            "playlist_id": [f"PL{i:05d}" for i in playlist_ids],
+            "playlist_title": [f"Playlist {i}" for i in playlist_ids],
+            "playlist_channel_title": [channels[i % len(channels)] for i in playlist_ids],
+            "video_id": rng.choice(video_ids, playlist_rows),
+            "video_title": "Video title",
+            "video_description": "Video description",
+            "position": rng.integers(0, 200, playlist_rows),
+            "video_added_at": video_added_at,
+            "playlist_item_published_at": video_added_at,
+            "playlist_published_at": pd.Timestamp("2020-06-01"),
+        }
+    )
+
+    analytics_filters = pd.DataFrame(
+        {
+            "video_id": rng.choice(video_ids, min(rows, 300)),
+            "filter_name": rng.choice(["top", "trending"], min(rows, 300)),
+        }
+    )
+    channels_df = pd.DataFrame(
+        {
+            "channel_id": [f"UC{i:04d}" for i in range(len(channels))],
+            "channel_title": channels,
+            "view_count": rng.integers(0, 10**9, len(channels)),
+        }
+    )
+    return {
+        "tbl_nerdalytics": nerdalytics,
+        "tbl_slope_full": slope_full,
+        "tbl_playlist_full_dedup": playlist,
+        "tbl_analytics_filters": analytics_filters,
+        "tbl_channels": channels_df,
+    }
+
+
+def prepared_table(name, rows):
+    """Synthetic table after the dataloader preparation steps (types, nulls, dtypes)."""
+    df = make_synthetic_tables(rows)[name]
+    df = _convert_types(df, TABLE_REGISTRY[name].get("date_columns", []))
+    return optimize_dtypes(treat_nulls(df))
@@ -21,3 +21,23 @@ PAGE_CONFIG = {
     # "feedback": ("Feedback", "📝", "modules.feedback"),
 }
 # updated at 2025-05-09
+
+# Data backend per page for filters and aggregations: "pandas", "duckdb" or "polars".
+# Pages not listed use DATA_ENGINE (utils/config.py). A backend whose package is not
+# installed falls back to pandas (see utils/duckdb_backend.py).
+PAGE_BACKENDS = {
+    "metadata": "duckdb",
+    "analytics2": "duckdb",
+}
+
+# Filter mode per page: "live" (each widget change reruns and re-filters) or "apply"
+# (filters staged in a form, applied together with one button). Pages not listed are
+# live (see utils/filter_forms.py).
+PAGE_FILTER_MODES = {
+    "ai_labs": "apply",
+    "analytics2": "apply",
+}
+
+# Pages that load no data: rendered right away while warm start (utils/warm_start.py) is
+# still downloading and loading; every other page waits behind its progress placeholder.
+DATA_FREE_PAGES = ["home", "thumbnails"]
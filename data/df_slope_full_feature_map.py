@@ -3,7 +3,6 @@
 import os
 import sys
 
-import numpy as np
 import pandas as pd
 
 # ─────────────────────────────────────────────────
@@ -16,9 +15,14 @@ if ROOT not in sys.path:
 
 import streamlit as st
 
-from utils.dataloader import load_data
+from utils.dataloader import get_null_report, load_data
+
+
+
+def get_df_slope_full():
+    """The shared tbl_slope_full table (cached by load_data; loaded on first use, not on import)."""
+    return load_data("tbl_slope_full")
 
-df_slope_full = load_data("tbl_slope_full")
 
 DATASET_FEATURE_MAP = {
     "df_slope_full": {
@@ -296,88 +300,44 @@ DATASET_FEATURE_MAP = {
 
 
 def diagnose_nulls(df, apply_to_global=False):
-    """Diagnose and treat null values in a DataFrame.
+    """Diagnose null values in a DataFrame.
+
+    Null tokens ("null", "N/A", "", ...) are already converted to NaN by the dataloader
+    at load time; this shows the recorded conversion counts instead of recomputing them.
 
     Args:
-        df: The DataFrame to diagnose and treat
-        apply_to_global: If True, apply changes to the global df_slope_full variable
+        df: The DataFrame to diagnose
+        apply_to_global: If True, diagnose the shared df_slope_full table instead
 
     Returns:
-        The treated DataFrame
+        The diagnosed DataFrame
     """
-    global df_slope_full
-
-    # BEFORE: Diagnose nulls before treatment
-    st.subheader("BEFORE Treatment: Missing Values Diagnosis")
-    null_counts_before = df.isnull().sum()
-    null_percentages_before = (null_counts_before / len(df)) * 100
-    null_info_before = pd.DataFrame(
-        {"Null Count": null_counts_before, "Null Percentage": null_percentages_before}
-    )
-    # Filter to only show columns with null values
-    null_info_before = null_info_before[null_info_before["Null Count"] > 0]
-    if not null_info_before.empty:
-        st.write("Columns with missing values (before treatment):")
-        st.code(null_info_before)
+    target_df = get_df_slope_full() if apply_to_global else df
+
+    st.subheader("Treatment Applied at Load")
+    null_report = get_null_report("tbl_slope_full")
+    null_report = null_report[null_report["Tokens Converted"] > 0]
+    if not null_report.empty:
+        for col, count in null_report.itertuples(index=False):
+            st.write(
+                f"Column '{col}': Converted {count} string null representations to NaN"
+            )
     else:
-        st.write("No missing values  found in the dataset before treatment.")
-
-    # Treatment: Replace various null representations with np.nan for columns with missing values
-    null_representations = [
-        "null",
-        "N/A",
-        "None",
-        "na",
-        "n/a",
-        "none",
-        "NULL",
-        "NA",
-        "",
-    ]
+        st.write("No string null representations were found at load.")
 
-    # Only process columns that have missing values
-    columns_with_nulls = null_info_before.index.tolist()
-
-    # Determine which DataFrame to modify
-    target_df = df_slope_full if apply_to_global else df
-
-    if columns_with_nulls:
-        st.subheader("Treatment Applied")
-        for col in columns_with_nulls:
-            if col in target_df.columns:
-                # Check if column is of object type (string) before replacing
-                if target_df[col].dtype == "object":
-                    # Count before replacement
-                    before_count = target_df[col].isnull().sum()
-
-                    # Replace various null representations with np.nan
-                    target_df[col] = target_df[col].replace(
-                        null_representations, np.nan
-                    )
-
-                    # Count after replacement
-                    after_count = target_df[col].isnull().sum()
-                    new_nulls = after_count - before_count
-
-                    if new_nulls > 0:
-                        st.write(
-                            f"Column '{col}': Converted {new_nulls} string null representations to NaN"
-                        )
-
-    # AFTER: Diagnose nulls after treatment
-    st.subheader("AFTER Treatment: Missing Values Diagnosis")
-    null_counts_after = target_df.isnull().sum()
-    null_percentages_after = (null_counts_after / len(target_df)) * 100
-    null_info_after = pd.DataFrame(
-        {"Null Count": null_counts_after, "Null Percentage": null_percentages_after}
+    st.subheader("Missing Values Diagnosis")
+    null_counts = target_df.isnull().sum()
+    null_percentages = (null_counts / len(target_df)) * 100
+    null_info = pd.DataFrame(
+        {"Null Count": null_counts, "Null Percentage": null_percentages}
     )
     # Filter to only show columns with null values
-    null_info_after = null_info_after[null_info_after["Null Count"] > 0]
-    if not null_info_after.empty:
-        st.write("Columns with missing values (after treatment):")
-        st.code(null_info_after)
+    null_info = null_info[null_info["Null Count"] > 0]
+    if not null_info.empty:
+        st.write("Columns with missing values:")
+        st.code(null_info)
     else:
-        st.write("No missing values found in the dataset after treatment.")
+        st.write("No missing values found in the dataset.")
 
     return target_df
 
@@ -385,6 +345,7 @@ def diagnose_nulls(df, apply_to_global=False):
 def render():
     import os
 
+    df_slope_full = get_df_slope_full()
     st.header("df_slope_full_feature_map")
 
     st.write("Running from", os.path.abspath(os.getcwd()))
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """
+# 2026-10-16: Background pre-warming of the pages after the first request (utils/prewarm.py)
+# 2026-10-16: Pages needing data wait behind the warm-start progress (utils/warm_start.py)
+# 2026-10-16: Starts the background data refresher (utils/data_refresher.py) once per process
 # 2024-04-22: Added authentication requirement before rendering content
 # 2024-04-19: Added configuration to disable debug info in sidebar
 # 2024-04-19: Updated navigation options to use "Creators Engine IA" instead of "Computer Vision AI"
@@ -26,10 +29,13 @@ from utils.auth import SHOW_DEBUG_INFO, require_auth
 # =================================================================
 import streamlit as st
 import importlib
-from config.pages import PAGE_CONFIG
+from config.pages import DATA_FREE_PAGES, PAGE_CONFIG
 from components.navigation import render_navigation
 from components.sidebar import render_sidebar
 from utils.google_tag_manager import inject_gtm
+from utils.data_refresher import get_refresher
+from utils.prewarm import start_prewarm
+from utils.warm_start import render_progress_until_ready
 
 # =================================================================
 # CONFIGURAÇÃO DA PÁGINA
@@ -60,6 +66,12 @@ def main():
     # Inject GTM script
     # inject_gtm() - FAILED HERE.
 
+    # Inicia (uma vez por processo) a atualização de dados em segundo plano
+    get_refresher()
+
+    # Pré-aquece (uma vez por processo) os imports e os dados de todas as páginas
+    start_prewarm()
+
     # Requer autenticação antes de prosseguir
     user_email = require_auth()
 
@@ -72,6 +84,11 @@ def main():
     # Renderiza o conteúdo adequado com base na navegação ativa
     nav_active = st.session_state.get("nav_active", "home")
     module_name = PAGE_CONFIG.get(nav_active, PAGE_CONFIG["home"])[2]
+
+    # Enquanto o warm start carrega os dados, páginas que dependem deles mostram o progresso
+    if nav_active not in DATA_FREE_PAGES:
+        render_progress_until_ready()
+
     page_module = importlib.import_module(module_name)
     page_module.render()
 
@@ -1,11 +1,11 @@
-import datetime
-
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
-from utils.dataloader import load_data
+from utils.dataloader import load_data, load_key
+from utils.filter_forms import page_filter_mode
+from utils.filter_manager_v2 import FilterManager, create_filter_config, warm_filter_cache
 from utils.google_tag_manager import inject_gtm
 
 # ==== CONFIGURABLE VARIABLES ====
@@ -13,6 +13,41 @@ SHOW_LEGEND = True  # Set to True to show legend
 PLOT_HEIGHT = 850  # Use more vertical space on mobile
 # ================================
 
+# Columns this page reads from tbl_slope_full (column projection, see load_data)
+PAGE_COLUMNS = {
+    "tbl_slope_full": [
+        "video_id",
+        "title",
+        "description",
+        "channel_title",
+        "published_at",
+        "video_type",
+        "default_audio_language",
+        "duration_formatted_seconds",
+        "age_in_days",
+        "slope_date",
+        "view_count_slope",
+        "comment_count_slope",
+        "like_count_slope",
+        "linear_view_count_speed",
+        "slope_view_count_speed",
+    ],
+}
+
+
+def prewarm():
+    """
+    Rows of the default filters (a non-empty state: last year, Regular videos, top 10) in
+    the shared filter cache, so the first visit does not compute them (utils/prewarm.py).
+    """
+    df_slope_full = load_data("tbl_slope_full", PAGE_COLUMNS["tbl_slope_full"])
+    warm_filter_cache(
+        create_filter_config("tbl_slope_full", df_slope_full),
+        df_slope_full,
+        load_key("tbl_slope_full", PAGE_COLUMNS["tbl_slope_full"]),
+    )
+
+
 # @st.cache_data
 # def cached_labs_load(table_name: str):
 #     df = labs_load(table_name)
@@ -22,14 +57,13 @@ PLOT_HEIGHT = 850  # Use more vertical space on mobile
 # # Load cached DataFrame
 # df_slope_full = cached_labs_load("tbl_slope_full")
 
-# new global cached , pre-cleaned ( casted columns date, ids) df
-df_slope_full = load_data("tbl_slope_full")
-
 
 def render():
     """
     Renderiza a página AI Labs (placeholder).
     """
+    # global cached, pre-cleaned (casted columns date, ids) df, loaded on render, not on import
+    df_slope_full = load_data("tbl_slope_full", PAGE_COLUMNS["tbl_slope_full"])
     inject_gtm()
     st.title("🧪 AI Labs")
 
@@ -49,96 +83,30 @@ def render():
     st.divider()
 
     # --- Header Filters ---
-    min_pub = df_slope_full["published_at"].min()
-    max_pub = df_slope_full["published_at"].max()
-    # Default date range: last year
-    one_year_ago = max_pub.date() - datetime.timedelta(days=365)
-    col1, col2, col3 = st.columns([2, 2, 1])
-    with col1:
-        published_at_range = st.date_input(
-            "Published At Range",
-            value=(one_year_ago, max_pub.date()),
-            min_value=min_pub.date(),
-            max_value=max_pub.date(),
-        )
-        # Multi-select for default_audio_language
-        lang_options = (
-            df_slope_full["default_audio_language"].dropna().unique().tolist()
-        )
-        default_audio_language_selected = st.multiselect(
-            "Audio Language", options=lang_options, default=lang_options
-        )
-    with col2:
-        video_types = df_slope_full["video_type"].dropna().unique().tolist()
-        video_type_selected = st.multiselect(
-            "Video Type", options=video_types, default="Regular"
-        )
-        st.write("Select the channel : ")
-        channel_selected = df_slope_full["channel_title"].dropna().unique().tolist()
-        channel_selected = st.multiselect(
-            "Channel", options=channel_selected, default=channel_selected
-        )
-    with col3:
-        top_n = st.slider("Top N Results", min_value=1, max_value=50, value=10)
-    # Duration slider (full-width below)
-    min_duration = int(df_slope_full["duration_formatted_seconds"].min())
-    max_duration = int(df_slope_full["duration_formatted_seconds"].max())
-    duration_range = st.slider(
-        "Duration (seconds)",
-        min_value=min_duration,
-        max_value=max_duration,
-        value=(min_duration, max_duration),
-        step=1,
+    # Declarative filters (create_filter_config): staged in a form and applied together in
+    # "apply" mode (PAGE_FILTER_MODES in config/pages.py, utils/filter_forms.py)
+    filter_manager = FilterManager(
+        "ai_labs",
+        "tbl_slope_full",
+        create_filter_config("tbl_slope_full", df_slope_full),
+        mode=page_filter_mode("ai_labs"),
     )
-    # --- Text input filters ---
-    col4, col5, col6 = st.columns(3)
-    with col4:
-        title_search = st.text_input("Title contains")
-    with col5:
-        description_search = st.text_input("Description contains")
-    with col6:
-        video_id_search = st.text_input("Video ID contains")
+    filter_manager.render_filters(df_slope_full)
+    filter_manager.render_filter_summary()
 
     # --- Normalization Toggle ---
     normalize_metrics = st.checkbox("Normalize metrics (x, y, z)", value=False)
 
-    # Filter DataFrame based on selections
-    filtered = df_slope_full[
-        (df_slope_full["published_at"].dt.date >= published_at_range[0])
-        & (df_slope_full["published_at"].dt.date <= published_at_range[1])
-        & (df_slope_full["video_type"].isin(video_type_selected))
-        & (df_slope_full["duration_formatted_seconds"] >= duration_range[0])
-        & (df_slope_full["duration_formatted_seconds"] <= duration_range[1])
-        & (
-            df_slope_full["default_audio_language"].isin(
-                default_audio_language_selected
-            )
-        )
-        & (df_slope_full["channel_title"].isin(channel_selected))
-    ]
-    if title_search:
-        filtered = filtered[
-            filtered["title"].str.contains(title_search, case=False, na=False)
-        ]
-    if description_search:
-        filtered = filtered[
-            filtered["description"].str.contains(
-                description_search, case=False, na=False
-            )
-        ]
-    if video_id_search:
-        filtered = filtered[
-            filtered["video_id"].str.contains(video_id_search, case=False, na=False)
-        ]
-
-    # Get top N video_ids by max view_count_slope at latest slope_date (after filters)
-    latest = (
-        filtered.sort_values("slope_date").groupby("video_id", as_index=False).last()
-    )
-    top_ids = latest.nlargest(top_n, "view_count_slope")["video_id"]
+    # Filter DataFrame based on selections, compiled into one plan (utils/filter_plan.py):
+    # date window first (binary search on the date-sorted table), the multiselects read the
+    # table's row-id indexes, text searches only test the rows left, one take at the end.
+    # Selected rows are shared with every session (utils/filter_cache.py)
+    cache_key = load_key("tbl_slope_full", PAGE_COLUMNS["tbl_slope_full"])
+    filtered = filter_manager.apply_filters(df_slope_full, cache_key=cache_key, top_n=False)
 
-    # Get all slope points for these video_ids
-    df_top20 = filtered[filtered["video_id"].isin(top_ids)].copy()
+    # All slope points of the top N video_ids by view_count_slope at their latest
+    # slope_date (after filters)
+    df_top20 = filter_manager.apply_filters(df_slope_full, cache_key=cache_key)
     df_top20 = df_top20.sort_values(["video_id", "slope_date"])
 
     # Prepare data for plotting
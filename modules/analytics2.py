@@ -6,7 +6,7 @@
 import gc
 import streamlit as st
 import pandas as pd
-from utils.page_framework import render_page
+from utils.page_framework import page_columns, render_page
 from utils.dataloader import load_data
 
 # Import all section modules
@@ -22,17 +22,68 @@ from modules.blocks.analytics2_section7 import analytics2_section7
 # DEBUG = True
 DEBUG = False
 
+# SafeSearch columns merged into the playlist table (see dataloader._enrich_playlist)
+SS_COLUMNS = ["ss_adult", "ss_spoof", "ss_medical", "ss_violence", "ss_racy"]
+
 # Configurable Block List
+# "columns" declares what a block reads per table; blocks without it need the full tables
 PAGE_BLOCKS = [
-    {"name": "Big Numbers", "func": analytics2_section1},
+    {
+        "name": "Big Numbers",
+        "func": analytics2_section1,
+        "columns": {
+            "tbl_playlist_full_dedup": [
+                "playlist_id",
+                "playlist_title",
+                "playlist_channel_title",
+                "playlist_published_at",
+                "playlist_item_published_at",
+                "video_id",
+                "video_added_at",
+                "video_type",
+                "view_count",
+                "like_count",
+                "comment_count",
+                "duration_formatted_seconds",
+                "category_id",
+                "tags",
+                "default_audio_language",
+            ]
+            + SS_COLUMNS,
+        },
+    },
     {"name": "Metadata", "func": analytics2_section2},
-    {"name": "Radar Charts", "func": analytics2_section3},
+    {
+        "name": "Radar Charts",
+        "func": analytics2_section3,
+        "columns": {
+            "tbl_nerdalytics": ["channel_title", "video_id", "view_count"],
+            "tbl_playlist_full_dedup": [
+                "playlist_id",
+                "playlist_channel_title",
+                "video_id",
+                "video_added_at",
+                "view_count",
+                "like_count",
+                "comment_count",
+                "category_id",
+                "tags",
+                "default_audio_language",
+            ],
+        },
+    },
     {"name": "TBD", "func": analytics2_section4},
     {"name": "Playlists", "func": analytics2_section5},
     {"name": "Tags Playground", "func": analytics2_section6},
     {"name": "Metadata 2", "func": analytics2_section7},
 ]
 
+# Column projection per table for this page (None = full table)
+PAGE_COLUMNS = {
+    "tbl_nerdalytics": page_columns(PAGE_BLOCKS, "tbl_nerdalytics"),
+    "tbl_playlist_full_dedup": page_columns(PAGE_BLOCKS, "tbl_playlist_full_dedup"),
+}
+
 # --- FILTER HEADER LOGIC (namespaced, modular, robust) ---
 FILTER_NAMESPACE = "analytics2_filters"
 
@@ -106,9 +157,11 @@ def render():
     Main entrypoint for the analytics2 page. Loads required data and renders each section block.
     """
     # Data loading only (no filters or joins yet)
-    df_nerdalytics = load_data("tbl_nerdalytics")
+    df_nerdalytics = load_data("tbl_nerdalytics", PAGE_COLUMNS["tbl_nerdalytics"])
     # df_slope_full = load_data("tbl_slope_full")
-    df_playlist_full_dedup = load_data("tbl_playlist_full_dedup")
+    df_playlist_full_dedup = load_data(
+        "tbl_playlist_full_dedup", PAGE_COLUMNS["tbl_playlist_full_dedup"]
+    )
     # st.button("Reset Filters", on_click=reset_filters, key=f"{FILTER_NAMESPACE}_reset_top")
     with st.popover("🎯 DataFrames", use_container_width=True):
         st.write(" dataframes loaded (shape)")
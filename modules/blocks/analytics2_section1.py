@@ -1,3 +1,9 @@
+# HISTORY: 2026-10-16 Filters moved onto FilterManager (one FilterPlan + filter cache path), replacing the hand-rolled widgets and masks
+# HISTORY: 2026-10-16 Playlist filters can be staged in a form and applied together (FILTER_MODE, utils/filter_forms.py)
+# HISTORY: 2026-10-16 Channel/video type options and date bounds come from the facet catalogue (utils/facets.column_facet)
+# HISTORY: 2026-10-16 Playlists of the selected channels come from the facet index (utils/facets.py) instead of a table scan
+# HISTORY: 2026-10-16 Date range filter reads the timestamp index (row_index.date_mask) instead of comparing .dt.date per row
+# HISTORY: 2026-10-16 Channel/playlist/video type filters read the row-id indexes (utils/row_index.py) instead of Series.isin
 # HISTORY: 2025-05-09 Made filters fully interdependent, added Reset button, merged more columns from df_nerdalytics, and implemented more analytics sections. See previous history below.
 # HISTORY: 2025-05-09 Fixed Streamlit slider date bug and enriched DataFrame with view/like/comment/video_type from df_nerdalytics. See previous history below.
 # HISTORY: 2025-05-09 Added analytics dashboard sections and filters, with Streamlit widgets and Plotly Express, following user instructions. Previous history preserved below.
@@ -7,6 +13,55 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from config.pages import PAGE_BACKENDS
+from utils.duckdb_backend import group_aggregate
+from utils.facets import child_options, column_facet
+from utils.filter_forms import page_filter_mode
+from utils.filter_manager_v2 import FilterManager
+
+BACKEND = PAGE_BACKENDS.get("analytics2")
+FILTER_MODE = page_filter_mode("analytics2")
+
+
+def section1_filter_config(df_enriched, date_col):
+    """
+    FilterManager configuration of the playlist filters: channels (all by default), date
+    range (the whole table by default), playlists of the selected channels (all by default,
+    so rows without a playlist are excluded) and video type.
+    """
+    channel_options = list(column_facet(df_enriched["playlist_channel_title"]).values)
+    playlist_options = child_options(
+        df_enriched, "playlist_channel_title", "playlist_title", channel_options
+    )
+    config = {
+        "playlist_channel_title": {
+            "type": "multiselect",
+            "label": "Select channels",
+            "default": channel_options.copy(),
+            "options": channel_options,
+        },
+        date_col: {
+            "type": "date_range",
+            "label": "Select date range",
+            # Bounds from the facet catalogue (once per table version)
+            "default": column_facet(df_enriched[date_col]).date_bounds,
+        },
+        "playlist_title": {
+            "type": "multiselect",
+            "label": "Select playlists",
+            "default": playlist_options,
+            "depends_on": "playlist_channel_title",
+        },
+    }
+    if "video_type" in df_enriched.columns:
+        config["video_type"] = {
+            "type": "segmented",
+            "label": "Video type",
+            "default": None,
+            "options": list(column_facet(df_enriched["video_type"]).sorted_values),
+        }
+    return config
+
 
 def analytics2_section1(df_nerdalytics, df_playlist_full_dedup):
     """
@@ -30,7 +85,9 @@ def analytics2_section1(df_nerdalytics, df_playlist_full_dedup):
     #     df_enriched = df_playlist_full_dedup.merge(df_nerdalytics[merge_cols], on='video_id', how='left')
     # else:
     #     df_enriched = df_playlist_full_dedup.copy()
-    df_enriched = df_playlist_full_dedup.copy()
+    # Shallow copy-on-write copy: shares the column buffers, so the row-id indexes of the
+    # loaded table (utils/row_index.py) serve the filters below
+    df_enriched = df_playlist_full_dedup.copy(deep=False)
 
     # --- 1. High-Level KPIs & Filters Widgets ---
     st.divider()
@@ -38,105 +95,27 @@ def analytics2_section1(df_nerdalytics, df_playlist_full_dedup):
 
     with st.popover("🎯 Playlist Filters", use_container_width=True):
         # --- Filters ---
-        # -- FILTERS: Interdependent with Reset Button --
-        # Session state for filters and playlists
-        if "filters_reset" not in st.session_state:
-            st.session_state["filters_reset"] = False
-        if "selected_playlists" not in st.session_state:
-            st.session_state["selected_playlists"] = None
-
-        # Defaults
         date_col = (
             "video_added_at"
             if "video_added_at" in df_enriched.columns
             else "playlist_published_at"
         )
-        df_enriched[date_col] = pd.to_datetime(df_enriched[date_col], errors="coerce")
-        min_date = df_enriched[date_col].min()
-        max_date = df_enriched[date_col].max()
-        min_date_slider = (
-            min_date.date() if pd.notnull(min_date) else datetime.today().date()
-        )
-        max_date_slider = (
-            max_date.date() if pd.notnull(max_date) else datetime.today().date()
-        )
-        channel_options = (
-            df_enriched["playlist_channel_title"].dropna().unique().tolist()
-        )
-
-        # Set/reset state
-        reset_triggered = (
-            st.button("Reset filters") or st.session_state["filters_reset"]
-        )
-        if reset_triggered:
-            selected_channels = channel_options.copy()
-            st.session_state["filters_reset"] = False
-            st.session_state["selected_playlists"] = None
-            date_range = (min_date_slider, max_date_slider)
-            video_type = "All"
-        else:
-            selected_channels = st.multiselect(
-                "Select channels", channel_options, default=channel_options
-            )
-            date_range = st.slider(
-                "Select date range",
-                min_value=min_date_slider,
-                max_value=max_date_slider,
-                value=(min_date_slider, max_date_slider),
-                format="YYYY-MM-DD",
-            )
-
-        # Playlists available for selected channels
-        filtered_playlists = (
-            df_enriched[df_enriched["playlist_channel_title"].isin(selected_channels)][
-                "playlist_title"
-            ]
-            .dropna()
-            .unique()
-            .tolist()
-        )
-        # Only set session state if not already set or invalid
-        if st.session_state["selected_playlists"] is None or not set(
-            st.session_state["selected_playlists"]
-        ).issubset(filtered_playlists):
-            st.session_state["selected_playlists"] = filtered_playlists.copy()
-        # Use session state as value, not default, to avoid Streamlit warning
-        # Ensure session state is valid before widget instantiation
-        if st.session_state["selected_playlists"] is None or not set(
-            st.session_state["selected_playlists"]
-        ).issubset(filtered_playlists):
-            st.session_state["selected_playlists"] = filtered_playlists.copy()
-        selected_playlists = st.multiselect(
-            "Select playlists",
-            filtered_playlists,
-            default=st.session_state["selected_playlists"],
-            key="selected_playlists",
-        )
-        # Do NOT set st.session_state['selected_playlists'] after the widget!
+        if not pd.api.types.is_datetime64_any_dtype(df_enriched[date_col]):
+            df_enriched[date_col] = pd.to_datetime(df_enriched[date_col], errors="coerce")
+        # Declarative filters (utils/filter_manager_v2.py): playlists cascade from the
+        # channels, staged in a form and applied together in "apply" mode (FILTER_MODE)
+        filter_manager = FilterManager(
+            "analytics2_section1",
+            "tbl_playlist_full_dedup",
+            section1_filter_config(df_enriched, date_col),
+            backend=BACKEND,
+            mode=FILTER_MODE,
+        )
+        filter_manager.render_filters(df_enriched)
 
-        # Video type radio
-        video_type_options = ["All"]
-        if "video_type" in df_enriched.columns:
-            video_type_options += sorted(
-                [
-                    v
-                    for v in df_enriched["video_type"].dropna().unique()
-                    if v not in video_type_options
-                ]
-            )
-        else:
-            video_type_options += ["Regular", "Shorts"]
-        video_type = st.radio("Video type", video_type_options)
-
-        # Filter DataFrame
-        df_filtered = df_enriched[
-            (df_enriched[date_col].dt.date >= date_range[0])
-            & (df_enriched[date_col].dt.date <= date_range[1])
-            & (df_enriched["playlist_channel_title"].isin(selected_channels))
-            & (df_enriched["playlist_title"].isin(selected_playlists))
-        ].copy()
-        if video_type != "All" and "video_type" in df_filtered.columns:
-            df_filtered = df_filtered[df_filtered["video_type"] == video_type]
+    # Filter DataFrame: one plan over the row-id and timestamp indexes, rows shared with
+    # every session through the filter cache
+    df_filtered = filter_manager.apply_filters(df_enriched)
 
     st.subheader("Metrics Panel : ")
     col1, col2, col3 = st.columns(3)
@@ -168,7 +147,15 @@ def analytics2_section1(df_nerdalytics, df_playlist_full_dedup):
         )
         st.metric(
             "Avg Views per Playlist",
-            round(df_filtered.groupby("playlist_id")["view_count"].sum().mean(), 1)
+            round(
+                group_aggregate(
+                    df_filtered,
+                    ["playlist_id"],
+                    {"view_count": ("view_count", "sum")},
+                    backend=BACKEND,
+                )["view_count"].mean(),
+                1,
+            )
             if "view_count" in df_filtered and "playlist_id" in df_filtered
             else "N/A",
         )
@@ -190,10 +177,11 @@ def analytics2_section1(df_nerdalytics, df_playlist_full_dedup):
     # 2.1 Accumulated Views by Playlist
     st.subheader("2.1 Accumulated Views by Playlist")
     if "view_count" in df_filtered:
-        playlist_views = (
-            df_filtered.groupby(["playlist_title", "playlist_id"])["view_count"]
-            .sum()
-            .reset_index()
+        playlist_views = group_aggregate(
+            df_filtered,
+            ["playlist_title", "playlist_id"],
+            {"view_count": ("view_count", "sum")},
+            backend=BACKEND,
         )
         playlist_views = playlist_views.sort_values("view_count", ascending=True)
         fig1 = px.bar(
@@ -322,7 +310,7 @@ def analytics2_section1(df_nerdalytics, df_playlist_full_dedup):
         pairs = pairs[pairs["playlist_id_x"] != pairs["playlist_id_y"]]
         # Filter out very small flows for clarity
         sankey_links = (
-            pairs.groupby(["playlist_title_x", "playlist_title_y"])
+            pairs.groupby(["playlist_title_x", "playlist_title_y"], observed=True)
             .size()
             .reset_index(name="count")
         )
@@ -1,8 +1,11 @@
 import streamlit as st
-import seaborn as sns
-import matplotlib.pyplot as plt
 import numpy as np
 
+from utils.lazy_imports import lazy_module
+
+sns = lazy_module("seaborn")
+plt = lazy_module("matplotlib.pyplot")
+
 def analytics2_section2(df_nerdalytics, df_playlist_full_dedup):
     st.write("This is the page for Metadata 2")
 
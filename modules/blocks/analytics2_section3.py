@@ -3,6 +3,11 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from config.pages import PAGE_BACKENDS
+from utils.duckdb_backend import group_aggregate
+
+BACKEND = PAGE_BACKENDS.get("analytics2")
+
 
 def analytics2_section3(df_nerdalytics, df_playlist_full_dedup):
     """
@@ -33,21 +38,46 @@ def analytics2_section3(df_nerdalytics, df_playlist_full_dedup):
         return a / b if b else 0
 
     # --- Step 3.1: Prepare groupby ---
-    channel_group = df_filtered.groupby("playlist_channel_title")
+    # Counts and sums for every channel in one grouped query each (pushed to the page backend)
+    channel_sums = {
+        "n_playlists": ("playlist_id", "nunique"),
+        "total_videos": ("video_id", "count"),
+        "unique_videos": ("video_id", "nunique"),
+        "total_views": ("view_count", "sum"),
+        "total_likes": ("like_count", "sum"),
+        "total_comments": ("comment_count", "sum"),
+    }
+    if "category_id" in df_filtered:
+        channel_sums["n_categories"] = ("category_id", "nunique")
+    channel_totals = group_aggregate(
+        df_filtered, ["playlist_channel_title"], channel_sums, backend=BACKEND
+    ).set_index("playlist_channel_title").to_dict("index")
+    nerdalytics_totals = group_aggregate(
+        df_nerdalytics,
+        ["channel_title"],
+        {
+            "channel_total_videos": ("video_id", "nunique"),
+            "channel_total_views": ("view_count", "sum"),
+        },
+        backend=BACKEND,
+    ).set_index("channel_title").to_dict("index")
+
+    channel_group = df_filtered.groupby("playlist_channel_title", observed=True)
     radar_metrics = []
     for channel, group in channel_group:
+        totals = channel_totals[channel]
         # --- 1. Size & Breadth ---
-        n_playlists = group["playlist_id"].nunique()
-        total_videos = group["video_id"].count()
-        unique_videos = group["video_id"].nunique()
+        n_playlists = totals["n_playlists"]
+        total_videos = totals["total_videos"]
+        unique_videos = totals["unique_videos"]
         avg_playlist_size = safe_div(total_videos, n_playlists)
         # --- 2. Overlap & Redundancy ---
         overlap_ratio = 1 - safe_div(unique_videos, total_videos)
         avg_appearances_per_video = safe_div(total_videos, unique_videos)
         # --- 3. Engagement Sums & Averages ---
-        total_views = group["view_count"].sum()
-        total_likes = group["like_count"].sum()
-        total_comments = group["comment_count"].sum()
+        total_views = totals["total_views"]
+        total_likes = totals["total_likes"]
+        total_comments = totals["total_comments"]
         avg_views_per_video = safe_div(total_views, total_videos)
         avg_like_to_view = safe_div(total_likes, total_views)
         avg_comment_to_view = safe_div(total_comments, total_views)
@@ -68,7 +98,7 @@ def analytics2_section3(df_nerdalytics, df_playlist_full_dedup):
         views_per_month = safe_div(total_views, playlist_lifespan_months)
         views_per_video_added = safe_div(total_views, total_videos)
         # --- 6. Diversity & Topical Coverage ---
-        n_categories = group["category_id"].nunique() if "category_id" in group else 0
+        n_categories = totals["n_categories"] if "category_id" in group else 0
         # Tags: explode and count unique
         tags_series = (
             group["tags"]
@@ -84,12 +114,9 @@ def analytics2_section3(df_nerdalytics, df_playlist_full_dedup):
         lang_counts = group["default_audio_language"].value_counts(normalize=True)
         lang_ptbr = lang_counts.get("pt-BR", 0)
         # --- 7. Relative Channel-Level Ratios ---
-        channel_total_videos = df_nerdalytics[
-            df_nerdalytics["channel_title"] == channel
-        ]["video_id"].nunique()
-        channel_total_views = df_nerdalytics[
-            df_nerdalytics["channel_title"] == channel
-        ]["view_count"].sum()
+        channel_totals_nerd = nerdalytics_totals.get(channel, {})
+        channel_total_videos = channel_totals_nerd.get("channel_total_videos", 0)
+        channel_total_views = channel_totals_nerd.get("channel_total_views", 0)
         pct_videos_in_playlists = safe_div(unique_videos, channel_total_videos)
         pct_views_in_playlists = safe_div(total_views, channel_total_views)
         # --- Collect ---
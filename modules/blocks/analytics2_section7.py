@@ -1,4 +1,5 @@
 """
+# 2026-10-16: Heavy imports (matplotlib, seaborn) are lazy (utils/lazy_imports.py)
 # 2025-06-10: Created playlist section 6 for text analysis of titles and descriptions
 # 2025-06-10: Added word frequency analysis and word cloud visualization using Plotly
 # 2025-05-05: Extended text analysis to optionally include tags column in all analysis tabs (Title, Description, Custom)
@@ -11,9 +12,11 @@ import pandas as pd
 import numpy as np
 import re
 from collections import Counter
-import matplotlib.pyplot as plt
-import seaborn as sns
 from utils.dataloader import load_data
+from utils.lazy_imports import lazy_module
+
+plt = lazy_module("matplotlib.pyplot")
+sns = lazy_module("seaborn")
 
 def clean_text(text):
     """
@@ -548,7 +551,7 @@ def analytics2_section7(df_nerdalytics, df_playlist_full_dedup):
             tag_status_df = df_nerdalytics.copy()
             # tag_status_df = df_playlist_full_dedup.copy()
             tag_status_df["tags_filled"] = tag_status_df["tags"].apply(lambda x: bool(isinstance(x, str) and x.strip()))
-            summary = tag_status_df.groupby("channel_title").agg(
+            summary = tag_status_df.groupby("channel_title", observed=True).agg(
                 videos_with_tags = ("tags_filled", "sum"),
                 videos_without_tags = ("tags_filled", lambda x: (~x).sum()),
                 total_videos = ("tags_filled", "count")
@@ -2,7 +2,7 @@
 External block example for modular Streamlit page framework.
 """
 import streamlit as st
-from utils.dataloader import load_data
+from utils.dataloader import get_null_report, load_data
 from utils.config import APPMODE
 
 
@@ -154,6 +154,10 @@ def debugtools4():
         st.write("Null Count for Nerdalytics:")
         st.code(df_nerdalytics.isnull().sum())
 
+    st.divider()
+    st.write("Null tokens converted to NaN at load (per column):")
+    st.dataframe(get_null_report("tbl_nerdalytics"))
+
     st.divider()
     print("--- DataFrame Assessment ---")
     assessment_summary = assess_dataframe(df_nerdalytics)
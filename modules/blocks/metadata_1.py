@@ -1,7 +1,10 @@
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
-from plotly.subplots import make_subplots
+
+from utils.lazy_imports import lazy_attr
+
+make_subplots = lazy_attr("plotly.subplots", "make_subplots")
 
 
 def render(df):
@@ -45,8 +48,10 @@ def render(df):
         top_channels = df["channel_title"].value_counts().nlargest(top_n).index
 
         # Create a new column for channel grouping
-        df["channel_group"] = df["channel_title"].where(
-            df["channel_title"].isin(top_channels), "Other"
+        df["channel_group"] = (
+            df["channel_title"]
+            .astype(object)
+            .where(df["channel_title"].isin(top_channels), "Other")
         )
 
         fig = px.histogram(
@@ -116,8 +121,10 @@ def render(df):
         # Second subplot - Stacked bar chart by channel
         top_n = 5
         top_channels = df["channel_title"].value_counts().nlargest(top_n).index
-        df["channel_group"] = df["channel_title"].where(
-            df["channel_title"].isin(top_channels), "Other"
+        df["channel_group"] = (
+            df["channel_title"]
+            .astype(object)
+            .where(df["channel_title"].isin(top_channels), "Other")
         )
 
         for channel in df["channel_group"].unique():
@@ -154,7 +161,10 @@ def render(df):
         # Get top N channels
         top_n = 10
         top_channels = df["channel_title"].value_counts().nlargest(top_n).index
-        df_plot = df[df["channel_title"].isin(top_channels)]
+        # Treemap paths/colors need plain strings (plotly cannot aggregate categoricals)
+        df_plot = df[df["channel_title"].isin(top_channels)].astype(
+            {"video_type": str, "channel_title": str}
+        )
 
         fig = px.treemap(
             df_plot,
@@ -2,9 +2,15 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
-from plotly.subplots import make_subplots
 
+from config.pages import PAGE_BACKENDS
 from config.VideoCategorieslist import categories_br
+from utils.duckdb_backend import group_aggregate
+from utils.lazy_imports import lazy_attr
+
+make_subplots = lazy_attr("plotly.subplots", "make_subplots")
+
+BACKEND = PAGE_BACKENDS.get("metadata")
 
 
 def render(df):
@@ -62,9 +68,10 @@ def render(df):
             values_col = "value"
         else:
             # For other metrics, we need to group and sum
-            type_data = df.groupby("video_type", as_index=False)[
-                metric_options[selected_metric]
-            ].sum()
+            metric = metric_options[selected_metric]
+            type_data = group_aggregate(
+                df, ["video_type"], {metric: (metric, "sum")}, backend=BACKEND
+            )
             values_col = metric_options[selected_metric]
 
         # Sort and limit to top N
@@ -101,14 +108,18 @@ def render(df):
         if selected_metric == "Count":
             top_channels = df["channel_title"].value_counts().nlargest(top_n).index
         else:
+            metric = metric_options[selected_metric]
             top_channels = (
-                df.groupby("channel_title")[metric_options[selected_metric]]
-                .sum()
-                .nlargest(top_n)
-                .index
+                group_aggregate(
+                    df, ["channel_title"], {metric: (metric, "sum")}, backend=BACKEND
+                )
+                .nlargest(top_n, metric)["channel_title"]
             )
 
-        df_plot = df[df["channel_title"].isin(top_channels)].copy()
+        # Treemap paths/colors need plain strings (plotly cannot aggregate categoricals)
+        df_plot = df[df["channel_title"].isin(top_channels)].astype(
+            {"video_type": str, "channel_title": str}
+        )
 
         if not df_plot.empty:
             # Create a color map for channels
@@ -131,9 +142,13 @@ def render(df):
                 )
             else:
                 # For other metrics, we need to aggregate
-                agg_df = df_plot.groupby(
-                    ["video_type", "channel_title"], as_index=False
-                )[metric_options[selected_metric]].sum()
+                metric = metric_options[selected_metric]
+                agg_df = group_aggregate(
+                    df_plot,
+                    ["video_type", "channel_title"],
+                    {metric: (metric, "sum")},
+                    backend=BACKEND,
+                ).astype({"video_type": str, "channel_title": str})
                 fig = px.treemap(
                     agg_df,
                     path=["video_type", "channel_title"],
@@ -186,9 +201,10 @@ def render(df):
                 data = df[col].value_counts().reset_index()
                 data.columns = [col, "value"]
             else:
-                data = df.groupby(col, as_index=False)[
-                    metric_options[selected_metric]
-                ].sum()
+                metric = metric_options[selected_metric]
+                data = group_aggregate(
+                    df, [col], {metric: (metric, "sum")}, backend=BACKEND
+                )
                 data = data.rename(columns={metric_options[selected_metric]: "value"})
 
             # Sort by value in descending order and limit to top_n
@@ -270,7 +286,7 @@ def render(df):
             category_data = df["category_id"].astype(str).value_counts().reset_index()
             category_data.columns = ["Category ID", "Count"]
         else:
-            category_data = df.groupby("category_id", as_index=False)[
+            category_data = df.groupby("category_id", as_index=False, observed=True)[
                 metric_options[selected_metric]
             ].sum()
             category_data = category_data.rename(
@@ -1,9 +1,12 @@
-import matplotlib.pyplot as plt
 import pandas as pd
 import plotly.express as px
-import seaborn as sns
 import streamlit as st
 
+from utils.lazy_imports import lazy_module
+
+plt = lazy_module("matplotlib.pyplot")
+sns = lazy_module("seaborn")
+
 
 def render(df):
     """
@@ -47,6 +50,7 @@ def render(df):
     ]:
         vc = (
             df[col]
+            .astype(object)
             .fillna("‹missing›")
             .value_counts()
             .rename_axis(col)
@@ -2,7 +2,8 @@ import streamlit as st
 
 from modules.blocks.dstories_1 import render as render_dstories1
 from modules.blocks.dstories_2 import render as render_dstories2
-from utils.dataloader import load_data
+from utils.dataloader import load_data, load_key
+from utils.filter_forms import page_filter_mode
 from utils.filter_manager_v2 import FilterManager, create_filter_config
 
 # Configurable Block List
@@ -11,17 +12,25 @@ PAGE_BLOCKS = [
     {"name": "More Analysis", "func": render_dstories2},
 ]
 
+# Tables this page reads (None = every column); also warmed up by utils/prewarm.py
+PAGE_COLUMNS = {"tbl_nerdalytics": None}
+
 
 def render():
     """
     Main entrypoint for Data Stories page. Loads required data and renders each section block.
     """
     # Load DataFrame (single df per page)
-    df_nerdalytics = load_data("tbl_nerdalytics")
+    df_nerdalytics = load_data("tbl_nerdalytics", PAGE_COLUMNS["tbl_nerdalytics"])
 
     # Set up FilterManager with configuration for this DataFrame
     filter_config = create_filter_config("tbl_nerdalytics", df_nerdalytics)
-    filter_manager = FilterManager("datastories", "df_nerdalytics", filter_config)
+    filter_manager = FilterManager(
+        "datastories",
+        "df_nerdalytics",
+        filter_config,
+        mode=page_filter_mode("datastories"),
+    )
 
     # Render filter popover and summary
     with st.popover("\U0001f50d Filtros Do Datalake", use_container_width=True):
@@ -29,7 +38,11 @@ def render():
     filter_manager.render_filter_summary()
 
     # Apply filters to main df
-    filtered_df = filter_manager.apply_filters(df_nerdalytics)
+    # Selected rows shared with every session showing the same filters (utils/filter_cache.py)
+    filtered_df = filter_manager.apply_filters(
+        df_nerdalytics,
+        cache_key=load_key("tbl_nerdalytics", PAGE_COLUMNS["tbl_nerdalytics"]),
+    )
 
     # Check if filtered dataframe is empty
     if filtered_df is None or filtered_df.empty:
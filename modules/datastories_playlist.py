@@ -3,6 +3,7 @@ import streamlit as st
 from modules.blocks.dstories_play1 import render as render_dstories1
 from modules.blocks.dstories_play2 import render as render_dstories2
 from utils.dataloader import load_data
+from utils.filter_forms import page_filter_mode
 from utils.filter_manager_v2 import FilterManager, create_filter_config
 
 # Configurable Block List
@@ -11,17 +12,25 @@ PAGE_BLOCKS = [
     {"name": "Playlist Analysis", "func": render_dstories2},
 ]
 
+# Tables this page reads (None = every column); also warmed up by utils/prewarm.py
+PAGE_COLUMNS = {"tbl_playlist_full_dedup": None}
+
 
 def render():
     """
     Main entrypoint for Playlist Data Stories page. Loads required data and renders each section block.
     """
     # Load DataFrame (single df per page)
-    df_playlist = load_data("tbl_playlist_full_dedup")
+    df_playlist = load_data("tbl_playlist_full_dedup", PAGE_COLUMNS["tbl_playlist_full_dedup"])
 
     # Set up FilterManager with configuration for this DataFrame
     filter_config = create_filter_config("tbl_playlist_full_dedup", df_playlist)
-    filter_manager = FilterManager("datastories_playlist", "df_playlist", filter_config)
+    filter_manager = FilterManager(
+        "datastories_playlist",
+        "df_playlist",
+        filter_config,
+        mode=page_filter_mode("playlist"),
+    )
 
     # Render filter popover and summary
     with st.popover("\U0001f50d Filtros Do Datalake", use_container_width=True):
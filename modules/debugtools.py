@@ -18,7 +18,6 @@ To create a new page:
 
 import gc
 import os
-import subprocess
 from datetime import datetime, timezone
 from typing import Callable, Dict, List
 
@@ -33,9 +32,16 @@ from modules.blocks.debugtools3 import debugtools3  # Internal block example
 from modules.blocks.debugtools4 import debugtools4  # Internal block example
 from modules.blocks.fileman import fileman  # Internal block example
 from utils.auth import SHOW_DEBUG_INFO
-from utils.dataloader import load_data
-from utils.dataretriever import main as dataretriever_main
+from utils.data_refresher import (
+    get_manual_refresher,
+    get_refresher,
+    refresh_in_background,
+)
+from utils.dataloader import get_memory_report, load_data, published_versions
 from utils.page_framework import render_page
+from utils.filter_cache import filter_cache_stats
+from utils.filter_forms import filter_form_stats
+from utils.prewarm import prewarm_status
 
 
 # ---- Example Local Block Function ----
@@ -61,18 +67,36 @@ def intro_block():
 
     st.divider()
 
-    st.error("DO NOT CLICK THIS:", icon="🚨")
-
     # DATA_DIR = "/app/data"  # match your downloader’s LOCAL_DATA_DIR
 
-    if st.button("Run Data Retriever 2 (subprocess)"):
-        result = subprocess.run(
-            ["python", "utils/dataretriever.py"], capture_output=True, text=True
-        )
-        st.write("**Return code:**", result.returncode)
-        st.write("**Stdout:**", result.stdout or "_(none)_")
-        st.write("**Stderr:**", result.stderr or "_(none)_")
-        st.write("**Local files now in**", DATA_DIR, ":", os.listdir(DATA_DIR))
+    # Data retriever runs in the background refresher thread: the session is not blocked,
+    # new data is served once it is built (see utils/data_refresher.py)
+    refresher = get_refresher()
+    if refresher is None:
+        # No scheduled refresher: one-shot refresh in its own thread, new files are served
+        # on the next rerun once synced
+        st.info("Background data refresher disabled (DATA_REFRESH_MINUTES=0)")
+        refresher = get_manual_refresher()
+        if st.button("Run Data Retriever (background)"):
+            if refresh_in_background(refresher):
+                st.write("Data refresh started, new data is served once it is synced.")
+            else:
+                st.write("A data refresh is already running.")
+    else:
+        if st.button("Run Data Retriever (background)"):
+            refresher.trigger()
+            st.write("Data refresh requested, sessions keep the current data until it is ready.")
+        st.write("**Published versions:**", published_versions())
+    st.write("**Refresher status:**", refresher.status)
+    if os.path.isdir(DATA_DIR):
+        st.write("**Local files in**", DATA_DIR, ":", os.listdir(DATA_DIR))
+
+    # Per-page warm-up timings (utils/prewarm.py)
+    st.write("**Page prewarm:**", prewarm_status())
+    # Process-wide filter results shared across sessions (utils/filter_cache.py)
+    st.write("**Filter cache:**", filter_cache_stats())
+    # Recomputes per filter mode, and those avoided by "apply" mode (utils/filter_forms.py)
+    st.write("**Filter commits:**", filter_form_stats())
 
     if SHOW_DEBUG_INFO:
         st.divider()
@@ -87,15 +111,6 @@ def intro_block():
         )
         st.write("• /app contents:", os.listdir("/app"))
 
-    st.divider()
-
-    if st.button("Run Data Retriever (subprocess)"):
-        subprocess.run(["python", "utils/dataretriever.py"])
-        st.write("Data Retriever script executed via subprocess!")
-
-    if st.button("Run Data Retriever (import)"):
-        dataretriever_main()
-        st.write("Data Retriever executed via import!")
 
 
 # ---- Example Local Block Function ----
@@ -322,6 +337,19 @@ def debugtools6():
     )
 
 
+def memory_report_block():
+    st.header("Memory Report")
+    st.write("In-memory size of each loaded table, before/after the load-time dtype optimisation.")
+    report = get_memory_report()
+    if report.empty:
+        st.info("No tables loaded yet in this process.")
+        return
+    st.dataframe(report, use_container_width=True)
+    st.write(
+        f"Total: {report['before_mb'].sum():,.1f} MB -> {report['after_mb'].sum():,.1f} MB"
+    )
+
+
 # ---- Configurable Block List ----
 PAGE_BLOCKS: List[Dict[str, Callable]] = [
     {"name": "DataLoad", "func": intro_block},
@@ -332,6 +360,7 @@ PAGE_BLOCKS: List[Dict[str, Callable]] = [
     {"name": "4 DF inspector", "func": debugtools4},
     {"name": "5 OS Version", "func": debugtools5},
     {"name": "6 Env Variables", "func": debugtools6},
+    {"name": "7 Memory Report", "func": memory_report_block},
 ]
 
 
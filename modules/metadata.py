@@ -5,7 +5,9 @@ from modules.blocks.metadata_2 import render as render_metadata2
 from modules.blocks.metadata_3 import render as render_metadata3
 from modules.blocks.metadata_4 import render as render_metadata4
 from modules.blocks.metadata_5 import render as render_metadata5
-from utils.dataloader import load_data
+from config.pages import PAGE_BACKENDS
+from utils.dataloader import load_data, load_key
+from utils.filter_forms import page_filter_mode
 from utils.filter_manager_v2 import FilterManager, create_filter_config
 
 # Configurable Block List
@@ -17,17 +19,26 @@ PAGE_BLOCKS = [
     {"name": "part 5", "func": render_metadata5},
 ]
 
+# Tables this page reads (None = every column); also warmed up by utils/prewarm.py
+PAGE_COLUMNS = {"tbl_nerdalytics": None}
+
 
 def render():
     """
     Main entrypoint for Data Stories page. Loads required data and renders each section block.
     """
     # Load DataFrame (single df per page)
-    df_nerdalytics = load_data("tbl_nerdalytics")
+    df_nerdalytics = load_data("tbl_nerdalytics", PAGE_COLUMNS["tbl_nerdalytics"])
 
     # Set up FilterManager with configuration for this DataFrame
     filter_config = create_filter_config("tbl_nerdalytics", df_nerdalytics)
-    filter_manager = FilterManager("datastories", "df_nerdalytics", filter_config)
+    filter_manager = FilterManager(
+        "datastories",
+        "df_nerdalytics",
+        filter_config,
+        backend=PAGE_BACKENDS.get("metadata"),
+        mode=page_filter_mode("metadata"),
+    )
 
     # Render filter popover and summary
     with st.popover("\U0001f50d Metadada Filters", use_container_width=True):
@@ -35,7 +46,11 @@ def render():
     filter_manager.render_filter_summary()
 
     # Apply filters to main df
-    filtered_df = filter_manager.apply_filters(df_nerdalytics)
+    # Selected rows shared with every session showing the same filters (utils/filter_cache.py)
+    filtered_df = filter_manager.apply_filters(
+        df_nerdalytics,
+        cache_key=load_key("tbl_nerdalytics", PAGE_COLUMNS["tbl_nerdalytics"]),
+    )
 
     # Check if filtered dataframe is empty
     if filtered_df is None or filtered_df.empty:
@@ -2,7 +2,7 @@ import streamlit as st
 import pandas as pd
 import gc
 import logging
-from utils.dataloader import get_user_dataframe
+from utils.dataloader import get_user_dataframe, load_key
 from utils.filter_manager import FilterManager
 
 # Import individual block functions
@@ -13,6 +13,13 @@ from modules.blocks.template_channels_block import template_channels_block
 
 logger = logging.getLogger(__name__)
 
+# Tables the example page and its blocks read (full tables); warmed up by utils/prewarm.py
+PAGE_COLUMNS = {
+    "tbl_nerdalytics": None,
+    "tbl_slope_full": None,
+    "tbl_playlist_full_dedup": None,
+}
+
 class TemplateDataPage:
     """
     Template for data pages with standardized layout, filtering, and tab navigation.
@@ -44,15 +51,16 @@ class TemplateDataPage:
         ..."""
 
 
-    # Fix the caching issue by adding underscore to self parameter
-    @st.cache_data(ttl='15m')
-    def _get_filtered_dataframe(_self, df_name, filters):
+    # Not st.cache_data (one pickled frame per session state): the selected rows are kept in
+    # the process-wide filter cache, keyed by load_key (table version) and the filter state
+    def _get_filtered_dataframe(_self, df_name, filters, version):
         """
         Get a filtered copy of a dataframe.
 
         Args:
             df_name: Name of the dataframe to filter
             filters: Filter state dictionary
+            version: load_key(df_name), the table version part of the filter cache key
 
         Returns:
             Filtered dataframe
@@ -69,7 +77,7 @@ class TemplateDataPage:
             # Set the filter state manually
             st.session_state[temp_filter_manager.namespace] = filters
             # Apply filters
-            df = temp_filter_manager.apply_filters(df)
+            df = temp_filter_manager.apply_filters(df, cache_key=version)
 
         return df
 
@@ -89,7 +97,7 @@ class TemplateDataPage:
         filters = self.filter_manager.get_filter_state()
 
         # Get the filtered dataframe
-        return self._get_filtered_dataframe(df_name, filters)
+        return self._get_filtered_dataframe(df_name, filters, load_key(df_name))
 
     def render_dataframe_info(self):
         """Render information about available dataframes."""
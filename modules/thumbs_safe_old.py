@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """
+# 2026-10-16: Heavy imports (openai, Vision AI) are lazy (utils/lazy_imports.py)
 # 2024-04-19: Updated "AI" to "IA" to match Portuguese language
 # 2024-04-19: Updated title to "Creators Engine AI" and added rainbow dividers for better section separation
 # 2024-04-19: Renamed "Labels Detectados" to "Elementos Encontrados" and removed redundant "already processed" labels
@@ -15,12 +16,9 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
-import openai
 import pandas as pd
 import requests
 import streamlit as st
-from google.cloud import vision_v1
-from google.protobuf.json_format import MessageToDict
 
 from components.tables import render_labels_table, render_safesearch_table
 from utils.config import LIKELIHOOD_VALUES, YOUTUBE_THUMBNAIL_URL
@@ -30,12 +28,18 @@ from utils.gcs_uploader import (
     upload_vision_results,
 )
 from utils.google_tag_manager import inject_gtm
+from utils.lazy_imports import lazy_module
 from utils.validation import (
     validate_image_size,
     validate_image_url,
     validate_youtube_id,
 )
 
+# Clientes pesados importados só no primeiro uso (ver utils/lazy_imports.py)
+openai = lazy_module("openai")
+vision_v1 = lazy_module("google.cloud.vision_v1")
+json_format = lazy_module("google.protobuf.json_format")
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -70,7 +74,7 @@ def process_image_with_vision_ai(content: bytes) -> dict:
     response = client.annotate_image(request=request)
 
     # Converter resposta para dicionário
-    return MessageToDict(response._pb)
+    return json_format.MessageToDict(response._pb)
 
 
 def fetch_image_from_url(url: str) -> bytes:
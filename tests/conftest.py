@@ -0,0 +1,38 @@
+"""
+Shared pytest setup. Run from the app root:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import pytest
+
+# Page and util modules import each other as top-level packages (utils.*, modules.*)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def loaded():
+    """
+    Register frames like the dataloader does at load (row indexes, facets) under a test key;
+    the registrations are dropped after the test.
+    """
+    from utils import facets, row_index
+
+    keys = []
+
+    def register(key, df):
+        row_index.build_table_indexes(key, df)
+        facets.build_table_facets(key, df)
+        keys.append(key)
+        return df
+
+    yield register
+    for key in keys:
+        with row_index._LOCK:
+            row_index._drop(key)
+        with facets._LOCK:
+            facets._drop(key)
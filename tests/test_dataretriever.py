@@ -0,0 +1,151 @@
+"""
+GCS sync (utils/dataretriever.py) against the directory-backed fake bucket
+(utils/local_gcs.py), offline.
+"""
+
+import os
+
+import pytest
+
+from utils import dataretriever
+from utils.local_gcs import LocalBlob, LocalDirectoryClient
+
+PREFIX = "data/duckdb_mirror/"
+TABLES = ["tbl_nerdalytics", "tbl_slope_full", "tbl_channels_full"]
+
+
+@pytest.fixture
+def bucket_files(tmp_path):
+    """Fake bucket with one Parquet-named object per table, and the sync arguments."""
+    bucket_dir = tmp_path / "gcs" / "bucket" / PREFIX
+    bucket_dir.mkdir(parents=True)
+    for i, table in enumerate(TABLES):
+        (bucket_dir / f"{table}.parquet").write_bytes(f"{table} v1 ".encode() * (1000 + i))
+    bucket = LocalDirectoryClient(str(tmp_path / "gcs")).bucket("bucket")
+    local_dir = tmp_path / "local"
+    objects = [
+        (f"{PREFIX}{table}.parquet", str(local_dir / f"{table}.parquet")) for table in TABLES
+    ]
+    return bucket, objects, str(local_dir)
+
+
+def sync(bucket_files):
+    return dataretriever.sync_objects(*bucket_files)
+
+
+def bucket_path(bucket, name):
+    return os.path.join(bucket.path, *name.split("/"))
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def leftover_temp_files(local_dir):
+    return [name for name in os.listdir(local_dir) if name.endswith(".tmp")]
+
+
+def test_first_sync_downloads_every_file(bucket_files):
+    bucket, objects, local_dir = bucket_files
+    counts = sync(bucket_files)
+    assert counts == {"skipped": 0, "downloaded": len(TABLES), "missing": 0, "error": 0}
+    for name, local_path in objects:
+        assert read(local_path) == read(bucket_path(bucket, name))
+    manifest = dataretriever.read_manifest(local_dir)
+    assert sorted(manifest) == sorted(os.path.basename(path) for _, path in objects)
+    assert not leftover_temp_files(local_dir)
+
+
+def test_second_sync_skips_files_recorded_in_manifest(bucket_files, monkeypatch):
+    sync(bucket_files)
+
+    def no_checksum(*args):
+        raise AssertionError("unchanged files are skipped by the manifest, without reading them")
+
+    monkeypatch.setattr(dataretriever, "_local_checksum", no_checksum)
+    counts = sync(bucket_files)
+    assert counts["downloaded"] == 0 and counts["skipped"] == len(TABLES)
+
+
+def test_sync_without_manifest_skips_files_with_matching_checksum(bucket_files):
+    bucket, objects, local_dir = bucket_files
+    sync(bucket_files)
+    os.remove(os.path.join(local_dir, dataretriever.MANIFEST_FILE))
+    mtimes = [os.stat(path).st_mtime_ns for _, path in objects]
+
+    counts = sync(bucket_files)
+    # Compared by CRC32C (MD5 without google-crc32c) instead of downloaded again
+    assert counts["downloaded"] == 0 and counts["skipped"] == len(TABLES)
+    assert [os.stat(path).st_mtime_ns for _, path in objects] == mtimes
+    assert os.path.exists(os.path.join(local_dir, dataretriever.MANIFEST_FILE))
+
+
+@pytest.mark.parametrize("same_size", [False, True], ids=["new size", "same size"])
+def test_new_generation_is_downloaded_again(bucket_files, same_size):
+    bucket, objects, local_dir = bucket_files
+    sync(bucket_files)
+    name, local_path = objects[0]
+    manifest = dataretriever.read_manifest(local_dir)
+    generation = manifest[os.path.basename(local_path)]["generation"]
+
+    old = read(bucket_path(bucket, name))
+    new = old.replace(b"v1", b"v2") if same_size else old + b"appended"
+    with open(bucket_path(bucket, name), "wb") as f:
+        f.write(new)
+    os.utime(bucket_path(bucket, name), ns=(generation + 10**9, generation + 10**9))
+
+    counts = sync(bucket_files)
+    assert counts["downloaded"] == 1 and counts["skipped"] == len(TABLES) - 1
+    assert read(local_path) == new
+    entry = dataretriever.read_manifest(local_dir)[os.path.basename(local_path)]
+    assert entry["generation"] == generation + 10**9
+
+
+def interrupted_download(blob, filename):
+    """download_to_filename that writes part of the object, then loses the connection."""
+    with open(filename, "wb") as f:
+        f.write(read(blob.path)[:100])
+    raise ConnectionError("connection reset by peer")
+
+
+def test_interrupted_first_download_leaves_no_file(bucket_files, monkeypatch):
+    bucket, objects, local_dir = bucket_files
+    monkeypatch.setattr(LocalBlob, "download_to_filename", interrupted_download)
+
+    counts = sync(bucket_files)
+    assert counts["error"] == len(TABLES) and counts["downloaded"] == 0
+    for _, local_path in objects:
+        assert not os.path.exists(local_path)
+    assert not leftover_temp_files(local_dir)
+    assert dataretriever.read_manifest(local_dir) == {}
+
+
+def test_interrupted_update_keeps_previous_file(bucket_files, monkeypatch):
+    bucket, objects, local_dir = bucket_files
+    sync(bucket_files)
+    name, local_path = objects[0]
+    previous = read(local_path)
+    entry = dataretriever.read_manifest(local_dir)[os.path.basename(local_path)]
+    with open(bucket_path(bucket, name), "ab") as f:
+        f.write(b"new rows")
+
+    monkeypatch.setattr(LocalBlob, "download_to_filename", interrupted_download)
+    counts = sync(bucket_files)
+    assert counts["error"] == 1
+    # The previous complete copy is still in place and still recorded as synced
+    assert read(local_path) == previous
+    assert dataretriever.read_manifest(local_dir)[os.path.basename(local_path)] == entry
+    assert not leftover_temp_files(local_dir)
+
+    monkeypatch.undo()
+    assert sync(bucket_files)["downloaded"] == 1
+    assert read(local_path) == read(bucket_path(bucket, name))
+
+
+def test_missing_object_is_reported(bucket_files):
+    bucket, objects, local_dir = bucket_files
+    missing = f"{PREFIX}tbl_missing.parquet"
+    objects.append((missing, os.path.join(local_dir, "tbl_missing.parquet")))
+    counts = sync(bucket_files)
+    assert counts["missing"] == 1 and counts["downloaded"] == len(TABLES)
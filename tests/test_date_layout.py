@@ -0,0 +1,56 @@
+"""
+Date-window filters (utils/date_layout.py, utils/row_index.py) against the previous per-row
+.dt.date comparison.
+"""
+
+import datetime
+
+import pandas as pd
+import pytest
+
+from benchmarks.dates import dt_date_rows
+from benchmarks.synthetic import prepared_table
+from utils.date_layout import date_range_rows, read_date_range, sort_by_date, write_sorted_parquet
+from utils.row_index import date_index, date_mask
+
+START, END = datetime.date(2024, 1, 1), datetime.date(2024, 12, 31)
+
+
+@pytest.fixture(scope="module")
+def df():
+    df = prepared_table("tbl_nerdalytics", 20_000)
+    df.loc[df.sample(frac=0.01, random_state=0).index, "published_at"] = pd.NaT
+    return df
+
+
+@pytest.fixture(scope="module")
+def expected(df):
+    return dt_date_rows(df, "published_at", START, END).sort_index()
+
+
+def by_video(frame):
+    return frame.sort_values("video_id").reset_index(drop=True)
+
+
+def test_unsorted_table(df, expected):
+    pd.testing.assert_frame_equal(date_range_rows(df, "published_at", START, END), expected)
+
+
+def test_date_sorted_table(df, expected):
+    sorted_df = sort_by_date(df, "published_at")
+    result = date_range_rows(sorted_df, "published_at", START, END)
+    pd.testing.assert_frame_equal(by_video(result), by_video(expected))
+
+
+def test_timestamp_index(df, expected, loaded):
+    loaded(("test_date_layout", None, 0), df)
+    assert date_index(df["published_at"]) is not None
+    pd.testing.assert_frame_equal(df[date_mask(df["published_at"], START, END)], expected)
+
+
+def test_read_date_range(df, expected, tmp_path):
+    path = str(tmp_path / "tbl_nerdalytics.parquet")
+    write_sorted_parquet(df, path, "published_at")
+    window = read_date_range(path, "published_at", START, END)
+    assert len(window) == len(expected)
+    assert sorted(window["video_id"]) == sorted(expected["video_id"])
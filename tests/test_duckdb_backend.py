@@ -0,0 +1,161 @@
+"""
+Parity of the DuckDB backend (utils/duckdb_backend.py) with the pandas implementation.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from utils.duckdb_backend import (  # noqa: E402
+    PREDICATE_OPS,
+    filter_frame,
+    filter_positions,
+    group_aggregate,
+)
+
+
+@pytest.fixture(scope="module")
+def df():
+    """Prepared-table lookalike: categoricals, missing keys, int64/int32 counts, NaT dates."""
+    rng = np.random.default_rng(0)
+    rows = 2_000
+    channels = np.array(["Channel 1", "Channel 2", "Channel 3", None], dtype=object)
+    published_at = pd.Series(
+        pd.Timestamp("2022-01-01") + pd.to_timedelta(rng.integers(0, 900, rows), unit="D")
+    )
+    published_at[rng.random(rows) < 0.05] = pd.NaT
+    score = rng.random(rows) * 100
+    score[rng.random(rows) < 0.05] = np.nan
+    frame = pd.DataFrame(
+        {
+            "video_id": [f"vid{i:05d}" for i in range(rows)],
+            "channel_title": pd.Categorical(
+                rng.choice(channels, rows),
+                categories=["Channel 1", "Channel 2", "Channel 3", "Unused"],
+            ),
+            "video_type": rng.choice(np.array(["Regular", "Shorts", None], dtype=object), rows),
+            "view_count": rng.integers(0, 5_000_000, rows).astype("int64"),
+            "like_count": rng.integers(0, 1_000, rows).astype("int32"),
+            "score": score,
+            "published_at": published_at,
+            "caption": rng.choice([True, False], rows),
+        }
+    )
+    # Non-default index: filtered frames must keep the original labels
+    frame.index = frame.index * 3 + 7
+    return frame
+
+
+# One predicate per operator and column kind (categorical, string, int, float, date, bool)
+PREDICATES = {
+    "in": [
+        ("channel_title", "in", ["Channel 1", "Channel 3"]),
+        ("video_type", "in", ["Shorts"]),
+        ("like_count", "in", [0, 1, 2, 3, 4]),
+    ],
+    "between": [
+        ("view_count", "between", (1_000, 4_000_000)),
+        ("score", "between", (10.0, 60.0)),
+        ("published_at", "between", (pd.Timestamp("2022-06-01"), pd.Timestamp("2023-06-01"))),
+    ],
+    "==": [
+        ("channel_title", "==", "Channel 2"),
+        ("video_type", "==", "Regular"),
+        ("caption", "==", True),
+    ],
+    ">=": [("like_count", ">=", 500), ("published_at", ">=", pd.Timestamp("2023-01-01"))],
+    "<=": [("score", "<=", 25.5), ("view_count", "<=", np.int64(100_000))],
+    "<": [("published_at", "<", pd.Timestamp("2022-03-01")), ("like_count", "<", 10)],
+    ">": [("score", ">", 99.0), ("view_count", ">", 4_900_000)],
+}
+
+AGGREGATIONS = {
+    "views": ("view_count", "sum"),
+    "likes": ("like_count", "sum"),
+    "videos": ("video_id", "nunique"),
+    "scored": ("score", "count"),
+    "avg_score": ("score", "mean"),
+    "first": ("published_at", "min"),
+    "last": ("published_at", "max"),
+}
+
+
+def test_every_operator_is_covered():
+    assert set(PREDICATES) == set(PREDICATE_OPS)
+
+
+@pytest.mark.parametrize("op", PREDICATE_OPS)
+def test_filter_frame_matches_pandas(df, op):
+    for predicate in PREDICATES[op]:
+        expected = filter_frame(df, [predicate], "pandas")
+        assert len(expected), predicate
+        pd.testing.assert_frame_equal(filter_frame(df, [predicate], "duckdb"), expected)
+
+
+def test_combined_predicates_match_pandas(df):
+    predicates = [predicate for op in PREDICATE_OPS for predicate in PREDICATES[op][:1]]
+    predicates = [p for p in predicates if p[1] != "=="] + [("caption", "==", False)]
+    np.testing.assert_array_equal(
+        filter_positions(df, predicates, "duckdb"), filter_positions(df, predicates, "pandas")
+    )
+
+
+def test_empty_in_list_matches_nothing(df):
+    for backend in ("pandas", "duckdb"):
+        result = filter_frame(df, [("channel_title", "in", [])], backend)
+        assert result.empty
+        pd.testing.assert_series_equal(result.dtypes, df.dtypes)
+
+
+def test_no_predicates_returns_every_row(df):
+    np.testing.assert_array_equal(filter_positions(df, [], "duckdb"), np.arange(len(df)))
+
+
+def test_unsupported_operator_raises(df):
+    with pytest.raises(ValueError):
+        filter_frame(df, [("view_count", "!=", 1)], "duckdb")
+
+
+@pytest.mark.parametrize(
+    "by",
+    [["channel_title"], ["video_type"], ["channel_title", "video_type"], ["caption"]],
+    ids=["categorical", "string with nulls", "two keys", "bool"],
+)
+def test_group_aggregate_matches_pandas(df, by):
+    expected = group_aggregate(df, by, AGGREGATIONS, "pandas").reset_index(drop=True)
+    result = group_aggregate(df, by, AGGREGATIONS, "duckdb").reset_index(drop=True)
+    # pandas keeps int32 for int32 sums, DuckDB widens them to int64
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False, rtol=1e-9)
+    for col in by:
+        assert result[col].dtype == df[col].dtype
+    for col in ("views", "likes", "videos", "scored"):
+        assert pd.api.types.is_integer_dtype(result[col].dtype), col
+    assert result["views"].dtype == expected["views"].dtype == "int64"
+
+
+def test_group_aggregate_drops_null_keys(df):
+    result = group_aggregate(df, ["channel_title"], AGGREGATIONS, "duckdb")
+    assert result["channel_title"].notna().all()
+    # Unobserved categories are not returned, like groupby(observed=True)
+    assert "Unused" not in result["channel_title"].tolist()
+    assert result["videos"].sum() == df["channel_title"].notna().sum()
+
+
+def test_group_aggregate_with_predicates_matches_pandas(df):
+    predicates = PREDICATES["between"] + [("channel_title", "in", ["Channel 1", "Channel 2"])]
+    by = ["channel_title", "caption"]
+    pd.testing.assert_frame_equal(
+        group_aggregate(df, by, AGGREGATIONS, "duckdb", predicates).reset_index(drop=True),
+        group_aggregate(df, by, AGGREGATIONS, "pandas", predicates).reset_index(drop=True),
+        check_dtype=False,
+        rtol=1e-9,
+    )
+
+
+def test_group_aggregate_empty_result(df):
+    predicates = [("channel_title", "in", [])]
+    result = group_aggregate(df, ["channel_title"], AGGREGATIONS, "duckdb", predicates)
+    assert result.empty
+    assert list(result.columns) == ["channel_title"] + list(AGGREGATIONS)
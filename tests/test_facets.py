@@ -0,0 +1,42 @@
+"""
+Facet index and catalogue (utils/facets.py) against scans of the table.
+"""
+
+import pytest
+
+from benchmarks.facets import scanned_children
+from benchmarks.synthetic import prepared_table
+from utils.facets import child_counts, child_options
+from utils.filter_manager_v2 import create_filter_config
+
+
+@pytest.fixture
+def playlists(loaded):
+    return loaded(("test_facets", None, 0), prepared_table("tbl_playlist_full_dedup", 5_000))
+
+
+@pytest.mark.parametrize("selected", [1, 5])
+def test_child_options_and_counts(playlists, selected):
+    channels = playlists["playlist_channel_title"].dropna().unique().tolist()[:selected]
+    parent, child = "playlist_channel_title", "playlist_title"
+    assert child_options(playlists, parent, child, channels) == scanned_children(
+        playlists, parent, child, channels
+    )
+    assert child_counts(playlists, parent, child, channels) == scanned_children(
+        playlists, parent, child, channels, counts=True
+    )
+
+
+def test_videos_of_playlist(playlists):
+    playlist = playlists["playlist_title"].iloc[:1].tolist()
+    assert child_options(playlists, "playlist_title", "video_id", playlist) == scanned_children(
+        playlists, "playlist_title", "video_id", playlist
+    )
+
+
+def test_catalogue_options(playlists):
+    for _ in range(2):  # computed on the first call, from the catalogue afterwards
+        config = create_filter_config("tbl_playlist_full_dedup", playlists)
+        assert config["playlist_channel_title"]["options"] == sorted(
+            playlists["playlist_channel_title"].dropna().unique().tolist()
+        )
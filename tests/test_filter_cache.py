@@ -0,0 +1,72 @@
+"""
+Keys of the process-wide filter result cache (utils/filter_cache.py).
+"""
+
+import datetime
+
+import pandas as pd
+
+from benchmarks.filters import BENCH_FILTER_CONFIG
+from benchmarks.synthetic import prepared_table
+from utils.filter_cache import FilterResultCache, filter_cache_key, filter_config_hash
+from utils.filter_plan import FilterPlan
+
+LOAD_KEY = ("tbl_slope_full", None, "v1")
+DF = pd.DataFrame({"video_id": ["a", "b"], "view_count_slope": [1, 2]})
+
+
+def test_selection_order_shares_one_key():
+    config = {"channel_title": {"type": "multiselect"}}
+    first = filter_cache_key(LOAD_KEY, DF, {"channel_title": ["A", "B"]}, None, config)
+    second = filter_cache_key(LOAD_KEY, DF, {"channel_title": ["B", "A"]}, None, config)
+    assert first == second
+
+
+def test_same_state_with_other_definitions_gets_other_keys():
+    state = {"view_count_slope": 10, "published_at": (datetime.date(2024, 1, 1), None)}
+    top_videos = {
+        "view_count_slope": {"type": "top_n", "group_by": "video_id", "latest_by": "slope_date"},
+        "published_at": {"type": "date_range"},
+    }
+    top_channels = {
+        **top_videos,
+        "view_count_slope": {**top_videos["view_count_slope"], "group_by": "channel_title"},
+    }
+    at_least = {**top_videos, "published_at": {"type": "date"}}
+    keys = {
+        filter_cache_key(LOAD_KEY, DF, state, None, config)
+        for config in (top_videos, top_channels, at_least, None)
+    }
+    assert len(keys) == 4
+
+
+def test_config_hash_ignores_labels_options_and_order():
+    config = {
+        "channel_title": {"type": "multiselect", "label": "Channel", "options": ["A", "B"]},
+        "duration": {"type": "range", "min": 0, "max": 600, "extra_params": {"step": 10}},
+    }
+    relabelled = {
+        "duration": {"type": "range", "max": 600, "min": 0, "extra_params": {"step": 10}},
+        "channel_title": {"type": "multiselect", "label": "Canal", "options": ["A"]},
+    }
+    assert filter_config_hash(config) == filter_config_hash(relabelled)
+    stepped = {**config, "duration": {**config["duration"], "max": 3600}}
+    assert filter_config_hash(config) != filter_config_hash(stepped)
+
+
+def test_cached_rows_match_the_plan(loaded):
+    df = loaded(("test_filter_cache", None, 0), prepared_table("tbl_nerdalytics", 5_000))
+    channels = sorted(df["channel_title"].dropna().unique())
+    cache = FilterResultCache(2**20)
+    for year in (2021, 2022, 2023):
+        window = (datetime.date(year, 1, 1), datetime.date(year, 12, 31))
+        state = {"published_at": window, "channel_title": channels[:2]}
+        # Sessions list their selection in any order: the second one is a hit
+        for selected in (channels[:2], channels[1::-1]):
+            filters = {**state, "channel_title": selected}
+            plan = FilterPlan.compile(BENCH_FILTER_CONFIG, filters, df.columns)
+            key = filter_cache_key(LOAD_KEY, df, filters, ["channel_title"], BENCH_FILTER_CONFIG)
+            rows = cache.rows(key, lambda: plan.rows(df))
+            pd.testing.assert_frame_equal(plan.apply(df, rows=rows), plan.apply(df))
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (3, 3)
@@ -0,0 +1,29 @@
+"""
+Range filter bounds (utils/filter_manager_v2.py) on columns without values.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.filter_manager_v2 import default_filter_state, range_bounds
+from utils.filter_plan import FilterPlan
+
+DF = pd.DataFrame({"duration": [np.nan, np.nan], "view_count": [1, 5]})
+CONFIG = {"duration": {"type": "range"}, "view_count": {"type": "range"}}
+
+
+def test_range_bounds_from_column_or_config():
+    assert range_bounds(CONFIG["view_count"], DF["view_count"]) == (1, 5)
+    assert range_bounds({"type": "range", "min": 0, "max": 3}, DF["duration"]) == (0.0, 3.0)
+
+
+def test_all_missing_column_has_no_bounds():
+    assert range_bounds(CONFIG["duration"], DF["duration"]) is None
+    assert range_bounds({"type": "range", "min": 0}, DF["duration"]) is None
+    assert range_bounds(CONFIG["duration"], DF["duration"].iloc[:0]) is None
+
+
+def test_range_without_bounds_is_not_applied():
+    state = default_filter_state(CONFIG, DF)
+    assert state == {"duration": None, "view_count": (1, 5)}
+    pd.testing.assert_frame_equal(FilterPlan.compile(CONFIG, state, DF.columns).apply(DF), DF)
@@ -0,0 +1,61 @@
+"""
+FilterPlan (utils/filter_plan.py) against the filtering it replaced: per-filter slicing of a
+copy (previous apply_filters) and the hand-rolled AI Labs filters.
+"""
+
+import pandas as pd
+import pytest
+
+from benchmarks.filters import (
+    BENCH_FILTER_CONFIG,
+    BENCH_FILTER_STATES,
+    declarative_labs,
+    hand_rolled_labs,
+    labs_filter_states,
+    sliced_filters,
+)
+from benchmarks.synthetic import prepared_table
+from utils.date_layout import sort_by_date
+from utils.dtype_optimizer import drop_unused_categories
+from utils.filter_manager_v2 import create_filter_config
+from utils.filter_plan import FilterPlan
+
+
+@pytest.fixture(scope="module")
+def nerdalytics():
+    return prepared_table("tbl_nerdalytics", 20_000)
+
+
+@pytest.fixture(params=["unsorted", "date-sorted"])
+def layout(request, nerdalytics):
+    if request.param == "unsorted":
+        return nerdalytics.copy()
+    return sort_by_date(nerdalytics, "published_at")
+
+
+def assert_same_rows_as_slicing(df):
+    for filters in BENCH_FILTER_STATES.values():
+        plan = FilterPlan.compile(BENCH_FILTER_CONFIG, filters, df.columns)
+        expected = sliced_filters(df, BENCH_FILTER_CONFIG, filters)
+        pd.testing.assert_frame_equal(plan.apply(df), expected)
+
+
+def test_same_rows_as_slicing(layout):
+    assert_same_rows_as_slicing(layout)
+
+
+def test_same_rows_as_slicing_with_row_indexes(layout, loaded):
+    assert_same_rows_as_slicing(loaded(("test_filter_plan", None, 0), layout))
+
+
+def test_ai_labs_filters(loaded):
+    df = sort_by_date(prepared_table("tbl_slope_full", 5_000), "published_at")
+    loaded(("test_filter_plan_labs", None, 0), df)
+    config = create_filter_config("tbl_slope_full", df)
+    for filters in labs_filter_states(df, config).values():
+        matching, top_n = declarative_labs(df, config, filters)
+        expected_matching, expected_top_n = hand_rolled_labs(df, filters)
+        pd.testing.assert_frame_equal(matching, drop_unused_categories(expected_matching))
+        pd.testing.assert_frame_equal(top_n, drop_unused_categories(expected_top_n))
+        without_top_n = {k: v for k, v in filters.items() if k != "view_count_slope"}
+        assert FilterPlan.compile(config, without_top_n, df.columns).apply(df).equals(matching)
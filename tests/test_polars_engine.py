@@ -0,0 +1,206 @@
+"""
+Parity of the Polars engine (utils/polars_engine.py) with the pandas implementation, on
+frames and through the dataloader entry points (get_user_dataframe, get_user_lazyframe).
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("polars")
+
+from utils import dataloader, polars_engine  # noqa: E402
+from utils.duckdb_backend import filter_frame, group_aggregate  # noqa: E402
+from utils.duckdb_backend import filter_positions as pandas_positions  # noqa: E402
+from utils.polars_engine import (  # noqa: E402
+    filter_positions,
+    lazy_frame,
+    predicate_expr,
+    to_pandas,
+)
+
+PREDICATE_SETS = {
+    "page filter": [
+        ("channel_title", "in", ["Channel 1", "Channel 3", "Channel 5"]),
+        ("published_at", ">=", pd.Timestamp("2022-01-01")),
+        ("published_at", "<", pd.Timestamp("2024-01-01")),
+        ("video_type", "==", "Shorts"),
+        ("view_count", "between", (1_000, 4_000_000)),
+    ],
+    "missing strings": [("default_audio_language", "in", ["en", "pt-BR"])],
+    "bool and int": [("caption", "==", True), ("like_count", ">", 100)],
+    "date between": [
+        ("published_at", "between", (pd.Timestamp("2021-06-01"), pd.Timestamp("2023-06-01")))
+    ],
+    "<= and >": [("comment_count", "<=", 5_000), ("view_count", ">", np.int64(10))],
+    "empty in": [("channel_title", "in", [])],
+}
+
+GROUP_BY = {
+    "categorical": ["channel_title"],
+    "with nulls": ["default_audio_language"],
+    "two keys": ["channel_title", "video_type"],
+}
+
+AGGREGATIONS = {
+    "views": ("view_count", "sum"),
+    "comments": ("comment_count", "sum"),
+    "videos": ("video_id", "nunique"),
+    "languages": ("default_audio_language", "count"),
+    "avg_likes": ("like_count", "mean"),
+    "first": ("published_at", "min"),
+    "last": ("published_at", "max"),
+}
+
+
+def raw_nerdalytics(rows=3_000, seed=0):
+    """tbl_nerdalytics as read from Parquet, before the dataloader preparation."""
+    rng = np.random.default_rng(seed)
+    published_at = pd.Series(
+        pd.Timestamp("2021-01-01") + pd.to_timedelta(rng.integers(0, 1500, rows), unit="D")
+    )
+    published_at[rng.random(rows) < 0.02] = pd.NaT
+    return pd.DataFrame(
+        {
+            "video_id": [f"vid{i:08d}" for i in range(rows)],
+            "channel_id": rng.choice([f"UC{i:04d}" for i in range(8)], rows),
+            "channel_title": rng.choice([f"Channel {i}" for i in range(8)] + ["null"], rows),
+            "title": [f"Video title number {i}" for i in range(rows)],
+            "published_at": published_at,
+            "view_count": rng.integers(0, 5_000_000, rows),
+            "like_count": rng.integers(0, 100_000, rows),
+            "comment_count": rng.integers(0, 10_000, rows),
+            "video_type": rng.choice(["Regular", "Shorts"], rows),
+            "default_audio_language": rng.choice(["pt-BR", "en", "es", "null", "N/A"], rows),
+            "caption": rng.choice([True, False], rows),
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory):
+    """DATA_DIR holding a synthetic tbl_nerdalytics.parquet, served through the dataloader."""
+    root = tmp_path_factory.mktemp("data")
+    path = root / "tbl_nerdalytics.parquet"
+    raw_nerdalytics().to_parquet(path, index=False)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(dataloader, "DATA_DIR", str(root))
+        patch.setattr(dataloader, "SNAPSHOT_DIR", str(root / "snapshots"))
+        patch.setattr(dataloader, "DERIVED_DIR", str(root / "derived"))
+        patch.setitem(dataloader.PARQUET_TABLES, "tbl_nerdalytics", str(path))
+        patch.setattr(dataloader, "USE_DATA_SNAPSHOTS", True)
+        dataloader._load_table_version.clear()
+        yield root
+        dataloader._load_table_version.clear()
+
+
+@pytest.fixture(scope="module")
+def df(data_dir):
+    """Prepared tbl_nerdalytics (types converted, nulls treated, categoricals, date-sorted)."""
+    return dataloader.load_table("tbl_nerdalytics")
+
+
+@pytest.fixture
+def polars_engine_selected(monkeypatch):
+    """DATA_ENGINE=polars for the calls that do not name a backend."""
+    monkeypatch.setattr(polars_engine, "DATA_ENGINE", "polars")
+
+
+def pandas_reference(df, predicates):
+    """Pandas filter of a prepared table, as to_pandas() returns it (NaN for missing strings)."""
+    expected = filter_frame(df, predicates, "pandas").reset_index(drop=True)
+    return expected.apply(lambda s: s.fillna(np.nan) if s.dtype == object else s)
+
+
+def test_prepared_table_has_categoricals(df):
+    # The parity checks below are only meaningful on the optimised dtypes pages get
+    assert isinstance(df["channel_title"].dtype, pd.CategoricalDtype)
+    assert df["channel_title"].isna().any()
+
+
+@pytest.mark.parametrize("name", PREDICATE_SETS)
+def test_filter_positions_matches_pandas(df, name):
+    predicates = PREDICATE_SETS[name]
+    np.testing.assert_array_equal(
+        filter_positions(df, predicates), pandas_positions(df, predicates, "pandas")
+    )
+    pd.testing.assert_frame_equal(
+        filter_frame(df, predicates, "polars"), filter_frame(df, predicates, "pandas")
+    )
+
+
+@pytest.mark.parametrize("by", GROUP_BY)
+@pytest.mark.parametrize("name", ["page filter", "missing strings", "empty in"])
+def test_group_aggregate_matches_pandas(df, by, name):
+    by, predicates = GROUP_BY[by], PREDICATE_SETS[name]
+    expected = group_aggregate(df, by, AGGREGATIONS, "pandas", predicates)
+    result = group_aggregate(df, by, AGGREGATIONS, "polars", predicates)
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True),
+        expected.reset_index(drop=True),
+        check_dtype=False,
+        rtol=1e-9,
+    )
+    for col in by:
+        assert result[col].dtype == df[col].dtype
+    assert result["views"].dtype == "int64"
+
+
+@pytest.mark.parametrize("name", PREDICATE_SETS)
+def test_get_user_dataframe_predicates_match_pandas(df, polars_engine_selected, name):
+    predicates = PREDICATE_SETS[name]
+    pd.testing.assert_frame_equal(
+        dataloader.get_user_dataframe("tbl_nerdalytics", predicates=predicates),
+        filter_frame(df, predicates, "pandas"),
+    )
+
+
+def test_get_user_dataframe_projection_and_predicates(data_dir, polars_engine_selected):
+    columns = ("channel_title", "published_at", "view_count")
+    predicates = PREDICATE_SETS["date between"]
+    projected = dataloader.load_table("tbl_nerdalytics", dataloader.normalize_columns(columns))
+    result = dataloader.get_user_dataframe("tbl_nerdalytics", columns, predicates)
+    assert sorted(result.columns) == sorted(columns)
+    pd.testing.assert_frame_equal(result, filter_frame(projected, predicates, "pandas"))
+
+
+@pytest.mark.parametrize("snapshots", [True, False], ids=["snapshot", "pandas table"])
+@pytest.mark.parametrize("name", ["page filter", "missing strings", "empty in"])
+def test_get_user_lazyframe_matches_pandas(df, monkeypatch, snapshots, name):
+    monkeypatch.setattr(dataloader, "USE_DATA_SNAPSHOTS", snapshots)
+    version = dataloader.table_version("tbl_nerdalytics")
+    snapshot = dataloader.snapshot_path(dataloader.SNAPSHOT_DIR, "tbl_nerdalytics", version)
+    # The full load of the df fixture wrote the snapshot the lazy frame scans
+    assert os.path.exists(snapshot)
+    predicates = PREDICATE_SETS[name]
+    frame = dataloader.get_user_lazyframe("tbl_nerdalytics", predicates=predicates)
+    pd.testing.assert_frame_equal(
+        to_pandas(frame),
+        pandas_reference(df, predicates),
+        check_dtype=False,
+        check_categorical=False,
+    )
+
+
+def test_get_user_lazyframe_projection(df):
+    columns = ["video_id", "view_count", "published_at"]
+    predicates = PREDICATE_SETS["<= and >"][1:]
+    frame = dataloader.get_user_lazyframe("tbl_nerdalytics", columns, predicates)
+    expected = pandas_reference(df, predicates)[columns]
+    pd.testing.assert_frame_equal(to_pandas(frame)[columns], expected, check_dtype=False)
+
+
+def test_lazy_frame_of_pandas_table_matches_snapshot(df, data_dir):
+    version = dataloader.table_version("tbl_nerdalytics")
+    snapshot = dataloader.snapshot_path(dataloader.SNAPSHOT_DIR, "tbl_nerdalytics", version)
+    predicates = PREDICATE_SETS["page filter"]
+    from_snapshot = lazy_frame(df, snapshot=snapshot).filter(predicate_expr(predicates))
+    from_table = lazy_frame(df).filter(predicate_expr(predicates))
+    pd.testing.assert_frame_equal(
+        to_pandas(from_snapshot),
+        to_pandas(from_table),
+        check_dtype=False,
+        check_categorical=False,
+    )
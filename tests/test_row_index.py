@@ -0,0 +1,77 @@
+"""
+Date filters on loaded tables (utils/row_index.py): sortedness is recorded at load, so
+FilterPlan and date_mask never scan a date column to find out.
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import row_index
+from utils.date_layout import sort_by_date
+from utils.filter_plan import FilterPlan
+
+START, END = datetime.date(2023, 1, 1), datetime.date(2023, 6, 30)
+
+
+@pytest.fixture
+def table():
+    rng = np.random.default_rng(0)
+    rows = 5_000
+    published_at = pd.Series(
+        pd.Timestamp("2022-01-01") + pd.to_timedelta(rng.integers(0, 900, rows), unit="D")
+    )
+    published_at[rng.random(rows) < 0.02] = pd.NaT
+    df = pd.DataFrame(
+        {
+            "published_at": published_at,
+            "video_added_at": published_at.sample(frac=1, random_state=0).to_numpy(),
+            "view_count": rng.integers(0, 1_000, rows),
+        }
+    )
+    df = sort_by_date(df, "published_at")
+    row_index.build_table_indexes(("test_row_index", None, "v1"), df)
+    yield df
+    with row_index._LOCK:
+        row_index._drop(("test_row_index", None, "v1"))
+
+
+@pytest.fixture
+def no_scans(monkeypatch):
+    def scan(series):
+        raise AssertionError(f"{series.name} scanned to check its order")
+
+    monkeypatch.setattr(row_index, "is_date_sorted", scan)
+
+
+def expected_mask(series):
+    dates = series.dt.date
+    return (series.notna() & (dates >= START) & (dates <= END)).to_numpy()
+
+
+def test_sortedness_is_recorded_at_load(table, no_scans):
+    view = table.copy(deep=False)
+    assert row_index.date_sorted(view["published_at"])
+    assert not row_index.date_sorted(view["video_added_at"])
+    assert row_index.date_index(view["video_added_at"]) is not None
+
+
+def test_date_filters_do_not_scan_loaded_columns(table, no_scans):
+    view = table.copy(deep=False)
+    for col in ("published_at", "video_added_at"):
+        np.testing.assert_array_equal(
+            row_index.date_mask(view[col], START, END), expected_mask(view[col])
+        )
+        config, state = {col: {"type": "date_range"}}, {col: (START, END)}
+        plan = FilterPlan.compile(config, state, view.columns)
+        pd.testing.assert_frame_equal(plan.apply(view), view[expected_mask(view[col])])
+        assert plan.explain(view)
+
+
+def test_other_frames_are_checked(table):
+    # Not a loaded buffer (filtered copy): the order is checked on the column itself
+    reversed_rows = table.iloc[::-1].reset_index(drop=True).copy()
+    assert not row_index.date_sorted(reversed_rows["published_at"])
+    assert row_index.date_sorted(table["published_at"].dropna().copy())
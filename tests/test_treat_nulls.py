@@ -0,0 +1,14 @@
+"""
+Null-token normalisation (utils/treat_nulls.py) against the previous Series.replace pass.
+"""
+
+import pandas as pd
+
+from benchmarks.loading import replaced_nulls
+from benchmarks.synthetic import make_synthetic_tables
+from utils.treat_nulls import treat_nulls
+
+
+def test_same_frame_as_replace_pass():
+    raw = make_synthetic_tables(5_000)["tbl_nerdalytics"]
+    pd.testing.assert_frame_equal(treat_nulls(raw.copy()), replaced_nulls(raw.copy()))
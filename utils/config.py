@@ -16,6 +16,25 @@ elif env == "PROD":
 else:
     APPMODE = "UNKNOWN"
 
+# Motor de filtros/agregações: "pandas" (padrão) ou "polars" (multithread, ver utils/polars_engine.py)
+DATA_ENGINE = os.getenv("DATA_ENGINE", "pandas").lower()
+
+# Diretório do cache de tabelas derivadas (vazio = <DATA_DIR>/derived, ver utils/dataloader.py)
+DERIVED_CACHE_DIR = os.getenv("DERIVED_CACHE_DIR", "")
+
+# Atualização de dados em segundo plano: intervalo em minutos (0 = desativada, padrão; ver utils/data_refresher.py)
+DATA_REFRESH_MINUTES = int(os.getenv("DATA_REFRESH_MINUTES", "0"))
+
+# Pré-aquecimento das páginas (imports + dados) em segundo plano após o primeiro acesso (PREWARM_PAGES=0 desativa, ver utils/prewarm.py)
+PREWARM_PAGES = os.getenv("PREWARM_PAGES", "1") != "0"
+
+# Cache de resultados de filtros compartilhado entre sessões: limite em MB (ver utils/filter_cache.py)
+FILTER_CACHE_MB = float(os.getenv("FILTER_CACHE_MB", "128"))
+
+# Snapshots Arrow IPC das tabelas preparadas (vazio = <DATA_DIR>/snapshots; USE_DATA_SNAPSHOTS=0 desativa)
+DATA_SNAPSHOT_DIR = os.getenv("DATA_SNAPSHOT_DIR", "")
+USE_DATA_SNAPSHOTS = os.getenv("USE_DATA_SNAPSHOTS", "1") != "0"
+
 # Configurações de cores para SafeSearch
 LOW_RISK_COLOR = "#33FF00"  # Verde para baixo risco (valor 1)
 HIGH_RISK_COLOR = "#FF0066"  # Vermelho para alto risco (valor 5)
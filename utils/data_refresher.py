@@ -0,0 +1,183 @@
+"""
+Background data refresher: brings new data into a running instance without blocking sessions.
+
+One daemon thread per process (get_refresher) wakes up every DATA_REFRESH_MINUTES, or when
+triggered from Debug Tools, and:
+1. syncs the Parquet files from GCS (utils/dataretriever.py, unchanged files are skipped);
+2. compares each table's version on disk with the version served to sessions;
+3. builds the changed tables into the shared load cache, off the hot path: the projections
+   sessions requested since the previous refresh, most recent first, as many as the load
+   cache holds next to the versions still served (the others are built on first use);
+4. publishes all new versions in one atomic swap (dataloader.publish_versions).
+
+Until the swap, reruns keep being served the previous, already built versions.
+
+With DATA_REFRESH_MINUTES=0 (the default) there is no scheduled thread; Debug Tools can
+still run one refresh on demand (get_manual_refresher + refresh_in_background). Versions
+are then not pinned, so new files are served on the next rerun after the sync.
+
+Refreshes never overlap within a process, whichever refresher runs them (_REFRESH_LOCK).
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+
+import streamlit as st
+
+from utils.config import DATA_REFRESH_MINUTES
+from utils.dataloader import (
+    LOAD_CACHE_MAX_ENTRIES,
+    PUBLIC_TABLES,
+    _load_table_version,
+    publish_versions,
+    source_version,
+    table_version,
+    take_requested_projections,
+)
+from utils.dataretriever import main as sync_data
+
+logger = logging.getLogger(__name__)
+
+# Shared by every refresher: two syncs or publish_versions calls must not interleave
+_REFRESH_LOCK = threading.Lock()
+
+
+class DataRefresher:
+    """Daemon thread running refresh() on a schedule or on demand."""
+
+    def __init__(self, interval_seconds: float, sync: Optional[Callable[[], None]] = sync_data):
+        """
+        Args:
+            interval_seconds: Time between two scheduled refreshes
+            sync: Function pulling new files into the data directory (None to only pick up
+                files changed by something else)
+        """
+        self.interval_seconds = interval_seconds
+        self.sync = sync
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.status = {
+            "running": False,
+            "refreshing": False,
+            "last_check": None,
+            "last_swap": None,
+            "last_duration_s": None,
+            "last_error": None,
+            "swaps": 0,
+        }
+
+    def start(self) -> "DataRefresher":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="data-refresher", daemon=True
+            )
+            self._thread.start()
+            self.status["running"] = True
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        self.status["running"] = False
+
+    def trigger(self) -> None:
+        """Ask for a refresh now, without waiting for it (returns immediately)."""
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.interval_seconds)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.refresh()
+
+    def refresh(self) -> Dict[str, str]:
+        """
+        Sync, build the changed tables and publish them (one refresh at a time per process).
+
+        Returns:
+            {table: new version} published by this refresh
+        """
+        with _REFRESH_LOCK:
+            self.status["refreshing"] = True
+            self.status["last_error"] = None
+            start = time.perf_counter()
+            changed = {}
+            try:
+                if self.sync is not None:
+                    try:
+                        self.sync()
+                    except Exception as e:
+                        # Files may still have been updated by other means: keep going
+                        logger.warning(f"Data sync failed: {e}")
+                        self.status["last_error"] = f"sync: {e}"
+
+                for table in PUBLIC_TABLES:
+                    version = source_version(table)
+                    if version != table_version(table):
+                        changed[table] = version
+                # Every requested projection is a live entry of the load cache: rebuilding
+                # more than the free entries would evict versions sessions are using
+                requested = take_requested_projections()
+                budget = max(0, LOAD_CACHE_MAX_ENTRIES - len(requested))
+                rebuild = [(t, c) for t, c in requested if t in changed][:budget]
+                # Registry order builds dependencies before the tables derived from them
+                order = list(PUBLIC_TABLES)
+                for table, columns in sorted(rebuild, key=lambda item: order.index(item[0])):
+                    _load_table_version(table, columns, changed[table])
+
+                if changed:
+                    publish_versions(changed)
+                    self.status["swaps"] += 1
+                    self.status["last_swap"] = datetime.now(timezone.utc).isoformat()
+                    logger.info(f"Published new data versions: {changed}")
+            except Exception as e:
+                logger.exception("Data refresh failed, keeping the current versions")
+                self.status["last_error"] = str(e)
+                changed = {}
+            finally:
+                self.status["refreshing"] = False
+                self.status["last_check"] = datetime.now(timezone.utc).isoformat()
+                self.status["last_duration_s"] = round(time.perf_counter() - start, 2)
+            return changed
+
+
+@st.cache_resource
+def get_refresher() -> Optional[DataRefresher]:
+    """The process-wide refresher, started on first use (None when DATA_REFRESH_MINUTES is 0)."""
+    if DATA_REFRESH_MINUTES <= 0:
+        return None
+    return DataRefresher(DATA_REFRESH_MINUTES * 60).start()
+
+
+_MANUAL_LOCK = threading.Lock()
+
+
+@st.cache_resource
+def get_manual_refresher() -> DataRefresher:
+    """Process-wide refresher that is never scheduled, only run by refresh_in_background."""
+    return DataRefresher(interval_seconds=0)
+
+
+def refresh_in_background(refresher: DataRefresher) -> bool:
+    """
+    Run one refresh in a new daemon thread (returns immediately).
+
+    Returns:
+        False when a refresh is already running (this refresher's or another one's)
+    """
+    with _MANUAL_LOCK:
+        if refresher.status["refreshing"] or _REFRESH_LOCK.locked():
+            return False
+        # Set before the thread starts, so a second click cannot start another one
+        refresher.status["refreshing"] = True
+    threading.Thread(
+        target=refresher.refresh, name="data-refresh-once", daemon=True
+    ).start()
+    return True
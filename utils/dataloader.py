@@ -3,248 +3,881 @@
 # 2025-05-05: Included df_playlist_full_dedup in timestamp and ID column conversion loops for consistency and reliability
 # 2025-05-06: Added deprecation warning for tbl_vw_playlist and aliased it to tbl_playlist_full_dedup for backward compatibility
 # 2025-06-10: Fixed issue with empty dataframes after data source change
+# 2026-10-16: Replaced the monolithic load_base_data with TABLE_REGISTRY + per-table cached loaders (load_table)
+# 2026-10-16: Added column projection (columns=...) from read_parquet_local up to load_data, cached per projection
+# 2026-10-16: get_user_dataframe now returns shared copy-on-write views (no deep copy / pickling); treat_nulls runs once at load
+# 2026-10-16: Added dtype optimisation stage (categoricals, int32 counts, datetime64[ns]) and get_memory_report()
+# 2026-10-16: Null tokens are converted in one vectorised pass at load; counts exposed through get_null_report()
+# 2026-10-16: Derived tables marked "persist" are cached on disk keyed by input content hashes (utils/derived_cache.py); added load_derived()
+# 2026-10-16: Caches keyed by table_version() (file content hashes) instead of ttl="1d"; new data is picked up on the next rerun
+# 2026-10-16: Prepared public tables are snapshotted as Arrow IPC and memory-mapped on later loads (utils/snapshot.py)
+# 2026-10-16: tbl_slope_full can be stored as daily partitions; new partitions are appended to the table in memory
+# 2026-10-16: Tables with "sort_by" are sorted by date at load so date filters cut contiguous slices (utils/date_layout.py)
+# 2026-10-16: With the background refresher (utils/data_refresher.py) sessions are served published versions, swapped atomically
+# 2026-10-16: Added the Polars engine (DATA_ENGINE=polars): predicates= on get_user_dataframe, get_user_lazyframe, load_base_data(lazy=True)
+# 2026-10-16: Row-id indexes of the categorical filter columns are built at load (utils/row_index.py); sizes in get_memory_report()
+# 2026-10-16: Parent -> child option maps of the cascading filters are built at load (utils/facets.py)
 # Mapping of table keys to local Parquet paths
 import logging
-from typing import Tuple, Union
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
 
-from utils.config import APPMODE
+from utils.config import (
+    APPMODE,
+    DATA_REFRESH_MINUTES,
+    DATA_SNAPSHOT_DIR,
+    DERIVED_CACHE_DIR,
+    USE_DATA_SNAPSHOTS,
+)
+from utils.date_layout import sort_by_date
+from utils.derived_cache import cached_derived
+from utils.duckdb_backend import filter_frame
+from utils.dtype_optimizer import optimize_dtypes
+from utils.partitions import list_partitions, partition_columns, read_partitions
+from utils.polars_engine import lazy_frame, predicate_expr
+from utils.facets import build_table_facets, facet_bytes
+from utils.row_index import build_table_indexes, index_bytes
+from utils.snapshot import read_snapshot, snapshot_path, write_snapshot
+from utils.table_versions import MISSING_VERSION, combine_versions, file_version
+from utils.treat_nulls import NULL_TOKENS_ATTR, treat_nulls
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Copy-on-write lets every session share the cached tables: shallow copies share buffers
+# and any in-place change copies only the touched column (default from pandas 3.0 on).
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
 
-def read_parquet_local(file_path: str) -> pd.DataFrame:
+
+if APPMODE == "DEV":
+    # local DevContainer path
+    DATA_DIR = "/app/data"
+else:
+    # remote prod path
+    DATA_DIR = "data"
+
+# Persisted derived tables (see utils/derived_cache.py)
+DERIVED_DIR = DERIVED_CACHE_DIR or os.path.join(DATA_DIR, "derived")
+
+# Memory-mapped snapshots of the prepared public tables (see utils/snapshot.py)
+SNAPSHOT_DIR = DATA_SNAPSHOT_DIR or os.path.join(DATA_DIR, "snapshots")
+
+PARQUET_TABLES = {
+    "tbl_nerdalytics": os.path.join(DATA_DIR, "tbl_nerdalytics.parquet"),
+    "tbl_slope_full": os.path.join(DATA_DIR, "tbl_slope_full.parquet"),
+    "tbl_playlist_full_dedup": os.path.join(DATA_DIR, "tbl_playlist_full_dedup.parquet"),
+    "tbl_analytics_filters": os.path.join(DATA_DIR, "tbl_analytics_filters.parquet"),
+    "tbl_channels": os.path.join(DATA_DIR, "tbl_channels_full.parquet"),
+}
+
+# Timestamp columns converted in every table that goes through _convert_types
+TIMESTAMP_COLUMNS = [
+    "processing_timestamp",
+    "video_processing_timestamp",
+    "video_statistics_processing_timestamp",
+    "videosnippet_processing_timestamp",
+    "video_contentDetails_processing_timestamp",
+    "playlist_item_published_at",
+    "playlist_published_at",
+    "video_added_at",
+    "inserted_at",
+]
+# Columns that need to be string for Arrow/Streamlit serialization issues
+ARROW_STRING_COLUMNS = [
+    "video_processing_timestamp",
+    "video_statistics_processing_timestamp",
+]
+# Columns that should always be strings for ID normalization and consistency
+ID_COLUMNS = [
+    "channel_id",
+    "video_id",
+    "playlist_id",
+    "item_channel_id",
+    "playlist_unique_item_id",
+    "category_id",
+]
+
+
+def read_parquet_local(
+    file_path: str, columns: Optional[Tuple[str, ...]] = None
+) -> pd.DataFrame:
     """
     Reads a local Parquet file using Pandas and returns a DataFrame.
-    This function is cached using Streamlit's @st.cache_data to avoid redundant disk reads.
+    Only `columns` are read when given (pyarrow column projection), so unused
+    wide columns are never decompressed.
+    Not cached itself: its only caller (load_table) already caches the cleaned result,
+    and st.cache_data would keep a second pickled copy of every file.
     """
-    return pd.read_parquet(file_path)
+    return pd.read_parquet(
+        file_path, columns=list(columns) if columns is not None else None
+    )
 
 
-read_parquet_local = st.cache_data(read_parquet_local, ttl="1d")
+def _convert_types(df: pd.DataFrame, date_columns) -> pd.DataFrame:
+    """
+    Standard type conversions applied to a freshly read table.
 
+    Args:
+        df: DataFrame read from Parquet (modified in-place)
+        date_columns: Table-specific columns to convert to datetime first
 
-# Load base data with cache_resource for container-level caching
-@st.cache_resource(ttl="1d")
-def load_base_data():
+    Returns:
+        The converted DataFrame
     """
-    Load all base dataframes with standard preprocessing.
-    Returns a dictionary of clean DataFrames.
+    # Per-table Date/Datetime Conversion (Primary)
+    for col in date_columns:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
 
-    This is cached at the container level and shared across all user sessions.
-    Do NOT modify the returned dataframes directly.
-    """
-    if APPMODE == "DEV":
-        # local DevContainer path
-        PARQUET_TABLES = {
-            "tbl_nerdalytics": "/app/data/tbl_nerdalytics.parquet",
-            "tbl_slope_full": "/app/data/tbl_slope_full.parquet",
-            "tbl_playlist_full_dedup": "/app/data/tbl_playlist_full_dedup.parquet",
-            "tbl_analytics_filters": "/app/data/tbl_analytics_filters.parquet",
-            "tbl_channels": "/app/data/tbl_channels_full.parquet",
-        }
-    else:
-        # remote prod path
-        PARQUET_TABLES = {
-            "tbl_nerdalytics": "data/tbl_nerdalytics.parquet",
-            "tbl_slope_full": "data/tbl_slope_full.parquet",
-            "tbl_playlist_full_dedup": "data/tbl_playlist_full_dedup.parquet",
-            "tbl_analytics_filters": "data/tbl_analytics_filters.parquet",
-            "tbl_channels": "data/tbl_channels_full.parquet",
-        }
+    # Universal Timestamp Conversion (skipping columns already converted above)
+    for col in TIMESTAMP_COLUMNS:
+        if col in df.columns and col not in date_columns:
+            # For columns that might cause Arrow serialization issues, convert to string
+            if col in ARROW_STRING_COLUMNS:
+                df[col] = df[col].astype(str)
+            else:
+                df[col] = pd.to_datetime(df[col], errors="coerce")
 
-    # ------------------------------
-    # SECTION 1: Load all dataframes
-    # ------------------------------
-    df_nerdalytics = read_parquet_local(PARQUET_TABLES["tbl_nerdalytics"])
-    df_slope_full = read_parquet_local(PARQUET_TABLES["tbl_slope_full"])
-    df_playlist_full_dedup = read_parquet_local(
-        PARQUET_TABLES["tbl_playlist_full_dedup"]
-    )
-    df_analytics_filters = read_parquet_local(PARQUET_TABLES["tbl_analytics_filters"])
-    df_channels = read_parquet_local(PARQUET_TABLES["tbl_channels"])
-
-    # ---------------------------------------------------
-    # SECTION 2: Per-DF Date/Datetime Conversion (Primary)
-    # ---------------------------------------------------
-    # df_slope_full: Convert date columns
-    if "slope_date" in df_slope_full.columns:
-        df_slope_full["slope_date"] = pd.to_datetime(
-            df_slope_full["slope_date"], errors="coerce"
-        )
-    if "slope_timestamp" in df_slope_full.columns:
-        df_slope_full["slope_timestamp"] = pd.to_datetime(
-            df_slope_full["slope_timestamp"], errors="coerce"
-        )
-    if "published_at" in df_slope_full.columns:
-        df_slope_full["published_at"] = pd.to_datetime(
-            df_slope_full["published_at"], errors="coerce"
-        )
+    # Ensure all relevant columns are strings (Arrow serialization & ID normalization)
+    for col in set(ARROW_STRING_COLUMNS + ID_COLUMNS):
+        if col in df.columns:
+            df[col] = df[col].astype(str)
 
-    # df_nerdalytics: Convert date columns
-    if "published_at" in df_nerdalytics.columns:
-        df_nerdalytics["published_at"] = pd.to_datetime(
-            df_nerdalytics["published_at"], errors="coerce"
-        )
+    return df
 
-    # df_playlist_full_dedup: Convert date columns
-    if "playlist_item_published_at" in df_playlist_full_dedup.columns:
-        df_playlist_full_dedup["playlist_item_published_at"] = pd.to_datetime(
-            df_playlist_full_dedup["playlist_item_published_at"], errors="coerce"
-        )
-    if "playlist_published_at" in df_playlist_full_dedup.columns:
-        df_playlist_full_dedup["playlist_published_at"] = pd.to_datetime(
-            df_playlist_full_dedup["playlist_published_at"], errors="coerce"
-        )
-    if "video_added_at" in df_playlist_full_dedup.columns:
-        df_playlist_full_dedup["video_added_at"] = pd.to_datetime(
-            df_playlist_full_dedup["video_added_at"], errors="coerce"
-        )
 
-    # ------------------------------------------------------
-    # SECTION 3: Universal Timestamp Conversion (All DFs)
-    # ------------------------------------------------------
-    timestamp_columns = [
-        "processing_timestamp",
-        "video_processing_timestamp",
-        "video_statistics_processing_timestamp",
-        "videosnippet_processing_timestamp",
-        "video_contentDetails_processing_timestamp",
-        "playlist_item_published_at",
-        "playlist_published_at",
-        "video_added_at",
-        "inserted_at",
-    ]
-    for df in [
-        df_nerdalytics,
-        df_slope_full,
-        df_playlist_full_dedup,
-        df_analytics_filters,
-    ]:
-        for col in timestamp_columns:
-            if col in df.columns:
-                # For columns that might cause Arrow serialization issues, convert to string
-                if col in [
-                    "video_processing_timestamp",
-                    "video_statistics_processing_timestamp",
-                ]:
-                    df[col] = df[col].astype(str)
-                else:
-                    df[col] = pd.to_datetime(df[col], errors="coerce")
-
-    # ------------------------------------------------------
-    # SECTION 4: Ensure all relevant columns are strings (Arrow serialization & ID normalization)
-    # ------------------------------------------------------
-    # Columns that need to be string for Arrow/Streamlit serialization issues
-    arrow_string_columns = [
-        "video_processing_timestamp",
-        "video_statistics_processing_timestamp",
-    ]
-    # Columns that should always be strings for ID normalization and consistency
-    id_columns = [
-        "channel_id",
-        "video_id",
-        "playlist_id",
-        "item_channel_id",
-        "playlist_unique_item_id",
-        "category_id",
+# Analytics columns copied from df_nerdalytics into the playlist table (plus all ss_* columns)
+PLAYLIST_ENRICHMENT_COLUMNS = [
+    "view_count",
+    "like_count",
+    "comment_count",
+    "video_type",
+    "duration_formatted_seconds",
+    "category_id",
+    "tags",
+    "default_audio_language",
+]
+
+
+def _playlist_enrichment_columns(names):
+    """Subset of df_nerdalytics column names that _enrich_playlist copies over."""
+    names = list(names)
+    return [col for col in PLAYLIST_ENRICHMENT_COLUMNS if col in names] + [
+        col for col in names if col.startswith("ss_")
     ]
-    # Combine all columns that need to be string
-    all_string_columns = set(arrow_string_columns + id_columns)
-    # Apply .astype(str) to all relevant columns in all DFs
-    for df in [
-        df_nerdalytics,
-        df_slope_full,
-        df_playlist_full_dedup,
-        df_analytics_filters,
-    ]:
-        for col in all_string_columns:
-            if col in df.columns:
-                # Arrow serialization fix or ID normalization
-                df[col] = df[col].astype(str)
 
-    # ------------------------------------------------------
-    # SECTION 6: Data Enrichment (Join Analytics Columns)
-    # ------------------------------------------------------
-    # Enrich df_playlist_full_dedup with selected analytics columns from df_nerdalytics by video_id
+
+def _enrich_playlist(df_playlist_full_dedup, df_nerdalytics):
+    """
+    Enrich the playlist table with selected analytics columns from df_nerdalytics by video_id.
+    Neither input is modified; the merge returns a new DataFrame.
+    """
     # Collect all ss_* columns from df_nerdalytics
-    ss_cols = [col for col in df_nerdalytics.columns if col.startswith("ss_")]
-    cols_to_add = [
-        "view_count",
-        "like_count",
-        "comment_count",
-        "video_type",
-        "duration_formatted_seconds",
-        "category_id",
-        "tags",
-        "default_audio_language",
-    ] + ss_cols
-    # Only add columns not already present in df_playlist_full_dedup
-    cols_missing = [
-        col for col in cols_to_add if col not in df_playlist_full_dedup.columns
-    ]
-    merge_cols = ["video_id"] + [
-        col for col in cols_to_add if col in df_nerdalytics.columns
-    ]
+    cols_to_add = _playlist_enrichment_columns(df_nerdalytics.columns)
+    merge_cols = ["video_id"] + cols_to_add
     if (
         "video_id" in df_playlist_full_dedup.columns
         and "video_id" in df_nerdalytics.columns
     ):
-        df_playlist_full_dedup = df_playlist_full_dedup.merge(
+        return df_playlist_full_dedup.merge(
             df_nerdalytics[merge_cols],
             on="video_id",
             how="left",
             suffixes=("", "_analytics"),
         )
-    # else: if video_id missing, skip enrichment (df_playlist_full_dedup remains unchanged)
-
-    # Return a dictionary of all dataframes
-    return {
-        "tbl_nerdalytics": df_nerdalytics,
-        "tbl_slope_full": df_slope_full,
-        "tbl_playlist_full_dedup": df_playlist_full_dedup,
-        "tbl_analytics_filters": df_analytics_filters,
-        "tbl_channels": df_channels,
-        # "tbl_vw_playlist": df_playlist_full_dedup  # Deprecated alias
+    # if video_id missing, skip enrichment (df_playlist_full_dedup remains unchanged)
+    return df_playlist_full_dedup
+
+
+# Registry of every table the app can load.
+# - "source": key in PARQUET_TABLES read from disk
+# - "date_columns": table-specific datetime columns (see _convert_types)
+# - "convert_types": set False to skip _convert_types entirely
+# - "depends_on" + "build": derived table built from other registry entries
+# - "dependency_columns": per dependency, function narrowing the columns the build keeps
+# - "internal": not exposed to pages and not cached on its own (only feeds derived tables)
+# - "persist": derived table is written to DERIVED_DIR and reused until an input file changes
+# - "partition_column": source may also be a DATA_DIR/<source>/<column>=YYYY-MM-DD/ tree
+#   (see utils/partitions.py); used instead of the single file when present
+# - "sort_by": datetime column the rows are sorted by at load, missing dates first
+#   (see utils/date_layout.py); files and snapshots written from the table inherit the order.
+#   Pages see rows in this order, not the source file order: positional picks (.head(),
+#   .iloc[0], drop_duplicates(keep="first"), ties of sort_values/value_counts) must sort
+#   explicitly when the choice of row matters
+TABLE_REGISTRY = {
+    "tbl_nerdalytics": {
+        "source": "tbl_nerdalytics",
+        "date_columns": ["published_at"],
+        "sort_by": "published_at",
+    },
+    "tbl_slope_full": {
+        "source": "tbl_slope_full",
+        "date_columns": ["slope_date", "slope_timestamp", "published_at"],
+        "partition_column": "slope_date",
+        "sort_by": "slope_date",
+    },
+    "tbl_playlist_raw": {
+        "source": "tbl_playlist_full_dedup",
+        "date_columns": [
+            "playlist_item_published_at",
+            "playlist_published_at",
+            "video_added_at",
+        ],
+        "sort_by": "video_added_at",
+        "internal": True,
+    },
+    # playlist_enriched depends on playlist + nerdalytics
+    "tbl_playlist_full_dedup": {
+        "depends_on": ["tbl_playlist_raw", "tbl_nerdalytics"],
+        "build": _enrich_playlist,
+        "dependency_columns": {"tbl_nerdalytics": _playlist_enrichment_columns},
+        "persist": True,
+        # Already in this order when built from the sorted tbl_playlist_raw (left merge)
+        "sort_by": "video_added_at",
+    },
+    "tbl_analytics_filters": {
+        "source": "tbl_analytics_filters",
+    },
+    "tbl_channels": {
+        "source": "tbl_channels",
+        "convert_types": False,
+    },
+}
+
+PUBLIC_TABLES = [
+    name for name, spec in TABLE_REGISTRY.items() if not spec.get("internal")
+]
+
+# Per loaded (table, projection): memory before/after optimize_dtypes, see get_memory_report()
+MEMORY_REPORT = {}
+
+# Per source table: {column: null tokens converted to NaN at load}, see get_null_report()
+NULL_REPORT = {}
+
+# Per partitioned table: last full table built and the partition versions it contains,
+# so a refresh only reads the partitions added since
+_PARTITION_STATE = {}
+
+# Columns a derived table needs from each dependency regardless of the projection
+JOIN_KEYS = {
+    "tbl_playlist_full_dedup": ["video_id"],
+}
+
+
+def normalize_columns(columns: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    """
+    Canonical, hashable form of a column projection (None means all columns).
+    Used as part of the cache key so equal projections share one cached table.
+    """
+    if columns is None:
+        return None
+    return tuple(sorted(set(columns)))
+
+
+def table_columns(table_name: str) -> List[str]:
+    """
+    List the columns a registry table provides, without loading it.
+    Source tables read the Parquet footer; derived tables union their dependencies.
+    """
+    spec = TABLE_REGISTRY[table_name]
+    if "build" in spec:
+        names = []
+        for dep in spec["depends_on"]:
+            names += [
+                col for col in _dependency_columns(table_name, dep) if col not in names
+            ]
+        return names
+    partitions = _partitions(table_name)
+    if partitions:
+        return partition_columns(partitions, spec["partition_column"])
+    schema = pq.read_schema(PARQUET_TABLES[spec["source"]])
+    return [name for name in schema.names if not name.startswith("__index_level_")]
+
+
+def _dependency_columns(table_name: str, dep: str) -> List[str]:
+    """Columns of dependency `dep` that end up in the derived table `table_name`."""
+    narrow = TABLE_REGISTRY[table_name].get("dependency_columns", {}).get(dep)
+    names = table_columns(dep)
+    return narrow(names) if narrow else names
+
+
+def _project(df: pd.DataFrame, columns: Optional[Tuple[str, ...]]) -> pd.DataFrame:
+    """Keep only the requested columns that exist in df."""
+    if columns is None:
+        return df
+    return df[[col for col in df.columns if col in columns]]
+
+
+def _partitions(table_name: str) -> List[Tuple[str, str]]:
+    """(day, path) partitions of a partitioned source table, [] when stored as one file."""
+    spec = TABLE_REGISTRY[table_name]
+    if "partition_column" not in spec:
+        return []
+    root = os.path.join(DATA_DIR, spec["source"])
+    return list_partitions(root, spec["partition_column"])
+
+
+def source_files(table_name: str) -> List[str]:
+    """Parquet files a registry table is read or derived from."""
+    spec = TABLE_REGISTRY[table_name]
+    if "build" not in spec:
+        partitions = _partitions(table_name)
+        if partitions:
+            return [path for _, path in partitions]
+        return [PARQUET_TABLES[spec["source"]]]
+    files = []
+    for dep in spec["depends_on"]:
+        files += [path for path in source_files(dep) if path not in files]
+    return files
+
+
+def _load_dependencies(
+    table_name: str, columns: Optional[Tuple[str, ...]]
+) -> List[pd.DataFrame]:
+    """Load the dependencies of a derived table, projected to what `columns` needs."""
+    spec = TABLE_REGISTRY[table_name]
+    dependencies = []
+    for dep in spec["depends_on"]:
+        dep_columns = None
+        if columns is not None:
+            available = _dependency_columns(table_name, dep)
+            dep_columns = normalize_columns(
+                [col for col in columns if col in available]
+                + JOIN_KEYS.get(table_name, [])
+            )
+        if TABLE_REGISTRY[dep].get("internal"):
+            dependencies.append(_build_table(dep, dep_columns))
+        else:
+            # Same file versions as the table being built, even before they are published
+            dependencies.append(
+                _load_table_version(dep, dep_columns, source_version(dep))
+            )
+    return dependencies
+
+
+class StaleVersionError(RuntimeError):
+    """The files of a table version were replaced on disk and it has no snapshot to build from."""
+
+
+def _build_table(
+    table_name: str,
+    columns: Optional[Tuple[str, ...]] = None,
+    version: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Build a registry table (uncached).
+
+    Public tables are memory-mapped from their Arrow snapshot when one exists for the
+    version; otherwise they are prepared from Parquet and, when built in full, snapshotted
+    for the next load.
+
+    Args:
+        version: Version to build (defaults to the files on disk). A version whose files
+            were replaced is only built from its snapshot, else StaleVersionError is raised:
+            the Parquet files on disk would be cached under the old version.
+    """
+    spec = TABLE_REGISTRY[table_name]
+    on_disk = source_version(table_name)
+    if version is None:
+        version = on_disk
+    snapshot_version = None
+    if USE_DATA_SNAPSHOTS and not spec.get("internal"):
+        snapshot_version = version
+        path = snapshot_path(SNAPSHOT_DIR, table_name, snapshot_version)
+        if os.path.exists(path):
+            try:
+                df, null_tokens = read_snapshot(path, columns)
+                NULL_REPORT.setdefault(table_name, {}).update(null_tokens)
+                logger.info(f"Loaded '{table_name}' from snapshot {path}")
+                df = _sort_rows(table_name, _optimize(table_name, columns, df))
+                _remember_partitions(table_name, columns, df)
+                return df
+            except Exception as e:
+                logger.warning(f"Unreadable snapshot {path}, reading Parquet: {e}")
+
+    if version != on_disk:
+        raise StaleVersionError(
+            f"'{table_name}' version {version} was replaced on disk by {on_disk}"
+        )
+    df = _optimize(table_name, columns, _prepare_table(table_name, columns))
+    df = _sort_rows(table_name, df)
+    _remember_partitions(table_name, columns, df)
+
+    if snapshot_version is not None and columns is None:
+        try:
+            write_snapshot(
+                df,
+                SNAPSHOT_DIR,
+                table_name,
+                snapshot_version,
+                null_tokens=NULL_REPORT.get(table_name),
+            )
+        except Exception as e:
+            # A read-only or full disk must not break the page, only the next cold start
+            logger.warning(f"Could not write snapshot for '{table_name}': {e}")
+    return df
+
+
+def _prepare_table(
+    table_name: str, columns: Optional[Tuple[str, ...]] = None
+) -> pd.DataFrame:
+    """Prepare a registry table from its Parquet source or from its dependencies."""
+    spec = TABLE_REGISTRY[table_name]
+    if "build" in spec:
+        if spec.get("persist"):
+            # Full table built once per input version; projections are read from the cache file
+            inputs = source_files(table_name)
+            return cached_derived(
+                table_name,
+                inputs=inputs,
+                build=lambda: spec["build"](*_load_dependencies(table_name, None)),
+                cache_dir=DERIVED_DIR,
+                columns=columns,
+                input_hashes=[file_version(path) for path in inputs],
+            )
+        dependencies = _load_dependencies(table_name, columns)
+        return _project(spec["build"](*dependencies), columns)
+
+    if columns is not None:
+        # Skip requested columns that belong to other tables (e.g. enrichment columns)
+        available = table_columns(table_name)
+        columns = tuple(col for col in columns if col in available)
+
+    partitions = _partitions(table_name)
+    if partitions:
+        return _prepare_partitions(table_name, columns, partitions)
+
+    df = read_parquet_local(PARQUET_TABLES[spec["source"]], columns)
+    df = _clean(table_name, df)
+    NULL_REPORT.setdefault(table_name, {}).update(df.attrs.pop(NULL_TOKENS_ATTR, {}))
+    return df
+
+
+def _clean(table_name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Type conversion and null treatment of a freshly read source table."""
+    spec = TABLE_REGISTRY[table_name]
+    if spec.get("convert_types", True):
+        df = _convert_types(df, spec.get("date_columns", []))
+    # Treat null values in string columns once per load instead of per session copy
+    return treat_nulls(df)
+
+
+def _prepare_partitions(
+    table_name: str,
+    columns: Optional[Tuple[str, ...]],
+    partitions: List[Tuple[str, str]],
+) -> pd.DataFrame:
+    """
+    Read a partitioned source table. A full load that extends the previous full load
+    (same partitions unchanged, new ones added) only reads and cleans the new partitions.
+    """
+    partition_column = TABLE_REGISTRY[table_name]["partition_column"]
+    previous = _PARTITION_STATE.get(table_name) if columns is None else None
+    if previous is not None:
+        current = {path: file_version(path) for _, path in partitions}
+        unchanged = all(
+            current.get(path) == version
+            for path, version in previous["versions"].items()
+        )
+        if unchanged:
+            new = [(day, path) for day, path in partitions if path not in previous["versions"]]
+            logger.info(
+                f"Appending {len(new)} new partition(s) to '{table_name}' ({len(previous['df'])} rows)"
+            )
+            if not new:
+                return previous["df"]
+            df_new = _clean(table_name, read_partitions(new, partition_column))
+            counts = df_new.attrs.pop(NULL_TOKENS_ATTR, {})
+            report = NULL_REPORT.setdefault(table_name, {})
+            for col, count in counts.items():
+                report[col] = report.get(col, 0) + count
+            return append_rows(previous["df"], optimize_dtypes(df_new))
+
+    df = _clean(table_name, read_partitions(partitions, partition_column, columns))
+    NULL_REPORT.setdefault(table_name, {}).update(df.attrs.pop(NULL_TOKENS_ATTR, {}))
+    return df
+
+
+def _remember_partitions(
+    table_name: str, columns: Optional[Tuple[str, ...]], df: pd.DataFrame
+) -> None:
+    """Keep the full build of a partitioned table as the base of the next incremental refresh."""
+    if columns is not None:
+        return
+    partitions = _partitions(table_name)
+    if partitions:
+        _PARTITION_STATE[table_name] = {
+            "versions": {path: file_version(path) for _, path in partitions},
+            "df": df,
+        }
+
+
+def _sort_rows(table_name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Order a built table by its registry "sort_by" column (no-op when already sorted)."""
+    column = TABLE_REGISTRY[table_name].get("sort_by")
+    return sort_by_date(df, column) if column else df
+
+
+def append_rows(df: pd.DataFrame, df_new: pd.DataFrame) -> pd.DataFrame:
+    """
+    Concatenate new rows to a prepared table, keeping categorical columns categorical
+    (categories are unioned instead of falling back to object).
+    """
+    df_new = df_new.reindex(columns=df.columns)
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            new_values = df_new[col].astype("category")
+            extra = new_values.cat.categories.difference(df[col].cat.categories)
+            if len(extra):
+                df = df.assign(**{col: df[col].cat.add_categories(extra)})
+            df_new[col] = new_values.cat.set_categories(df[col].cat.categories)
+    return pd.concat([df, df_new], ignore_index=True)
+
+
+def _optimize(
+    table_name: str, columns: Optional[Tuple[str, ...]], df: pd.DataFrame
+) -> pd.DataFrame:
+    """Run optimize_dtypes on a freshly built table and record its memory footprint."""
+    before = df.memory_usage(deep=True).sum()
+    df = optimize_dtypes(df)
+    after = df.memory_usage(deep=True).sum()
+    MEMORY_REPORT[(table_name, columns)] = {
+        "table": table_name,
+        "columns": "all" if columns is None else len(columns),
+        "rows": len(df),
+        "before_mb": before / 2**20,
+        "after_mb": after / 2**20,
     }
+    return df
+
+
+def get_memory_report() -> pd.DataFrame:
+    """
+    Memory footprint (memory_usage(deep=True)) of every table loaded in this process,
+    before and after the dtype optimisation stage, and of its row-id indexes
+    (utils/row_index.py).
+    """
+    report = pd.DataFrame(
+        list(MEMORY_REPORT.values()),
+        columns=["table", "columns", "rows", "before_mb", "after_mb", "index_mb"],
+    )
+    report["index_mb"] = report["index_mb"].fillna(0.0)
+    report["saved_pct"] = (1 - report["after_mb"] / report["before_mb"]) * 100
+    return report.round(2)
+
+
+def get_null_report(table_name: str) -> pd.DataFrame:
+    """
+    Null tokens ("null", "N/A", "", ...) converted to NaN per column when table_name was loaded.
+    Derived tables report the conversions of their dependencies.
+    """
+    counts = {}
+    spec = TABLE_REGISTRY.get(table_name, {})
+    for name in spec.get("depends_on", [table_name]):
+        for col, count in NULL_REPORT.get(name, {}).items():
+            counts[col] = counts.get(col, 0) + count
+    if "build" in spec:
+        available = table_columns(table_name)
+        counts = {col: count for col, count in counts.items() if col in available}
+    return pd.DataFrame(
+        {"Column": list(counts), "Tokens Converted": list(counts.values())}
+    )
+
+
+# Caches are keyed by content version, not time: entries of replaced files are evicted
+# once max_entries is reached (one entry per table x projection x version).
+LOAD_CACHE_MAX_ENTRIES = 32
+
+
+def source_version(table_name: str) -> str:
+    """
+    Content version of a registry table on disk: changes when any Parquet file it is read
+    or derived from changes.
+    """
+    if table_name not in TABLE_REGISTRY:
+        return MISSING_VERSION
+    return combine_versions(file_version(path) for path in source_files(table_name))
+
+
+# Versions served to sessions while the background refresher runs (DATA_REFRESH_MINUTES > 0).
+# Replaced as a whole by publish_versions, so a rerun sees either every old or every new version.
+_PUBLISHED_VERSIONS = {}
+_PUBLISH_LOCK = threading.Lock()
+
+# (table, projection) requested since the last refresh, most recent last: the refresher
+# rebuilds them (within the load cache budget) before a new version is published
+REQUESTED_PROJECTIONS = OrderedDict()
+_REQUESTED_LOCK = threading.Lock()
+
+
+def take_requested_projections() -> List[Tuple[str, Optional[Tuple[str, ...]]]]:
+    """(table, projection) requested since the previous call, most recent first."""
+    with _REQUESTED_LOCK:
+        requested = list(reversed(REQUESTED_PROJECTIONS))
+        REQUESTED_PROJECTIONS.clear()
+    return requested
+
+
+def table_version(table_name: str) -> str:
+    """
+    Version of a registry table served to sessions, so derived tables and filtered views
+    keyed by it follow their inputs.
+
+    Without the refresher this is source_version(): new files are picked up (and built) on
+    the next rerun. With the refresher a table keeps its first-seen version until
+    publish_versions() swaps in a version that is already built.
+    """
+    global _PUBLISHED_VERSIONS
+    if DATA_REFRESH_MINUTES <= 0 or table_name not in TABLE_REGISTRY:
+        return source_version(table_name)
+    version = _PUBLISHED_VERSIONS.get(table_name)
+    if version is None:
+        with _PUBLISH_LOCK:
+            version = _PUBLISHED_VERSIONS.get(table_name)
+            if version is None:
+                version = source_version(table_name)
+                _PUBLISHED_VERSIONS = {**_PUBLISHED_VERSIONS, table_name: version}
+    return version
+
+
+def publish_versions(versions: dict) -> None:
+    """Atomically make {table: version} the versions served to sessions."""
+    global _PUBLISHED_VERSIONS
+    with _PUBLISH_LOCK:
+        _PUBLISHED_VERSIONS = {**_PUBLISHED_VERSIONS, **versions}
+
+
+def published_versions() -> dict:
+    """Versions currently served to sessions ({} without the refresher)."""
+    return dict(_PUBLISHED_VERSIONS)
+
+
+# Per-table loader with cache_resource for container-level caching
+@st.cache_resource(max_entries=LOAD_CACHE_MAX_ENTRIES)
+def _load_table_version(
+    table_name: str, columns: Optional[Tuple[str, ...]], version: str
+) -> pd.DataFrame:
+    logger.info(
+        f"Loading table '{table_name}' (columns={columns or 'all'}, version={version})"
+    )
+    df = _build_table(table_name, columns, version)
+    # Row-id indexes of the categorical filter columns, found again from session views
+    build_table_indexes((table_name, columns, version), df)
+    # Parent -> child option maps of the cascading filters
+    build_table_facets((table_name, columns, version), df)
+    report = MEMORY_REPORT.get((table_name, columns))
+    if report is not None:
+        key = (table_name, columns, version)
+        report["index_mb"] = (index_bytes(key) + facet_bytes(key)) / 2**20
+    return df
+
+
+def load_table(
+    table_name: str, columns: Optional[Tuple[str, ...]] = None
+) -> pd.DataFrame:
+    """
+    Load a single clean table from TABLE_REGISTRY, building its dependencies first.
+
+    This is cached at the container level per (table, projection, table_version) and shared
+    across all user sessions, so a page only pays for the tables and columns it touches and
+    gets new data as soon as the underlying files change (or, with the background
+    refresher, as soon as the new version is built and published).
+    Do NOT modify the returned dataframe directly.
 
+    Args:
+        table_name: Key in TABLE_REGISTRY
+        columns: Normalized projection (see normalize_columns), None for all columns
+    """
+    with _REQUESTED_LOCK:
+        REQUESTED_PROJECTIONS[(table_name, columns)] = None
+        REQUESTED_PROJECTIONS.move_to_end((table_name, columns))
+    try:
+        return _load_table_version(table_name, columns, table_version(table_name))
+    except StaleVersionError as e:
+        # The served version can no longer be built (files replaced before the refresher
+        # published them, projection not built yet): serve the version on disk from now on
+        logger.warning(f"{e}; publishing the version on disk")
+        version = source_version(table_name)
+        publish_versions({table_name: version})
+        return _load_table_version(table_name, columns, version)
+
+
+def load_key(table_name: str, columns: Optional[Iterable[str]] = None) -> Tuple:
+    """
+    (table, projection, table_version) of the frame load_table / load_data currently serve:
+    the key of its row indexes and of its entries in the filter cache (utils/filter_cache.py).
+    """
+    return (table_name, normalize_columns(columns), table_version(table_name))
+
+
+def load_base_data(lazy: bool = False):
+    """
+    Load all public base dataframes.
+    Returns a dictionary of clean DataFrames (Polars LazyFrames when lazy=True,
+    see get_user_lazyframe).
+
+    Kept for backward compatibility: this loads EVERY table, prefer load_data(name)
+    so pages only load what they use. Do NOT modify the returned dataframes directly.
+    """
+    if lazy:
+        return {name: get_user_lazyframe(name) for name in PUBLIC_TABLES}
+    return {name: load_table(name) for name in PUBLIC_TABLES}
+
+
+@st.cache_resource(max_entries=LOAD_CACHE_MAX_ENTRIES)
+def _load_derived_version(
+    name: str,
+    _build: Callable[..., pd.DataFrame],
+    tables: Tuple[str, ...],
+    columns: Optional[Tuple[str, ...]],
+    version: str,
+) -> pd.DataFrame:
+    inputs = []
+    for table in tables:
+        inputs += [path for path in source_files(table) if path not in inputs]
+    if version != combine_versions(source_version(table) for table in tables):
+        # Inputs replaced on disk but not published yet: build from the served tables,
+        # without persisting them under the hashes of the new files
+        return _project(_build(*[load_table(table) for table in tables]), columns)
+    return cached_derived(
+        name,
+        inputs=inputs,
+        build=lambda: _build(*[load_table(table) for table in tables]),
+        cache_dir=DERIVED_DIR,
+        columns=columns,
+        input_hashes=[file_version(path) for path in inputs],
+    )
+
+
+def load_derived(
+    name: str,
+    build: Callable[..., pd.DataFrame],
+    tables: Iterable[str],
+    columns: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """
+    Page-level derived table persisted on disk (see utils/derived_cache.py).
+
+    `build` receives the full registry tables named in `tables` and returns the derived
+    DataFrame. It only runs when no cached file matches the current content of the input
+    Parquet files; otherwise the cached file is read. Cached per container like load_table.
+    Do NOT modify the returned dataframe directly; wrap it with shared_view().
+
+    Args:
+        name: Unique name of the derived table
+        build: Build function
+        tables: Registry tables the build reads
+        columns: Optional column projection
+    """
+    tables = tuple(tables)
+    version = combine_versions(table_version(table) for table in tables)
+    return _load_derived_version(
+        name, build, tables, normalize_columns(columns), version
+    )
 
-# Import the treat_nulls function
-from utils.treat_nulls import treat_nulls
 
+def shared_view(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Zero-copy, copy-on-write view of a cached table.
+
+    The view shares every column buffer with the cached table. Writing to it (assigning a
+    column, .loc updates, inplace methods) copies only what is touched, so the shared
+    table can never be modified by a page. Numpy arrays taken from it are read-only.
+    """
+    return df.copy(deep=False)
+
+
+def derive(df: pd.DataFrame, **columns) -> pd.DataFrame:
+    """
+    Explicit way to add or replace columns on a shared view.
 
-@st.cache_data(ttl="15m")
-def get_user_dataframe(df_name):
+    Same semantics as DataFrame.assign (values or callables taking the frame); the result
+    shares every untouched column with df.
     """
-    Get a user-specific copy of a base dataframe for filtering and manipulation.
-    Also treats null values in string columns by converting string representations
-    like "null", "N/A", etc. to actual np.nan values.
+    return df.assign(**columns)
+
+
+def get_user_dataframe(
+    df_name,
+    columns: Optional[Tuple[str, ...]] = None,
+    predicates: Optional[List[Tuple]] = None,
+):
+    """
+    Get a session view of a base dataframe for filtering and manipulation.
+    Null tokens ("null", "N/A", ...) are already treated at load time.
+
+    No deep copy and no st.cache_data pickling: the view costs O(columns), not O(rows),
+    on every rerun. Mutations copy-on-write, see shared_view() and derive().
 
     Args:
         df_name: Name of the dataframe to retrieve
+        columns: Optional column projection, None for all columns
+        predicates: Optional row filter, (column, op, value) tuples evaluated by DATA_ENGINE
+            (see utils/duckdb_backend.py)
 
     Returns:
-        A copy of the requested dataframe that can be safely modified with nulls treated
+        A copy-on-write view of the requested dataframe
     """
-    base_dfs = load_base_data()
-    if df_name not in base_dfs:
+    if df_name not in PUBLIC_TABLES:
         logger.warning(f"Requested dataframe '{df_name}' not found in base data")
         return None
 
-    # Get a copy that can be safely modified
-    df_copy = base_dfs[df_name].copy()
+    df = shared_view(load_table(df_name, normalize_columns(columns)))
+    if predicates:
+        df = filter_frame(df, predicates)
+    return df
+
 
-    # Treat null values in string columns
-    df_copy = treat_nulls(df_copy)
+def get_user_lazyframe(
+    df_name,
+    columns: Optional[Iterable[str]] = None,
+    predicates: Optional[List[Tuple]] = None,
+):
+    """
+    Polars LazyFrame over a base dataframe (requires polars, see utils/polars_engine.py).
+
+    Reads the selected columns of the memory-mapped snapshot of the current table version
+    when there is one (no pandas table is built); otherwise wraps the cached pandas table.
+    Convert with polars_engine.to_pandas() only where pandas is needed.
+
+    Args:
+        df_name: Name of the dataframe to retrieve
+        columns: Optional column projection, None for all columns
+        predicates: Optional row filter, (column, op, value) tuples
 
-    return df_copy
+    Returns:
+        pl.LazyFrame, or None for an unknown table
+    """
+    if df_name not in PUBLIC_TABLES:
+        logger.warning(f"Requested dataframe '{df_name}' not found in base data")
+        return None
+
+    columns = normalize_columns(columns)
+    snapshot = None
+    if USE_DATA_SNAPSHOTS:
+        path = snapshot_path(SNAPSHOT_DIR, df_name, table_version(df_name))
+        snapshot = path if os.path.exists(path) else None
+    # Without a snapshot the pandas table is loaded (and cached) as usual
+    frame = lazy_frame(
+        None if snapshot else load_table(df_name, columns),
+        snapshot=snapshot,
+        columns=columns,
+    )
+    if predicates:
+        frame = frame.filter(predicate_expr(predicates))
+    return frame
 
 
 def load_data(
     dfname: str,
+    columns: Optional[Iterable[str]] = None,
 ) -> Union[
     pd.DataFrame,
     Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame],
@@ -254,9 +887,11 @@ def load_data(
 
     Args:
         dfname: Name of the dataset to load
+        columns: Columns the page needs (e.g. from page_columns(PAGE_BLOCKS, dfname)).
+            None loads every column.
 
     Returns:
         Either a single DataFrame or a tuple of DataFrames depending on the dfname
     """
     # Get the user-specific copy of the requested dataframe
-    return get_user_dataframe(dfname)
+    return get_user_dataframe(dfname, normalize_columns(columns))
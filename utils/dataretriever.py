@@ -7,6 +7,8 @@
 # 2025-04-29: Refactored to expose main() for import/run flexibility, supporting Streamlit and CLI use.
 # 2025-04-29: Made config import robust for local, production, and terminal use (tries utils.config, then env, then fallback).
 # 2025-05-07: Updated playlist data references to use tbl_playlist_full_dedup instead of tbl_vw_playlistfull
+# 2026-10-16: Added sync_partitions() for date-partitioned tables (only partitions missing locally are downloaded)
+# 2026-10-16: Concurrent sync: unchanged files skipped (generation/CRC32C/MD5), temp file + rename, local manifest; GCS_FAKE_DIR for offline runs
 
 """
 Script to download specific parquet files from Google Cloud Storage (GCS) to a local directory using Application Default Credentials (ADC).
@@ -22,8 +24,13 @@ Steps:
    - gs://yta_mdm_production/data/duckdb_mirror/tbl_playlist_full_dedup.parquet
 """
 
+import base64
+import datetime
+import hashlib
+import json
 import os
-from google.cloud import storage
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Try to import project ID from utils.config, then config, then environment
 try:
@@ -60,37 +67,244 @@ PROMPT_PARQUET_FILES = [
 # "data/duckdb_mirror/tbl_playlists.parquet",
 # data/duckdb_mirror/tbl_analytics_filters
 
+# Date-partitioned tables (<prefix>slope_date=YYYY-MM-DD/part.parquet), see utils/partitions.py.
+# Synced incrementally; the single-file copy above is still used while the bucket has no partitions.
+PROMPT_PARTITIONED_PREFIXES = [
+    "data/duckdb_mirror/tbl_slope_full/",
+]
+
 LOCAL_DATA_DIR = os.environ.get("LOCAL_DATA_DIR", "/app/data")
 
+# Concurrent downloads (each file is a separate HTTP stream)
+SYNC_WORKERS = int(os.environ.get("GCS_SYNC_WORKERS", "8"))
+
+# Versions of the synced files, kept in the local data directory
+MANIFEST_FILE = ".gcs_manifest.json"
+
+
+def get_storage_client():
+    """
+    GCS client using ADC, or a local directory-backed fake when GCS_FAKE_DIR is set
+    (utils/local_gcs.py, for running the sync offline).
+    """
+    fake_root = os.environ.get("GCS_FAKE_DIR")
+    if fake_root:
+        try:
+            from utils.local_gcs import LocalDirectoryClient
+        except ImportError:
+            from local_gcs import LocalDirectoryClient
+        return LocalDirectoryClient(fake_root)
+    from google.cloud import storage
+
+    return storage.Client(project=GCP_PROJECT_ID)
+
+
+def read_manifest(local_dir):
+    """
+    Sync manifest of local_dir: {path relative to local_dir: {"blob", "generation", "size",
+    "md5_hash", "crc32c", "mtime_ns", "synced_at"}}. Empty when missing or unreadable.
+    """
+    try:
+        with open(os.path.join(local_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(local_dir, manifest):
+    """Write the manifest atomically (temp file + rename)."""
+    fd, tmp_path = tempfile.mkstemp(dir=local_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, os.path.join(local_dir, MANIFEST_FILE))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _local_checksum(path, crc32c):
+    """Base64 CRC32C (crc32c=True, needs google-crc32c) or MD5 of a local file, like GCS reports."""
+    if crc32c:
+        import google_crc32c
+
+        digest = google_crc32c.Checksum()
+    else:
+        digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(8 * 2**20), b""):
+            digest.update(chunk)
+    return base64.b64encode(digest.digest()).decode("ascii")
+
+
+def _crc32c_available():
+    try:
+        import google_crc32c  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def is_up_to_date(blob, local_path, entry):
+    """
+    True when local_path already holds the content of blob:
+    - same generation as recorded in the manifest and the file untouched since (no read), or
+    - same size and same CRC32C (or MD5 when CRC32C is unavailable) as the blob.
+    """
+    try:
+        stat = os.stat(local_path)
+    except FileNotFoundError:
+        return False
+    if (
+        entry
+        and str(entry.get("generation")) == str(blob.generation)
+        and entry.get("size") == stat.st_size
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        return True
+    if blob.size is not None and blob.size != stat.st_size:
+        return False
+    if blob.crc32c and _crc32c_available():
+        return _local_checksum(local_path, crc32c=True) == blob.crc32c
+    if blob.md5_hash:
+        return _local_checksum(local_path, crc32c=False) == blob.md5_hash
+    return False
+
+
+def _download_atomic(blob, local_path):
+    """Download blob to a temporary file next to local_path, then rename it into place."""
+    directory = os.path.dirname(local_path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        blob.download_to_filename(tmp_path)
+        # Rename so the dataloader never sees a half-written file
+        os.replace(tmp_path, local_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _sync_one(bucket, blob, local_path, entry):
+    """
+    Sync one object (a Blob with metadata, or an object name to look up).
+    Returns (status, manifest entry) with status "skipped", "downloaded", "missing" or "error".
+    """
+    name = blob if isinstance(blob, str) else blob.name
+    uri = f"gs://{bucket.name}/{name}"
+    try:
+        if isinstance(blob, str):
+            blob = bucket.get_blob(name)
+            if blob is None:
+                print(f"ERROR: Could not download {uri}: object not found")
+                return "missing", None
+        if is_up_to_date(blob, local_path, entry):
+            status = "skipped"
+        else:
+            print(f"Downloading {uri} to {local_path} ...")
+            _download_atomic(blob, local_path)
+            status = "downloaded"
+        stat = os.stat(local_path)
+        return status, {
+            "blob": uri,
+            "generation": blob.generation,
+            "size": stat.st_size,
+            "md5_hash": blob.md5_hash,
+            "crc32c": blob.crc32c,
+            "mtime_ns": stat.st_mtime_ns,
+            "synced_at": (
+                entry.get("synced_at")
+                if status == "skipped" and entry
+                else datetime.datetime.now(datetime.timezone.utc).isoformat()
+            ),
+        }
+    except Exception as e:
+        print(f"ERROR: Could not download {uri}: {e}")
+        return "error", None
+
+
+def sync_objects(bucket, objects, local_dir):
+    """
+    Sync (blob or object name, local path) pairs concurrently into local_dir, skipping files
+    that are already up to date, and record their versions in the manifest.
+
+    Returns:
+        {status: count} with the statuses of _sync_one
+    """
+    os.makedirs(local_dir, exist_ok=True)
+    manifest = read_manifest(local_dir)
+    counts = {"skipped": 0, "downloaded": 0, "missing": 0, "error": 0}
+    with ThreadPoolExecutor(max_workers=max(1, SYNC_WORKERS)) as pool:
+        futures = {}
+        for blob, local_path in objects:
+            key = os.path.relpath(local_path, local_dir).replace(os.sep, "/")
+            future = pool.submit(_sync_one, bucket, blob, local_path, manifest.get(key))
+            futures[future] = key
+        for future in as_completed(futures):
+            status, entry = future.result()
+            counts[status] += 1
+            if entry is not None:
+                manifest[futures[future]] = entry
+    write_manifest(local_dir, manifest)
+    return counts
+
+
 def download_files_from_gcs(bucket_name, file_paths, local_dir):
     """
     Downloads files from a GCS bucket to a local directory using ADC.
+    Files whose local copy already matches the object (generation or checksum) are skipped.
     Prints errors if files are missing or bucket is incorrect.
     """
-    # Step 1: Ensure local directory exists
-    os.makedirs(local_dir, exist_ok=True)
+    client = get_storage_client()
+    bucket = client.bucket(bucket_name)
+    objects = [
+        (file_path, os.path.join(local_dir, os.path.basename(file_path)))
+        for file_path in file_paths
+    ]
+    counts = sync_objects(bucket, objects, local_dir)
+    print(
+        f"{counts['downloaded']} downloaded, {counts['skipped']} up to date, "
+        f"{counts['missing'] + counts['error']} failed ({local_dir})"
+    )
+    return counts
+
 
-    # Step 2: Create GCS client (uses ADC by default)
-    client = storage.Client(project=GCP_PROJECT_ID)
+def sync_partitions(bucket_name, prefix, local_dir):
+    """
+    Downloads the partitions under a GCS prefix that are missing locally (or changed)
+    into local_dir/<table>/, leaving up-to-date partitions untouched.
+    Returns the number of partitions found in the bucket.
+    """
+    client = get_storage_client()
     bucket = client.bucket(bucket_name)
+    table_dir = os.path.join(local_dir, os.path.basename(prefix.rstrip("/")))
+
+    objects = [
+        (blob, os.path.join(table_dir, *blob.name[len(prefix):].split("/")))
+        for blob in client.list_blobs(bucket_name, prefix=prefix)
+        if blob.name.endswith(".parquet")
+    ]
+    if objects:
+        counts = sync_objects(bucket, objects, local_dir)
+        print(f"{counts['downloaded']} of {len(objects)} partition(s) downloaded to {table_dir}")
+    return len(objects)
 
-    # Step 3: Download each file
-    for file_path in file_paths:
-        blob = bucket.blob(file_path)
-        local_path = os.path.join(local_dir, os.path.basename(file_path))
-        print(f"Downloading gs://{bucket_name}/{file_path} to {local_path} ...")
-        try:
-            blob.download_to_filename(local_path)
-            print(f"Downloaded {local_path}")
-        except Exception as e:
-            print(f"ERROR: Could not download gs://{bucket_name}/{file_path}: {e}")
 
 def main():
     """
     Main entry point to download files from GCS to local directory.
     Can be called from CLI or imported as a function.
     """
-    download_files_from_gcs(PROMPT_BUCKET, PROMPT_PARQUET_FILES, LOCAL_DATA_DIR)
+    file_paths = list(PROMPT_PARQUET_FILES)
+    for prefix in PROMPT_PARTITIONED_PREFIXES:
+        if sync_partitions(PROMPT_BUCKET, prefix, LOCAL_DATA_DIR):
+            # Partitions replace the single-file copy of the same table
+            single_file = prefix.rstrip("/") + ".parquet"
+            file_paths = [path for path in file_paths if path != single_file]
+    download_files_from_gcs(PROMPT_BUCKET, file_paths, LOCAL_DATA_DIR)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,216 @@
+"""
+Date-sorted physical layout of the tables, so date filters only touch the matching rows.
+
+Tables with a "sort_by" column in the dataloader registry are sorted by it at load (missing
+dates first), which makes every derived file, partition and snapshot sorted as well:
+- In memory, date_range_rows resolves a date window to one contiguous slice with two binary
+  searches instead of comparing every row (.dt.date builds one Python object per row).
+- On disk, write_sorted_parquet writes small row groups whose min/max statistics let
+  read_date_range skip every row group outside the window.
+
+Rewrite a Parquet file sorted, with small row groups, with:
+    python -m utils.date_layout data/tbl_nerdalytics.parquet published_at
+"""
+
+import argparse
+import datetime
+import os
+import tempfile
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# Rows per Parquet row group for date-sorted files (pyarrow's default is 1M rows)
+DATE_ROW_GROUP_SIZE = 32_768
+
+
+def _int64_view(series: pd.Series) -> Optional[np.ndarray]:
+    """int64 view of a (tz-naive or tz-aware) datetime64 column, None for other dtypes."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return series.array.asi8
+    if isinstance(dtype, np.dtype) and dtype.kind == "M":
+        return series.to_numpy().view("i8")
+    return None
+
+
+def is_date_sorted(series: pd.Series) -> bool:
+    """True when a datetime column is ascending with its missing dates (NaT) first."""
+    values = _int64_view(series)
+    # NaT is the smallest int64, so "NaT first, then ascending" is plain int64 order
+    return values is not None and bool(np.all(values[1:] >= values[:-1]))
+
+
+def _sort_key(series: pd.Series) -> np.ndarray:
+    """int64 sort key of a date column (parsed first when it is not a datetime)."""
+    values = _int64_view(series)
+    if values is None:
+        values = _int64_view(pd.to_datetime(series, errors="coerce"))
+    return values
+
+
+def sort_by_date(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    Rows of df ordered by `column` (stable, NaT first) with a fresh RangeIndex.
+    Returns df itself when the column is missing or already in that order.
+    """
+    if column not in df.columns:
+        return df
+    key = _sort_key(df[column])
+    if key is None or bool(np.all(key[1:] >= key[:-1])):
+        return df
+    return df.take(np.argsort(key, kind="stable")).reset_index(drop=True)
+
+
+def _day_bound(series: pd.Series, day) -> int:
+    """int64 value of midnight of `day` in the column's unit and timezone."""
+    ts = pd.Timestamp(day)
+    tz = getattr(series.dtype, "tz", None)
+    if tz is not None:
+        ts = ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
+    unit = getattr(series.dtype, "unit", None) or np.datetime_data(series.dtype)[0]
+    return ts.as_unit(unit).value
+
+
+def day_bounds(
+    series: pd.Series,
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+) -> Tuple[int, int]:
+    """
+    [low, high) int64 bounds, in the column's unit and timezone, of the days
+    start_date..end_date (both inclusive, None for open). NaT never falls inside.
+    """
+    # Midnight of the start day (inclusive) to midnight after the end day (exclusive)
+    low = _day_bound(series, start_date) if start_date is not None else np.iinfo("i8").min + 1
+    high = (
+        _day_bound(series, pd.Timestamp(end_date) + pd.Timedelta(days=1))
+        if end_date is not None
+        else np.iinfo("i8").max
+    )
+    return low, high
+
+
+def date_range_rows(
+    df: pd.DataFrame,
+    column: str,
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+) -> pd.DataFrame:
+    """
+    Rows whose `column` date is within [start_date, end_date] (both inclusive, None for open),
+    same result as `(df[column].dt.date >= start_date) & (df[column].dt.date <= end_date)`.
+
+    A date-sorted column is cut with two binary searches (a zero-copy slice); any other
+    datetime column is compared as int64 without building Python dates. The order check
+    itself is a pass over the column: filters on loaded tables use FilterPlan /
+    row_index.date_mask, which know the order from load time.
+
+    Raises:
+        TypeError: If column is not a datetime64 column
+    """
+    series = df[column]
+    values = _int64_view(series)
+    if values is None:
+        raise TypeError(f"Column '{column}' is not a datetime column ({series.dtype})")
+
+    low, high = day_bounds(series, start_date, end_date)
+    if is_date_sorted(series):
+        first, last = np.searchsorted(values, [low, high], side="left")
+        return df.iloc[first:last]
+    return df[(values >= low) & (values < high)]
+
+
+def write_sorted_parquet(
+    df: pd.DataFrame,
+    path: str,
+    column: str,
+    row_group_size: int = DATE_ROW_GROUP_SIZE,
+) -> None:
+    """Write df sorted by `column` as Parquet with small row groups (temp file + rename)."""
+    df = sort_by_date(df, column)
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, index=False, row_group_size=row_group_size)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_date_range(
+    path: str,
+    column: str,
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Read only the rows of a Parquet file whose `column` date is within [start_date, end_date].
+
+    Row groups whose min/max statistics fall outside the window are never read or
+    decompressed; on a file written by write_sorted_parquet that is all but the few row
+    groups covering the window.
+    """
+    parquet = pq.ParquetFile(path)
+    position = parquet.schema_arrow.get_field_index(column)
+    low = pd.Timestamp(start_date) if start_date is not None else None
+    high = (
+        pd.Timestamp(end_date) + pd.Timedelta(days=1) if end_date is not None else None
+    )
+
+    keep = []
+    for index in range(parquet.num_row_groups):
+        stats = parquet.metadata.row_group(index).column(position).statistics
+        if stats is not None and stats.has_min_max:
+            group_min, group_max = pd.Timestamp(stats.min), pd.Timestamp(stats.max)
+            if group_min.tzinfo is not None:
+                group_min, group_max = group_min.tz_localize(None), group_max.tz_localize(None)
+            if (low is not None and group_max < low) or (high is not None and group_min >= high):
+                continue
+        keep.append(index)
+
+    read_columns = None
+    if columns is not None:
+        read_columns = list(dict.fromkeys([*columns, column]))
+    table = parquet.read_row_groups(keep, columns=read_columns)
+
+    # Row-level filter inside the kept row groups
+    dates = table[column]
+    if pa.types.is_timestamp(dates.type) and dates.type.tz is not None:
+        dates = pc.cast(dates, pa.timestamp(dates.type.unit))
+    mask = pc.is_valid(dates)
+    if low is not None:
+        mask = pc.and_(mask, pc.greater_equal(dates, pa.scalar(low.to_pydatetime())))
+    if high is not None:
+        mask = pc.and_(mask, pc.less(dates, pa.scalar(high.to_pydatetime())))
+    df = table.filter(mask).to_pandas()
+    if columns is not None and column not in columns:
+        df = df.drop(columns=[column])
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rewrite a Parquet file sorted by a date column with small row groups"
+    )
+    parser.add_argument("path", help="Parquet file, e.g. data/tbl_nerdalytics.parquet")
+    parser.add_argument("column", help="date column to sort on, e.g. published_at")
+    parser.add_argument("--row-group-size", type=int, default=DATE_ROW_GROUP_SIZE)
+    args = parser.parse_args()
+
+    df = pd.read_parquet(args.path)
+    write_sorted_parquet(df, args.path, args.column, args.row_group_size)
+    row_groups = pq.ParquetFile(args.path).num_row_groups
+    print(f"Rewrote {args.path}: {len(df):,} rows in {row_groups} row groups")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+On-disk cache for derived tables (joins/enrichments computed from the base Parquet files).
+
+A derived table is written once as Parquet under the cache directory, keyed by the
+content hashes of its input files, and reused by every later load (including new
+containers sharing the same disk) until one of the inputs changes.
+
+Usage:
+    df = cached_derived(
+        "my_table",
+        inputs=["data/tbl_nerdalytics.parquet"],
+        build=lambda: expensive_join(...),
+        cache_dir="data/derived",
+    )
+
+Bump CACHE_FORMAT_VERSION when a build function changes its output for the same inputs.
+"""
+
+import glob
+import hashlib
+import logging
+import os
+import tempfile
+from typing import Callable, Iterable, Optional, Sequence
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from utils.date_layout import DATE_ROW_GROUP_SIZE
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 2
+
+_HASH_CHUNK_BYTES = 8 * 2**20
+
+
+def file_hash(path: str) -> str:
+    """blake2b hex digest of the file contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(name: str, input_hashes: Iterable[str], params=None) -> str:
+    """Key of a derived table: its name, format version, input hashes and build params."""
+    digest = hashlib.blake2b(digest_size=8)
+    for part in [name, str(CACHE_FORMAT_VERSION), *input_hashes, repr(params)]:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _write_atomic(df: pd.DataFrame, path: str) -> None:
+    """
+    Write df as Parquet to a temporary file and rename it into place.
+    Small row groups keep date-sorted tables prunable (see utils/date_layout.py).
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, index=False, row_group_size=DATE_ROW_GROUP_SIZE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _remove_stale(cache_dir: str, name: str, keep: str) -> None:
+    """Delete older cached versions of the derived table `name`."""
+    for path in glob.glob(os.path.join(cache_dir, f"{name}-*.parquet")):
+        if path != keep:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove stale derived cache {path}: {e}")
+
+
+def cached_derived(
+    name: str,
+    inputs: Sequence[str],
+    build: Callable[[], pd.DataFrame],
+    cache_dir: str,
+    columns: Optional[Sequence[str]] = None,
+    params=None,
+    input_hashes: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Return the derived table `name`, building and persisting it only when its inputs changed.
+
+    Args:
+        name: Name of the derived table (used in the cache file name)
+        inputs: Paths of the files the table is computed from
+        build: Function returning the full derived DataFrame
+        cache_dir: Directory holding the cached Parquet files
+        columns: Optional column projection applied when reading (or after building)
+        params: Optional hashable build parameters that are part of the cache key
+        input_hashes: Precomputed content hashes of `inputs` (computed if None)
+
+    Returns:
+        The derived DataFrame
+    """
+    if input_hashes is None:
+        input_hashes = [file_hash(path) for path in inputs]
+    path = os.path.join(cache_dir, f"{name}-{cache_key(name, input_hashes, params)}.parquet")
+
+    if os.path.exists(path):
+        logger.info(f"Derived cache hit for {name}: {path}")
+        try:
+            if columns is not None:
+                names = pq.read_schema(path).names
+                columns = [col for col in names if col in columns]
+            return pd.read_parquet(path, columns=columns)
+        except Exception as e:
+            logger.warning(f"Unreadable derived cache {path}, rebuilding: {e}")
+
+    logger.info(f"Derived cache miss for {name}, building")
+    df = build()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_atomic(df, path)
+        _remove_stale(cache_dir, name, keep=path)
+    except OSError as e:
+        # A read-only or full disk must not break the page, only the reuse
+        logger.warning(f"Could not persist derived table {name}: {e}")
+
+    if columns is not None:
+        df = df[[col for col in df.columns if col in columns]]
+    return df
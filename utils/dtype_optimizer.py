@@ -0,0 +1,64 @@
+"""
+Load-time dtype optimisation for the base tables.
+
+- Low-cardinality text columns become pandas `category` (faster isin/groupby, less RAM).
+- Integer counts are downcast to int32 when even their column total fits, so sums and
+  cumulative sums cannot overflow.
+- Datetime columns are stored once as datetime64[ns].
+"""
+
+import numpy as np
+import pandas as pd
+
+# Low-cardinality columns stored as pandas categoricals
+CATEGORY_COLUMNS = [
+    "channel_title",
+    "playlist_channel_title",
+    "playlist_title",
+    "video_type",
+    "default_audio_language",
+    "category_id",
+    "live_content",
+]
+
+# Downcast an integer column only if its absolute total stays well inside int32
+INT32_SAFE_TOTAL = 2**30
+
+
+def optimize_dtypes(df: pd.DataFrame, category_columns=None) -> pd.DataFrame:
+    """
+    Convert the columns of df to compact dtypes (modified in-place).
+
+    Args:
+        df: DataFrame after the dataloader type conversions
+        category_columns: Columns to store as category (defaults to CATEGORY_COLUMNS)
+
+    Returns:
+        The optimised DataFrame
+    """
+    if category_columns is None:
+        category_columns = CATEGORY_COLUMNS
+
+    for col in df.columns:
+        series = df[col]
+        if col in category_columns:
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                df[col] = series.astype("category")
+        elif pd.api.types.is_integer_dtype(series.dtype) and series.dtype.itemsize > 4:
+            if np.abs(series.to_numpy(dtype="int64")).sum() < INT32_SAFE_TOTAL:
+                df[col] = series.astype("int32")
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            if getattr(series.dtype, "unit", "ns") != "ns":
+                df[col] = series.dt.as_unit("ns")
+    return df
+
+
+def drop_unused_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Remove categories that no longer occur after filtering, so value_counts() and
+    charts on a filtered frame do not list zero-count values.
+    """
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].cat.remove_unused_categories()
+    return df
@@ -0,0 +1,294 @@
+"""
+Optional in-process DuckDB backend for filters and group aggregations.
+
+DuckDB runs the predicates and aggregations with vectorised, multi-threaded execution over
+the shared, already prepared pandas tables: each call registers the columns it needs as a
+view of the cached frame (numeric and categorical columns are scanned in place, object
+columns are converted per call). Results keep the pandas semantics: filters return the
+matching rows of the original frame (same dtypes and index) and aggregations return the
+same columns as the pandas groupby they replace.
+
+Deliberately not views over the local Parquet files: the pages filter the prepared tables
+(types converted, null tokens treated, playlist enrichment joined, rows sorted by date),
+which the raw files do not hold, and FilterManager needs row positions in the cached frame.
+So the tables stay in pandas (shared once per process by load_table) and only the operator
+changes.
+
+Backends are chosen per page (config/pages.py PAGE_BACKENDS); pages without an entry use
+DATA_ENGINE from utils/config.py, which can also select the Polars engine
+(utils/polars_engine.py). When duckdb or polars is not installed every call silently runs
+the pandas implementation.
+
+Predicates are (column, op, value) tuples with op in PREDICATE_OPS, e.g.
+    [("channel_title", "in", ["A", "B"]), ("published_at", ">=", pd.Timestamp("2024-01-01"))]
+
+Parity with pandas is tested in tests/test_duckdb_backend.py; check both backends agree on
+a production frame with cross_check(), and time them with:
+    python -m benchmarks duckdb --rows 100000
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils import polars_engine
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("pandas", "duckdb", "polars")
+PREDICATE_OPS = ("in", "between", "==", ">=", "<=", "<", ">")
+AGGREGATIONS = {
+    "sum": "COALESCE(SUM({col}), 0)",
+    "mean": "AVG({col})",
+    "count": "COUNT({col})",
+    "nunique": "COUNT(DISTINCT {col})",
+    "min": "MIN({col})",
+    "max": "MAX({col})",
+}
+
+# Column holding the original row positions in the scans sent to DuckDB
+_ROW_COLUMN = "__row_position"
+
+_connection = None
+_connection_lock = threading.Lock()
+
+
+def duckdb_available() -> bool:
+    """True when the duckdb package can be imported."""
+    try:
+        import duckdb  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_backend(backend: Optional[str]) -> str:
+    """
+    Backend actually used for a requested one: None means DATA_ENGINE, and "duckdb" or
+    "polars" fall back to "pandas" when the package is missing.
+    """
+    if backend is None or backend == "polars":
+        return polars_engine.resolve_engine(backend)
+    if backend == "duckdb" and duckdb_available():
+        return "duckdb"
+    if backend not in BACKENDS:
+        logger.warning(f"Unknown data backend '{backend}', using pandas")
+    return "pandas"
+
+
+def _cursor():
+    """New cursor on the process-wide in-memory DuckDB database (one per call, thread-safe)."""
+    global _connection
+    import duckdb
+
+    with _connection_lock:
+        if _connection is None:
+            _connection = duckdb.connect(database=":memory:")
+        return _connection.cursor()
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _column_sql(df: pd.DataFrame, col: str) -> str:
+    """Column reference; string categoricals (ENUMs in DuckDB) compare as VARCHAR."""
+    dtype = df[col].dtype
+    if isinstance(dtype, pd.CategoricalDtype) and dtype.categories.dtype == object:
+        return f"CAST({_quote(col)} AS VARCHAR)"
+    return _quote(col)
+
+
+def _param(value):
+    """Python value bound to a DuckDB parameter."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value
+
+
+def _where_sql(df: pd.DataFrame, predicates: Sequence[Tuple]) -> Tuple[str, List]:
+    """WHERE clause (with ? placeholders) and its parameters."""
+    clauses, params = [], []
+    for col, op, value in predicates:
+        if op not in PREDICATE_OPS:
+            raise ValueError(f"Unsupported predicate operator '{op}'")
+        column = _column_sql(df, col)
+        if op == "in":
+            values = list(value)
+            if not values:
+                clauses.append("FALSE")
+                continue
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params += [_param(v) for v in values]
+        elif op == "between":
+            clauses.append(f"{column} BETWEEN ? AND ?")
+            params += [_param(value[0]), _param(value[1])]
+        else:
+            clauses.append(f"{column} {'=' if op == '==' else op} ?")
+            params.append(_param(value))
+    return " AND ".join(clauses) or "TRUE", params
+
+
+def _pandas_mask(df: pd.DataFrame, predicates: Sequence[Tuple]) -> np.ndarray:
+    """Boolean row mask of the predicates, evaluated with pandas."""
+    mask = np.ones(len(df), dtype=bool)
+    for col, op, value in predicates:
+        series = df[col]
+        if op == "in":
+            result = series.isin(list(value))
+        elif op == "between":
+            result = (series >= value[0]) & (series <= value[1])
+        elif op == "==":
+            result = series == value
+        elif op == ">=":
+            result = series >= value
+        elif op == "<=":
+            result = series <= value
+        elif op == "<":
+            result = series < value
+        elif op == ">":
+            result = series > value
+        else:
+            raise ValueError(f"Unsupported predicate operator '{op}'")
+        mask &= result.fillna(False).to_numpy(dtype=bool)
+    return mask
+
+
+def filter_positions(
+    df: pd.DataFrame, predicates: Sequence[Tuple], backend: Optional[str] = None
+) -> np.ndarray:
+    """Sorted positions of the rows of df matching all predicates."""
+    if not predicates:
+        return np.arange(len(df))
+    backend = resolve_backend(backend)
+    if backend == "pandas":
+        return np.flatnonzero(_pandas_mask(df, predicates))
+    if backend == "polars":
+        return polars_engine.filter_positions(df, predicates)
+
+    columns = list(dict.fromkeys(col for col, _, _ in predicates))
+    # Shallow (copy-on-write) frame: only the predicate columns plus the row positions
+    scan = df[columns].assign(**{_ROW_COLUMN: np.arange(len(df))})
+    where, params = _where_sql(df, predicates)
+    cursor = _cursor()
+    try:
+        cursor.register("scan", scan)
+        result = cursor.execute(
+            f"SELECT {_ROW_COLUMN} FROM scan WHERE {where} ORDER BY {_ROW_COLUMN}",
+            params,
+        ).fetchnumpy()
+    finally:
+        cursor.close()
+    return np.asarray(result[_ROW_COLUMN], dtype=np.int64)
+
+
+def filter_frame(
+    df: pd.DataFrame, predicates: Sequence[Tuple], backend: Optional[str] = None
+) -> pd.DataFrame:
+    """Rows of df matching all predicates (same dtypes and index as df)."""
+    if not predicates:
+        return df
+    return df.take(filter_positions(df, predicates, backend))
+
+
+def group_aggregate(
+    df: pd.DataFrame,
+    by: Sequence[str],
+    aggregations: Dict[str, Tuple[str, str]],
+    backend: Optional[str] = None,
+    predicates: Optional[Sequence[Tuple]] = None,
+) -> pd.DataFrame:
+    """
+    Grouped aggregation, equivalent to
+        df.groupby(by, observed=True, as_index=False).agg(**aggregations)
+
+    Args:
+        df: Source DataFrame
+        by: Group keys (rows with a null key are dropped, like pandas)
+        aggregations: {output column: (source column, function)}, function in AGGREGATIONS
+        backend: "pandas", "duckdb" or "polars" (None: DATA_ENGINE)
+        predicates: Optional filter applied before grouping
+
+    Returns:
+        One row per group, sorted by the keys
+    """
+    by = list(by)
+    for out, (col, func) in aggregations.items():
+        if func not in AGGREGATIONS:
+            raise ValueError(f"Unsupported aggregation '{func}' for '{out}'")
+
+    backend = resolve_backend(backend)
+    if backend == "pandas":
+        if predicates:
+            df = df[_pandas_mask(df, predicates)]
+        return df.groupby(by, observed=True, as_index=False).agg(**aggregations)
+    if backend == "polars":
+        return polars_engine.group_aggregate(df, by, aggregations, predicates)
+
+    columns = list(
+        dict.fromkeys(
+            by
+            + [col for col, _ in aggregations.values()]
+            + [col for col, _, _ in predicates or []]
+        )
+    )
+    where, params = _where_sql(df, predicates or [])
+    keys = ", ".join(_quote(col) for col in by)
+    selects = [_quote(col) for col in by] + [
+        f"{AGGREGATIONS[func].format(col=_quote(col))} AS {_quote(out)}"
+        for out, (col, func) in aggregations.items()
+    ]
+    not_null = " AND ".join(f"{_quote(col)} IS NOT NULL" for col in by)
+    sql = (
+        f"SELECT {', '.join(selects)} FROM scan "
+        f"WHERE ({where}) AND {not_null} GROUP BY {keys} ORDER BY {keys}"
+    )
+    cursor = _cursor()
+    try:
+        cursor.register("scan", df[columns])
+        result = cursor.execute(sql, params).df()
+    finally:
+        cursor.close()
+
+    # Match the pandas result dtypes (DuckDB sums integers as HUGEINT/float)
+    for out, (col, func) in aggregations.items():
+        if func in ("count", "nunique") or (
+            func == "sum" and pd.api.types.is_integer_dtype(df[col].dtype)
+        ):
+            result[out] = result[out].astype("int64")
+    for col in by:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            result[col] = result[col].astype(df[col].dtype)
+    return result
+
+
+def cross_check(
+    df: pd.DataFrame,
+    predicates: Optional[Sequence[Tuple]] = None,
+    by: Optional[Sequence[str]] = None,
+    aggregations: Optional[Dict[str, Tuple[str, str]]] = None,
+    backend: str = "duckdb",
+) -> None:
+    """
+    Assert `backend` ("duckdb" or "polars") and pandas return the same filter (and
+    aggregation) results. Raises AssertionError on mismatch, RuntimeError if the backend
+    package is not installed.
+    """
+    if resolve_backend(backend) != backend:
+        raise RuntimeError(f"{backend} is not installed")
+    predicates = predicates or []
+    pd.testing.assert_frame_equal(
+        filter_frame(df, predicates, backend), filter_frame(df, predicates, "pandas")
+    )
+    if by and aggregations:
+        pd.testing.assert_frame_equal(
+            group_aggregate(df, by, aggregations, backend, predicates).reset_index(drop=True),
+            group_aggregate(df, by, aggregations, "pandas", predicates).reset_index(drop=True),
+            check_dtype=False,
+            rtol=1e-9,
+        )
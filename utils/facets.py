@@ -0,0 +1,290 @@
+"""
+Parent -> child option maps of the cascading filters, built once per table version at load.
+
+A cascading filter (FilterManager "depends_on", the playlist list of analytics2_section1)
+lists the child values (e.g. playlist titles) of the selected parents (channels). Instead
+of filtering the whole table on every rerun to call .unique(), the distinct
+(parent, child) pairs of FACET_PAIRS are kept with the first row and the row count of each
+pair, grouped by parent:
+- channel -> playlists -> videos (the hierarchy);
+- channel -> language / video type (facets with counts).
+
+Options are then the union of the selected parents' children, in order of first
+appearance in the table (what .unique() on the filtered frame returns), and counts are
+summed per child. Like the row-id indexes (utils/row_index.py) a facet index is found
+from the columns themselves, so session views of the loaded table use it and any other
+frame falls back to a scan with the same result.
+
+    child_options(df, "playlist_channel_title", "playlist_title", selected_channels)
+    child_counts(df, "channel_title", "default_audio_language", selected_channels)
+
+The facet catalogue (column_facet) holds what filter widgets ask of a single column:
+distinct values, sorted values, counts, numeric min/max and date bounds. For the columns of
+a loaded table each of them is computed once per table version, on first use, and shared
+by every session, filter manager and ad-hoc widget; other frames compute them on demand.
+
+    facet = column_facet(df["channel_title"])
+    st.multiselect("Channel", facet.sorted_values)
+
+The same registry tells which loaded table a frame's columns come from (source_load_key),
+the key of its entries in the filter cache (utils/filter_cache.py).
+"""
+
+import datetime
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.row_index import MAX_INDEXED_TABLES, _buffer_key
+
+# (parent, child) pairs indexed when a table has both columns
+FACET_PAIRS = [
+    ("channel_title", "playlist_title"),
+    ("playlist_channel_title", "playlist_title"),
+    ("playlist_title", "video_id"),
+    ("channel_title", "default_audio_language"),
+    ("channel_title", "video_type"),
+    ("playlist_channel_title", "default_audio_language"),
+    ("playlist_channel_title", "video_type"),
+]
+
+
+def _codes(series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Integer codes (-1 for missing) and the values they stand for."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return np.asarray(series.array.codes), series.cat.categories
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    return codes, pd.Index(uniques)
+
+
+class FacetIndex:
+    """Distinct (parent, child) pairs of two columns with their first row and row count."""
+
+    def __init__(self, parent: pd.Series, child: pd.Series):
+        parent_codes, self.parents = _codes(parent)
+        child_codes, self.children = _codes(child)
+        self.length = len(parent)
+        # Keep the indexed buffers alive, so their addresses cannot be reused
+        self._anchors = (parent, child)
+        self._keys = (_buffer_key(parent), _buffer_key(child))
+
+        present = (parent_codes >= 0) & (child_codes >= 0)
+        rows = np.flatnonzero(present)
+        pair = parent_codes[rows].astype(np.int64) * (len(self.children) + 1) + child_codes[rows]
+        # Sorted by pair, so grouped by parent; first row of each pair and its row count
+        pair, first, count = np.unique(pair, return_index=True, return_counts=True)
+        self.pair_parent = (pair // (len(self.children) + 1)).astype(np.int32)
+        self.pair_child = (pair % (len(self.children) + 1)).astype(np.int32)
+        self.pair_first = rows[first].astype(np.int64)
+        self.pair_count = count.astype(np.int64)
+        self.offsets = np.searchsorted(self.pair_parent, np.arange(len(self.parents) + 1))
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.pair_parent.nbytes
+            + self.pair_child.nbytes
+            + self.pair_first.nbytes
+            + self.pair_count.nbytes
+            + self.offsets.nbytes
+        )
+
+    def _pairs(self, parents: Optional[Iterable[Hashable]]) -> np.ndarray:
+        """Pair positions of the selected parents (every pair when parents is None)."""
+        if parents is None:
+            return np.arange(len(self.pair_parent))
+        codes = self.parents.get_indexer(pd.Index(list(parents)).dropna())
+        codes = np.unique(codes[codes >= 0])
+        if len(codes) == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(
+            [np.arange(self.offsets[c], self.offsets[c + 1]) for c in codes]
+        )
+
+    def options(self, parents: Optional[Iterable[Hashable]] = None) -> List:
+        """Distinct children of the selected parents, in order of first appearance."""
+        pairs = self._pairs(parents)
+        child, first = self.pair_child[pairs], self.pair_first[pairs]
+        # Earliest row of each child over the selected parents, then children by that row
+        order = np.lexsort((first, child))
+        child, first = child[order], first[order]
+        earliest = np.ones(len(child), dtype=bool)
+        earliest[1:] = child[1:] != child[:-1]
+        child, first = child[earliest], first[earliest]
+        return self.children.take(child[np.argsort(first, kind="stable")]).tolist()
+
+    def counts(self, parents: Optional[Iterable[Hashable]] = None) -> Dict[Hashable, int]:
+        """Rows per child among the rows of the selected parents, largest first."""
+        pairs = self._pairs(parents)
+        totals = np.bincount(
+            self.pair_child[pairs], weights=self.pair_count[pairs], minlength=len(self.children)
+        ).astype(np.int64)
+        present = np.flatnonzero(totals)
+        present = present[np.argsort(-totals[present], kind="stable")]
+        return dict(zip(self.children.take(present).tolist(), totals[present].tolist()))
+
+
+class ColumnFacet:
+    """
+    Option values and bounds of one column, each computed on first access. Lists are
+    shared: copy them before modifying.
+    """
+
+    def __init__(self, series: pd.Series):
+        self._series = series
+
+    @cached_property
+    def values(self) -> List:
+        """Distinct non-missing values in order of first appearance (dropna().unique())."""
+        return self._series.dropna().unique().tolist()
+
+    @cached_property
+    def sorted_values(self) -> List:
+        return sorted(self.values)
+
+    @cached_property
+    def counts(self) -> Dict[Hashable, int]:
+        """Rows per non-missing value, largest first."""
+        counts = self._series.value_counts(sort=True)
+        return {value: int(count) for value, count in counts.items() if count > 0}
+
+    @cached_property
+    def min(self):
+        return self._series.min()
+
+    @cached_property
+    def max(self):
+        return self._series.max()
+
+    @cached_property
+    def date_bounds(self) -> Optional[Tuple[datetime.date, datetime.date]]:
+        """(first, last) day of a date column (parsed when needed), None without dates."""
+        series = self._series
+        if not pd.api.types.is_datetime64_any_dtype(series):
+            series = pd.to_datetime(series, errors="coerce")
+        first, last = series.min(), series.max()
+        if pd.isna(first) or pd.isna(last):
+            return None
+        return first.date(), last.date()
+
+
+_LOCK = threading.Lock()
+# (table, columns, version) -> {(parent, child): FacetIndex}, oldest first
+_TABLE_FACETS = OrderedDict()
+# (parent buffer key, child buffer key) -> FacetIndex
+_BY_BUFFERS: Dict[Tuple, FacetIndex] = {}
+# (table, columns, version) -> buffer keys of its columns, oldest first
+_TABLE_COLUMNS = OrderedDict()
+# buffer key of a column of a loaded table -> its ColumnFacet
+_CATALOGUE: Dict[Tuple, ColumnFacet] = {}
+
+
+def build_table_facets(key: Tuple, df: pd.DataFrame) -> Dict[Tuple[str, str], FacetIndex]:
+    """
+    Index the FACET_PAIRS of a loaded table.
+
+    Args:
+        key: (table, columns, version) of the load; older builds beyond MAX_INDEXED_TABLES
+            are dropped
+        df: The cached table (must not be modified afterwards)
+    """
+    facets = {}
+    for parent, child in FACET_PAIRS:
+        if parent in df.columns and child in df.columns:
+            index = FacetIndex(df[parent], df[child])
+            if None not in index._keys:
+                facets[(parent, child)] = index
+    columns = {}
+    for col in df.columns:
+        buffer_key = _buffer_key(df[col])
+        if buffer_key is not None:
+            columns[buffer_key] = ColumnFacet(df[col])
+    with _LOCK:
+        _drop(key)
+        _TABLE_FACETS[key] = facets
+        for index in facets.values():
+            _BY_BUFFERS[index._keys] = index
+        # Catalogue entries are filled on first use
+        _TABLE_COLUMNS[key] = list(columns)
+        _CATALOGUE.update(columns)
+        while len(_TABLE_FACETS) > MAX_INDEXED_TABLES:
+            _drop(next(iter(_TABLE_FACETS)))
+    return facets
+
+
+def _drop(key: Tuple) -> None:
+    for index in _TABLE_FACETS.pop(key, {}).values():
+        if _BY_BUFFERS.get(index._keys) is index:
+            del _BY_BUFFERS[index._keys]
+    for buffer_key in _TABLE_COLUMNS.pop(key, []):
+        _CATALOGUE.pop(buffer_key, None)
+
+
+def column_facet(series: pd.Series) -> ColumnFacet:
+    """
+    Catalogue entry of a column: shared, computed once per table version, for a column of a
+    loaded table (or of a shared view of it); a fresh one for any other series.
+    """
+    facet = _CATALOGUE.get(_buffer_key(series))
+    if facet is not None and len(facet._series) == len(series):
+        return facet
+    return ColumnFacet(series)
+
+
+def source_load_key(df: pd.DataFrame, columns: Iterable[str]) -> Optional[Tuple]:
+    """
+    (table, columns, version) of the loaded table that the given columns of df belong to
+    (df being the table or a shared view of it), None when any of them is another column.
+    """
+    keys = {_buffer_key(df[col]) for col in columns if col in df.columns}
+    if not keys or None in keys:
+        return None
+    with _LOCK:
+        for key, buffers in reversed(_TABLE_COLUMNS.items()):
+            if keys.issubset(buffers):
+                return key
+    return None
+
+
+def facet_index(df: pd.DataFrame, parent: str, child: str) -> Optional[FacetIndex]:
+    """Facet index of two columns of a loaded table (or of a shared view of it)."""
+    if parent not in df.columns or child not in df.columns:
+        return None
+    index = _BY_BUFFERS.get((_buffer_key(df[parent]), _buffer_key(df[child])))
+    return index if index is not None and index.length == len(df) else None
+
+
+def _selected_rows(df: pd.DataFrame, parent: str, parents) -> pd.DataFrame:
+    if parents is None:
+        return df[df[parent].notna()]
+    return df[df[parent].isin(list(parents))]
+
+
+def child_options(df: pd.DataFrame, parent: str, child: str, parents=None) -> List:
+    """
+    Distinct non-missing values of `child` on the rows whose `parent` is one of parents
+    (every row with a parent when parents is None), in order of first appearance, like
+    df[df[parent].isin(parents)][child].dropna().unique().tolist().
+    """
+    index = facet_index(df, parent, child)
+    if index is not None:
+        return index.options(parents)
+    return _selected_rows(df, parent, parents)[child].dropna().unique().tolist()
+
+
+def child_counts(df: pd.DataFrame, parent: str, child: str, parents=None) -> Dict[Hashable, int]:
+    """Rows per non-missing `child` value among the rows of the selected parents, largest first."""
+    index = facet_index(df, parent, child)
+    if index is not None:
+        return index.counts(parents)
+    counts = _selected_rows(df, parent, parents)[child].value_counts(sort=True)
+    return {value: int(count) for value, count in counts.items() if count > 0}
+
+
+def facet_bytes(key: Tuple) -> int:
+    """Memory held by the facet indexes of one load (0 when not indexed)."""
+    return sum(index.nbytes for index in _TABLE_FACETS.get(key, {}).values())
@@ -0,0 +1,213 @@
+"""
+Process-wide cache of filter results, shared by every session.
+
+Many sessions pick the same channel, language or date window. Instead of each session
+recomputing (or st.cache_data pickling) its own filtered frame, the rows a filter state
+selects are cached once per process, keyed by
+
+    (load key of the table, number of rows, filter definitions hash, canonical filter state)
+
+where the load key is dataloader.load_key(table, columns) = (table, projection,
+table_version), so entries of replaced data are never served, and the definitions hash
+(filter_config_hash) keeps pages whose filters share names but not definitions apart. Values are row positions
+(int32 arrays, or a slice for a contiguous date window), not frames: a hit costs one take
+of the shared table. Entries are evicted least recently used beyond FILTER_CACHE_MB
+(utils/config.py). Hit/miss counters are shown in Debug Tools (filter_cache_stats()).
+
+    rows = FILTER_CACHE.rows(key, lambda: plan_rows(df))
+    df_filtered = take_rows(df, rows)
+"""
+
+import datetime
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.config import FILTER_CACHE_MB
+
+Rows = Union[np.ndarray, slice]
+
+# Accounted size of a slice entry and per-entry overhead (key, dict slot)
+_ENTRY_OVERHEAD = 256
+
+
+def _canonical(value, selection: bool = False) -> Hashable:
+    """Hashable form of one filter value; a selection's order and duplicates are ignored."""
+    if isinstance(value, (set, frozenset)) or (selection and isinstance(value, (list, tuple))):
+        # Multiselect: the selection order does not change the rows
+        items = {_canonical(item) for item in value}
+        return ("in",) + tuple(sorted(items, key=lambda item: (type(item).__name__, repr(item))))
+    if isinstance(value, (list, tuple)):
+        # Ranges: the order does matter
+        return tuple(_canonical(item) for item in value)
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, float) and np.isnan(value):
+        return "__nan__"  # NaN != NaN would never hit
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _canonical(v)) for k, v in value.items()))
+    return value
+
+
+def canonical_state(filters: Optional[dict], selections: Optional[Iterable[str]] = None) -> Tuple:
+    """
+    Canonical form of a filter state: sorted by filter, inactive filters (None, an empty
+    selection or an empty text) dropped and selection order ignored, so equivalent states
+    share one entry.
+
+    Args:
+        filters: Filter state {name: value}
+        selections: Names of the multiselect filters; None when every list is a selection
+    """
+    if not filters:
+        return ()
+    selections = None if selections is None else set(selections)
+    canonical = []
+    for name, value in filters.items():
+        if value is None or (isinstance(value, (list, set, tuple, str)) and len(value) == 0):
+            continue
+        selection = isinstance(value, list) if selections is None else name in selections
+        canonical.append((str(name), _canonical(value, selection)))
+    return tuple(sorted(canonical, key=lambda item: item[0]))
+
+
+# Filter configuration entries that change the rows a state selects (labels, options and
+# defaults do not)
+_DEFINITION_KEYS = ("type", "column", "group_by", "latest_by", "min", "max", "extra_params")
+
+
+def filter_config_hash(filter_config: Optional[dict]) -> Optional[str]:
+    """
+    Stable hash of the filter definitions (name, type, column, top-N and range parameters,
+    extra_params) of a FilterManager configuration; None for no configuration.
+    """
+    if filter_config is None:
+        return None
+    definitions = []
+    for name, config in sorted(filter_config.items(), key=lambda item: str(item[0])):
+        definition = [(key, _canonical(config.get(key))) for key in _DEFINITION_KEYS]
+        apply_func = config.get("apply_func")
+        if apply_func is not None:
+            definition.append(
+                ("apply_func", f"{apply_func.__module__}.{apply_func.__qualname__}")
+            )
+        definitions.append((str(name), tuple(definition)))
+    return hashlib.blake2b(repr(definitions).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _entry_bytes(rows: Rows) -> int:
+    return _ENTRY_OVERHEAD + (rows.nbytes if isinstance(rows, np.ndarray) else 0)
+
+
+class FilterResultCache:
+    """LRU of filter results (row positions) under a byte budget, thread-safe."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Rows]:
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return rows
+
+    def put(self, key: Hashable, rows: Rows) -> Rows:
+        if isinstance(rows, np.ndarray):
+            rows = rows.astype(np.int32 if len(rows) == 0 or rows.max() < 2**31 else np.int64, copy=False)
+            rows.setflags(write=False)  # shared by every session
+        size = _entry_bytes(rows)
+        if size > self.max_bytes:
+            return rows  # larger than the whole budget: not cached
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= _entry_bytes(self._entries.pop(key))
+            self._entries[key] = rows
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= _entry_bytes(evicted)
+                self.evictions += 1
+        return rows
+
+    def rows(self, key: Hashable, compute: Callable[[], Rows]) -> Rows:
+        """Cached rows of key, computed (outside the lock) and stored on a miss."""
+        try:
+            hash(key)
+        except TypeError:
+            return compute()  # filter values that cannot be keyed (custom filters)
+        rows = self.get(key)
+        if rows is None:
+            rows = self.put(key, compute())
+        return rows
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "mb": round(self._bytes / 2**20, 2),
+            "max_mb": round(self.max_bytes / 2**20, 2),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+FILTER_CACHE = FilterResultCache(int(FILTER_CACHE_MB * 2**20))
+
+
+def filter_cache_key(
+    load_key: Tuple,
+    df: pd.DataFrame,
+    filters: Optional[dict],
+    selections: Optional[Iterable[str]] = None,
+    filter_config: Optional[dict] = None,
+) -> Tuple:
+    """
+    Cache key of a filter state on df, a frame served for load_key (dataloader.load_key).
+
+    Args:
+        filter_config: Configuration the state is applied with (FilterManager v2); None for
+            a fixed set of filters
+    """
+    return (
+        load_key,
+        len(df),
+        filter_config_hash(filter_config),
+        canonical_state(filters, selections),
+    )
+
+
+def filter_cache_stats() -> dict:
+    """Counters and size of the process-wide filter cache."""
+    return FILTER_CACHE.stats()
+
+
+def take_rows(df: pd.DataFrame, rows: Rows) -> pd.DataFrame:
+    """Rows of df selected by a cached result (zero-copy for a slice)."""
+    if isinstance(rows, slice):
+        return df.iloc[rows]
+    return df.take(rows)
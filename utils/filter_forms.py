@@ -0,0 +1,86 @@
+"""
+Filter modes of the filter popovers: "live" (every widget change reruns the page and
+recomputes the filtered data) or "apply" (widgets are staged in an st.form and committed
+together with an "Apply filters" button: one recompute instead of one per change).
+
+The mode is chosen per page in PAGE_FILTER_MODES (config/pages.py), "live" by default.
+FilterManager (utils/filter_manager_v2.py) takes it as mode=, ad-hoc filter widgets use
+filter_form directly:
+
+    with filter_form("ai_labs_filters", mode):
+        ...widgets...
+    changed = record_commit("ai_labs_filters", mode, {"channels": channels, ...})
+
+record_commit compares the committed filter state with the previous one of the session
+and counts, per mode, the commits that changed filters (each one a recompute) and the
+filters they changed. In live mode each change costs a recompute; in apply mode the
+recomputes avoided are the changed filters minus the commits. Counters are process-wide
+(filter_form_stats(), shown in Debug Tools).
+"""
+
+import threading
+from contextlib import contextmanager
+
+import streamlit as st
+
+from config.pages import PAGE_FILTER_MODES
+
+FILTER_MODES = ("live", "apply")
+
+_LOCK = threading.Lock()
+_STATS = {mode: {"recomputes": 0, "filters_changed": 0} for mode in FILTER_MODES}
+
+
+def page_filter_mode(page_key: str) -> str:
+    """Filter mode configured for a page (PAGE_FILTER_MODES), "live" when not listed."""
+    mode = PAGE_FILTER_MODES.get(page_key, "live")
+    return mode if mode in FILTER_MODES else "live"
+
+
+@contextmanager
+def filter_form(key: str, mode: str = "live", submit_label: str = "Apply filters"):
+    """
+    Container for filter widgets: nothing in live mode, an st.form with a submit button in
+    apply mode. Buttons and widget callbacks are not allowed inside it in apply mode.
+    """
+    if mode != "apply":
+        yield
+        return
+    with st.form(key=f"{key}_form", border=False):
+        yield
+        st.form_submit_button(submit_label, type="primary")
+
+
+def _changed_filters(previous: dict, state: dict) -> int:
+    names = set(previous) | set(state)
+    return sum(1 for name in names if previous.get(name) != state.get(name))
+
+
+def record_commit(key: str, mode: str, state: dict) -> bool:
+    """
+    Record the filter state the page is about to filter with.
+
+    Returns:
+        True when it differs from the session's previous state (the data is recomputed)
+    """
+    committed_key = f"{key}_committed"
+    previous = st.session_state.get(committed_key)
+    st.session_state[committed_key] = dict(state)
+    if previous is None:
+        return True  # first run of the session: nothing to compare with
+    changed = _changed_filters(previous, state)
+    if changed == 0:
+        return False
+    stats = _STATS.get(mode, _STATS["live"])
+    with _LOCK:
+        stats["recomputes"] += 1
+        stats["filters_changed"] += changed
+    return True
+
+
+def filter_form_stats() -> dict:
+    """Commits and changed filters per mode, and the recomputes apply mode avoided."""
+    with _LOCK:
+        stats = {mode: dict(values) for mode, values in _STATS.items()}
+    stats["recomputes_avoided"] = stats["apply"]["filters_changed"] - stats["apply"]["recomputes"]
+    return stats
@@ -1,8 +1,14 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import logging
 
+from utils.dtype_optimizer import drop_unused_categories
+from utils.facets import child_options, column_facet
+from utils.filter_cache import FILTER_CACHE, filter_cache_key
+from utils.row_index import date_mask, isin_mask
+
 logger = logging.getLogger(__name__)
 
 class FilterManager:
@@ -68,7 +74,7 @@ class FilterManager:
             # Channel filter
             with col1:
                 if "channel_title" in dataframe.columns:
-                    channel_options = dataframe["channel_title"].dropna().unique().tolist()
+                    channel_options = column_facet(dataframe["channel_title"]).values
                     filters["channel"] = st.multiselect(
                         "Filter by Channel",
                         options=channel_options,
@@ -76,7 +82,7 @@ class FilterManager:
                         key=f"{self.namespace}_channel"
                     )
                 elif "playlist_channel_title" in dataframe.columns:
-                    channel_options = dataframe["playlist_channel_title"].dropna().unique().tolist()
+                    channel_options = column_facet(dataframe["playlist_channel_title"]).values
                     filters["channel"] = st.multiselect(
                         "Filter by Channel",
                         options=channel_options,
@@ -87,7 +93,7 @@ class FilterManager:
             # Video type filter
             with col2:
                 if "video_type" in dataframe.columns:
-                    type_options = dataframe["video_type"].dropna().unique().tolist()
+                    type_options = column_facet(dataframe["video_type"]).values
                     filters["video_type"] = st.multiselect(
                         "Filter by Type",
                         options=type_options,
@@ -98,7 +104,7 @@ class FilterManager:
             # Language filter
             with col3:
                 if "default_audio_language" in dataframe.columns:
-                    lang_options = dataframe["default_audio_language"].dropna().unique().tolist()
+                    lang_options = column_facet(dataframe["default_audio_language"]).values
                     filters["language"] = st.multiselect(
                         "Filter by Language",
                         options=lang_options,
@@ -114,12 +120,9 @@ class FilterManager:
                     break
 
             if date_col:
-                dataframe[date_col] = pd.to_datetime(dataframe[date_col], errors='coerce')
-                min_date = dataframe[date_col].min()
-                max_date = dataframe[date_col].max()
-
-                min_date_slider = min_date.date() if pd.notnull(min_date) else datetime.today().date()
-                max_date_slider = max_date.date() if pd.notnull(max_date) else datetime.today().date()
+                # Date bounds from the facet catalogue (parsed there when needed)
+                date_bounds = column_facet(dataframe[date_col]).date_bounds
+                min_date_slider, max_date_slider = date_bounds or (datetime.today().date(), datetime.today().date())
 
                 filters["date_range"] = st.slider(
                     f"Filter by {date_col.replace('_', ' ').title()}",
@@ -132,14 +135,14 @@ class FilterManager:
 
             # Playlist filter for playlist dataframes
             if "playlist_id" in dataframe.columns and "playlist_title" in dataframe.columns:
-                # Get unique playlists
-                playlist_df = dataframe[["playlist_id", "playlist_title"]].drop_duplicates()
-                playlist_options = playlist_df["playlist_title"].dropna().unique().tolist()
+                # Get unique playlists (facet catalogue)
+                playlist_options = column_facet(dataframe["playlist_title"]).values
 
-                # Apply channel filter to playlists if channel filter is active
+                # Apply channel filter to playlists if channel filter is active (facet index)
                 if filters["channel"] and "playlist_channel_title" in dataframe.columns:
-                    filtered_df = dataframe[dataframe["playlist_channel_title"].isin(filters["channel"])]
-                    playlist_options = filtered_df["playlist_title"].dropna().unique().tolist()
+                    playlist_options = child_options(
+                        dataframe, "playlist_channel_title", "playlist_title", filters["channel"]
+                    )
 
                 filters["playlists"] = st.multiselect(
                     "Filter by Playlist",
@@ -176,55 +179,88 @@ class FilterManager:
         summary = " | ".join(summary_parts) if summary_parts else "No filters selected."
         st.markdown(f"**Active filters:** {summary}")
 
-    def apply_filters(self, df):
+    @staticmethod
+    def _date_column(df):
+        """Column the date range filter applies to, None when df has none."""
+        for col in ["video_added_at", "playlist_published_at", "published_at"]:
+            if col in df.columns:
+                return col
+        return None
+
+    def filter_rows(self, df, filters=None):
         """
-        Apply current filters to a dataframe.
+        Positions of the rows of df matching the filters, computed as one combined mask over
+        df itself: on a loaded table the row-id and timestamp indexes (utils/row_index.py)
+        are used instead of Series.isin and a date object per row.
 
         Args:
-            df: DataFrame to filter
-
-        Returns:
-            Filtered DataFrame
+            df: DataFrame to filter (not modified)
+            filters: Filter state (defaults to the current one)
         """
-        if df is None:
-            return None
+        if filters is None:
+            filters = self.get_filter_state()
+        mask = np.ones(len(df), dtype=bool)
 
-        filters = self.get_filter_state()
-        df_filtered = df.copy()
+        # Apply date range filter
+        date_col = self._date_column(df)
+        if filters["date_range"] and date_col:
+            start_date, end_date = filters["date_range"]
+            dates = df[date_col]
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                dates = pd.to_datetime(dates, errors='coerce')
+            mask &= date_mask(dates, start_date, end_date)
 
         # Apply channel filter
         if filters["channel"]:
-            if "channel_title" in df_filtered.columns:
-                df_filtered = df_filtered[df_filtered["channel_title"].isin(filters["channel"])]
-            elif "playlist_channel_title" in df_filtered.columns:
-                df_filtered = df_filtered[df_filtered["playlist_channel_title"].isin(filters["channel"])]
+            if "channel_title" in df.columns:
+                mask &= isin_mask(df["channel_title"], filters["channel"])
+            elif "playlist_channel_title" in df.columns:
+                mask &= isin_mask(df["playlist_channel_title"], filters["channel"])
 
         # Apply video type filter
-        if filters["video_type"] and "video_type" in df_filtered.columns:
-            df_filtered = df_filtered[df_filtered["video_type"].isin(filters["video_type"])]
+        if filters["video_type"] and "video_type" in df.columns:
+            mask &= isin_mask(df["video_type"], filters["video_type"])
 
         # Apply language filter
-        if filters["language"] and "default_audio_language" in df_filtered.columns:
-            df_filtered = df_filtered[df_filtered["default_audio_language"].isin(filters["language"])]
+        if filters["language"] and "default_audio_language" in df.columns:
+            mask &= isin_mask(df["default_audio_language"], filters["language"])
 
         # Apply playlist filter
-        if filters["playlists"] and "playlist_title" in df_filtered.columns:
-            df_filtered = df_filtered[df_filtered["playlist_title"].isin(filters["playlists"])]
+        if filters["playlists"] and "playlist_title" in df.columns:
+            mask &= isin_mask(df["playlist_title"], filters["playlists"])
 
-        # Apply date range filter
-        if filters["date_range"]:
-            date_col = None
-            for col in ["video_added_at", "playlist_published_at", "published_at"]:
-                if col in df_filtered.columns:
-                    date_col = col
-                    break
+        return np.flatnonzero(mask)
 
-            if date_col:
-                start_date, end_date = filters["date_range"]
-                df_filtered[date_col] = pd.to_datetime(df_filtered[date_col], errors='coerce')
-                df_filtered = df_filtered[
-                    (df_filtered[date_col].dt.date >= start_date) &
-                    (df_filtered[date_col].dt.date <= end_date)
-                ]
-
-        return df_filtered
+    def apply_filters(self, df, cache_key=None):
+        """
+        Apply current filters to a dataframe.
+
+        Args:
+            df: DataFrame to filter
+            cache_key: dataloader.load_key() of the table df is a view of; the selected rows
+                are then shared with every session through utils/filter_cache.py
+
+        Returns:
+            Filtered DataFrame
+        """
+        if df is None:
+            return None
+
+        filters = self.get_filter_state()
+        if cache_key is None:
+            rows = self.filter_rows(df, filters)
+        else:
+            key = filter_cache_key(cache_key, df, filters)
+            rows = FILTER_CACHE.rows(key, lambda: self.filter_rows(df, filters))
+        df_filtered = df.take(rows)
+
+        date_col = self._date_column(df_filtered)
+        if (
+            filters["date_range"]
+            and date_col
+            and not pd.api.types.is_datetime64_any_dtype(df_filtered[date_col])
+        ):
+            df_filtered[date_col] = pd.to_datetime(df_filtered[date_col], errors='coerce')
+
+        # Filtered-out values must not show up as empty categories in charts/counts
+        return drop_unused_categories(df_filtered)
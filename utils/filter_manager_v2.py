@@ -1,9 +1,16 @@
 import datetime
 import logging
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from utils.duckdb_backend import filter_positions, resolve_backend
+from utils.filter_cache import FILTER_CACHE, filter_cache_key
+from utils.filter_forms import FILTER_MODES, filter_form, record_commit
+from utils.facets import child_counts, child_options, column_facet, source_load_key
+from utils.filter_plan import FilterPlan
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,29 +20,42 @@ class FilterManager:
     Supports dynamic filter configuration based on DataFrame columns.
     """
 
-    def __init__(self, page_id, df_name, filter_config=None):
+    def __init__(self, page_id, df_name, filter_config=None, backend=None, mode=None):
         """
         Initialize the filter manager with configurable filters.
 
         Args:
             page_id: Unique identifier for the page
             df_name: Name of the dataframe for this page
+            backend: "pandas", "duckdb", "polars" or None for DATA_ENGINE
+                (see utils/duckdb_backend.py, PAGE_BACKENDS in config/pages.py)
+            mode: "live" (default: each widget change re-filters) or "apply" (filters
+                staged in a form, committed with one button; see utils/filter_forms.py,
+                PAGE_FILTER_MODES in config/pages.py). Cascading options follow the
+                committed parent selection in apply mode.
             filter_config: Dictionary of filter configurations
                 Format: {
                     "column_name": {
-                        "type": "multiselect|slider|date_range|boolean",
+                        "type": "multiselect|slider|range|text|top_n|date_range|boolean",
                         "label": "User-friendly label",
                         "default": default_value,
                         "options": [list of options] (optional for multiselect),
-                        "min": min_value (optional for slider),
-                        "max": max_value (optional for slider)
+                        "min": min_value (optional for slider, range and top_n),
+                        "max": max_value (optional for slider, range and top_n)
                     }
                 }
+                "range": numeric (low, high), bounds from the data by default;
+                "text": case-insensitive "contains" search;
+                "top_n": keep the N "group_by" groups with the largest value of the
+                    column on their latest "latest_by" row (e.g. the top 10 videos by
+                    view_count_slope at their last slope_date)
         """
         self.page_id = page_id
         self.df_name = df_name
         self.namespace = f"filters_{page_id}"
         self.filter_config = filter_config or {}
+        self.backend = backend
+        self.mode = mode if mode in FILTER_MODES else "live"
         self.init_filter_state()
 
     def init_filter_state(self):
@@ -76,164 +96,224 @@ class FilterManager:
             "Reset Filters", on_click=self.reset_filters, key=f"{self.namespace}_reset"
         )
 
-        # Create filter UI elements based on configuration
-        if dataframe is not None:
-            num_columns = min(3, len(self.filter_config))
-            if num_columns > 0:
-                cols = st.columns(num_columns)
-                col_idx = 0
-                for col_name, config in self.filter_config.items():
-                    if col_name not in dataframe.columns and config["type"] != "custom":
-                        continue
-                    with cols[col_idx % num_columns]:
-                        filter_type = config["type"]
-                        label = config["label"]
-                        widget_key = f"{self.namespace}_{col_name}"
-                        # Multiselect filter
-                        if filter_type == "multiselect":
-                            options = config.get("options", [])
-                            depends_on = config.get("depends_on", None)
-                            # Cascading filters
-                            if (
-                                depends_on
-                                and f"{self.namespace}_{depends_on}" in st.session_state
-                                and st.session_state[f"{self.namespace}_{depends_on}"]
-                            ):
-                                filtered_df = dataframe[
-                                    dataframe[depends_on].isin(
-                                        st.session_state[
-                                            f"{self.namespace}_{depends_on}"
-                                        ]
-                                    )
-                                ]
-                                if col_name in filtered_df.columns:
-                                    options = (
-                                        filtered_df[col_name].dropna().unique().tolist()
-                                    )
-                            elif not options and col_name in dataframe.columns:
-                                options = dataframe[col_name].dropna().unique().tolist()
-                            extra_params = config.get("extra_params", {})
-                            if extra_params.get("sort", False):
-                                options = sorted(options)
-                            widget_kwargs = {
-                                "label": label,
-                                "options": options,
-                                "key": widget_key,
-                            }
-                            for param, value in extra_params.items():
-                                if param not in ["sort"]:
-                                    widget_kwargs[param] = value
-                            st.multiselect(**widget_kwargs)
-                        # Slider filter
-                        elif filter_type == "slider":
-                            min_val = config.get("min", 0)
-                            max_val = config.get("max", 100)
+        # Create filter UI elements based on configuration; in "apply" mode they are staged
+        # in a form and committed together (utils/filter_forms.py)
+        if dataframe is not None and self.filter_config:
+            with filter_form(self.namespace, self.mode):
+                self._render_filter_widgets(dataframe)
+        # Return current filter state
+        return self.get_filter_state()
+
+    def _render_filter_widgets(self, dataframe):
+        """Render one widget per configured filter (in columns)."""
+        num_columns = min(3, len(self.filter_config))
+        if num_columns > 0:
+            cols = st.columns(num_columns)
+            col_idx = 0
+            for col_name, config in self.filter_config.items():
+                if col_name not in dataframe.columns and config["type"] != "custom":
+                    continue
+                with cols[col_idx % num_columns]:
+                    filter_type = config["type"]
+                    label = config["label"]
+                    widget_key = f"{self.namespace}_{col_name}"
+                    # Multiselect filter
+                    if filter_type == "multiselect":
+                        options = config.get("options", [])
+                        depends_on = config.get("depends_on", None)
+                        # Cascading filters
+                        if (
+                            depends_on
+                            and f"{self.namespace}_{depends_on}" in st.session_state
+                            and st.session_state[f"{self.namespace}_{depends_on}"]
+                        ):
+                            # Children of the selected parents from the facet index
+                            # built at load (utils/facets.py), no frame scan
                             if col_name in dataframe.columns:
-                                if min_val is None:
-                                    min_val = float(dataframe[col_name].min())
-                                if max_val is None:
-                                    max_val = float(dataframe[col_name].max())
+                                options = child_options(
+                                    dataframe,
+                                    depends_on,
+                                    col_name,
+                                    st.session_state[
+                                        f"{self.namespace}_{depends_on}"
+                                    ],
+                                )
+                                # Drop selected children of deselected parents
+                                selected = st.session_state.get(widget_key) or []
+                                available = set(options)
+                                if any(value not in available for value in selected):
+                                    st.session_state[widget_key] = [
+                                        value for value in selected if value in available
+                                    ]
+                        elif not options and col_name in dataframe.columns:
+                            options = column_facet(dataframe[col_name]).values
+                        extra_params = config.get("extra_params", {})
+                        if extra_params.get("sort", False):
+                            options = sorted(options)
+                        widget_kwargs = {
+                            "label": label,
+                            "options": options,
+                            "key": widget_key,
+                        }
+                        if extra_params.get("show_counts", False) and depends_on:
+                            # "Title (rows)" labels, counts from the facet index too
+                            parents = st.session_state.get(
+                                f"{self.namespace}_{depends_on}"
+                            ) or None
+                            counts = child_counts(dataframe, depends_on, col_name, parents)
+                            widget_kwargs["format_func"] = (
+                                lambda value, counts=counts: f"{value} ({counts.get(value, 0):,})"
+                            )
+                        for param, value in extra_params.items():
+                            if param not in ["sort", "show_counts"]:
+                                widget_kwargs[param] = value
+                        st.multiselect(**widget_kwargs)
+                    # Slider filter
+                    elif filter_type == "slider":
+                        min_val = config.get("min", 0)
+                        max_val = config.get("max", 100)
+                        if col_name in dataframe.columns:
+                            facet = column_facet(dataframe[col_name])
+                            if min_val is None:
+                                min_val = float(facet.min)
+                            if max_val is None:
+                                max_val = float(facet.max)
+                        st.slider(
+                            label,
+                            min_value=min_val,
+                            max_value=max_val,
+                            key=widget_key,
+                        )
+                    # Numeric range filter: bounds from the facet catalogue
+                    elif filter_type == "range":
+                        extra_params = config.get("extra_params", {})
+                        bounds = range_bounds(config, dataframe[col_name])
+                        if bounds is None:
+                            # No values to range over (all missing): no slider, no filter
+                            st.session_state.pop(widget_key, None)
+                        else:
+                            min_val, max_val = bounds
+                            # Unset (or out of the current bounds): the full range
+                            value = st.session_state.get(widget_key)
+                            low, high = (min_val, max_val) if value is None else value
+                            clamped = (
+                                max(min_val, min(low, max_val)),
+                                min(max_val, max(high, min_val)),
+                            )
+                            if value is None or tuple(value) != clamped:
+                                st.session_state[widget_key] = clamped
                             st.slider(
                                 label,
                                 min_value=min_val,
                                 max_value=max_val,
                                 key=widget_key,
+                                **extra_params,
                             )
-                        # Single-date filter
-                        elif filter_type == "date":
-                            widget_key = f"{self.namespace}_{col_name}"
-                            # Ensure the column is datetime
-                            if col_name in dataframe.columns:
-                                dataframe[col_name] = pd.to_datetime(
-                                    dataframe[col_name], errors="coerce"
-                                )
-                            # Render single date picker
-                            st.date_input(
-                                label,
-                                key=widget_key,
-                                value=st.session_state.get(widget_key),
-                                help=config.get("extra_params", {}).get("help"),
+                    # Text "contains" filter
+                    elif filter_type == "text":
+                        st.text_input(
+                            label,
+                            key=widget_key,
+                            help=config.get("extra_params", {}).get("help"),
+                        )
+                    # Top-N filter: number of groups kept
+                    elif filter_type == "top_n":
+                        st.slider(
+                            label,
+                            min_value=config.get("min", 1),
+                            max_value=config.get("max", 50),
+                            step=1,
+                            key=widget_key,
+                            help=config.get("extra_params", {}).get("help"),
+                        )
+                    # Single-date filter
+                    elif filter_type == "date":
+                        widget_key = f"{self.namespace}_{col_name}"
+                        # Ensure the column is datetime (loaded tables already are: keep
+                        # the shared column, its indexes and catalogue entry)
+                        if col_name in dataframe.columns and not (
+                            pd.api.types.is_datetime64_any_dtype(dataframe[col_name])
+                        ):
+                            dataframe[col_name] = pd.to_datetime(
+                                dataframe[col_name], errors="coerce"
                             )
-                        # Date range filter
-                        elif filter_type == "date_range":
-                            widget_key = f"{self.namespace}_{col_name}"
-                            # Ensure the column is datetime and determine min/max dates robustly
-                            if col_name in dataframe.columns:
-                                ts = pd.to_datetime(
-                                    dataframe[col_name], errors="coerce"
-                                )
-                                min_ts = ts.min()
-                                max_ts = ts.max()
-                                if pd.isna(min_ts) or pd.isna(max_ts):
-                                    min_date = datetime.date(2020, 1, 1)
-                                    max_date = datetime.date.today()
-                                else:
-                                    min_date = min_ts.date()
-                                    max_date = max_ts.date()
-                            else:
-                                min_date = datetime.date(2020, 1, 1)
-                                max_date = datetime.date.today()
-
-                            # Render a single date_range widget (two-date picker)
-                            st.date_input(
+                        # Render single date picker
+                        # Value from the session state (set by init_filter_state)
+                        st.date_input(
+                            label,
+                            key=widget_key,
+                            help=config.get("extra_params", {}).get("help"),
+                        )
+                    # Date range filter
+                    elif filter_type == "date_range":
+                        widget_key = f"{self.namespace}_{col_name}"
+                        # Date bounds from the facet catalogue (parsed there when needed)
+                        bounds = None
+                        if col_name in dataframe.columns:
+                            bounds = column_facet(dataframe[col_name]).date_bounds
+                        if bounds is not None:
+                            min_date, max_date = bounds
+                        else:
+                            min_date = datetime.date(2020, 1, 1)
+                            max_date = datetime.date.today()
+
+                        # Render a single date_range widget (two-date picker)
+                        st.date_input(
+                            label,
+                            min_value=min_date,
+                            max_value=max_date,
+                            key=widget_key,
+                            help=config.get("extra_params", {}).get("help"),
+                        )
+                    # Boolean filter
+                    elif filter_type == "boolean":
+                        options = ["Yes", "No"]
+                        widget_key_bool = f"{widget_key}_bool"
+                        extra_params = config.get("extra_params", {})
+                        widget_kwargs = {
+                            "label": label,
+                            "options": options,
+                            "key": widget_key_bool,
+                        }
+                        if "help" in extra_params:
+                            widget_kwargs["help"] = extra_params["help"]
+                        st.segmented_control(**widget_kwargs)
+                        selected = st.session_state.get(widget_key_bool)
+                        if selected == "Yes":
+                            st.session_state[widget_key] = True
+                        elif selected == "No":
+                            st.session_state[widget_key] = False
+                        else:
+                            st.session_state[widget_key] = None
+                    elif filter_type == "segmented":
+                        options = config.get("options", [])
+                        if not options and col_name in dataframe.columns:
+                            options = column_facet(dataframe[col_name]).values
+                        display_options = ["All"] + options
+                        widget_key_segmented = f"{widget_key}_segmented"
+                        extra_params = config.get("extra_params", {})
+                        widget_kwargs = {
+                            "label": label,
+                            "options": display_options,
+                            "key": widget_key_segmented,
+                        }
+                        if "help" in extra_params:
+                            widget_kwargs["help"] = extra_params["help"]
+                        st.segmented_control(**widget_kwargs)
+                        selected = st.session_state.get(widget_key_segmented)
+                        if selected == "All":
+                            st.session_state[widget_key] = None
+                        else:
+                            st.session_state[widget_key] = selected
+                    elif filter_type == "custom":
+                        if "render_func" in config:
+                            st.session_state[widget_key] = config["render_func"](
                                 label,
-                                value=st.session_state.get(widget_key),
-                                min_value=min_date,
-                                max_value=max_date,
-                                key=widget_key,
-                                help=config.get("extra_params", {}).get("help"),
+                                st.session_state.get(widget_key),
+                                dataframe,
+                                widget_key,
                             )
-                        # Boolean filter
-                        elif filter_type == "boolean":
-                            options = ["Yes", "No"]
-                            widget_key_bool = f"{widget_key}_bool"
-                            extra_params = config.get("extra_params", {})
-                            widget_kwargs = {
-                                "label": label,
-                                "options": options,
-                                "key": widget_key_bool,
-                            }
-                            if "help" in extra_params:
-                                widget_kwargs["help"] = extra_params["help"]
-                            st.segmented_control(**widget_kwargs)
-                            selected = st.session_state.get(widget_key_bool)
-                            if selected == "Yes":
-                                st.session_state[widget_key] = True
-                            elif selected == "No":
-                                st.session_state[widget_key] = False
-                            else:
-                                st.session_state[widget_key] = None
-                        elif filter_type == "segmented":
-                            options = config.get("options", [])
-                            if not options and col_name in dataframe.columns:
-                                options = dataframe[col_name].dropna().unique().tolist()
-                            display_options = ["All"] + options
-                            widget_key_segmented = f"{widget_key}_segmented"
-                            extra_params = config.get("extra_params", {})
-                            widget_kwargs = {
-                                "label": label,
-                                "options": display_options,
-                                "key": widget_key_segmented,
-                            }
-                            if "help" in extra_params:
-                                widget_kwargs["help"] = extra_params["help"]
-                            st.segmented_control(**widget_kwargs)
-                            selected = st.session_state.get(widget_key_segmented)
-                            if selected == "All":
-                                st.session_state[widget_key] = None
-                            else:
-                                st.session_state[widget_key] = selected
-                        elif filter_type == "custom":
-                            if "render_func" in config:
-                                st.session_state[widget_key] = config["render_func"](
-                                    label,
-                                    st.session_state.get(widget_key),
-                                    dataframe,
-                                    widget_key,
-                                )
-                    col_idx += 1
-        # Return current filter state
-        return self.get_filter_state()
+                col_idx += 1
 
     def get_filter_state(self):
         """Get current filter state."""
@@ -254,7 +334,7 @@ class FilterManager:
                 config = self.filter_config[col_name]
 
                 # Skip if no value is set
-                if value is None or (isinstance(value, list) and not value):
+                if value is None or (isinstance(value, (list, str)) and not value):
                     continue
 
                 filter_type = config["type"]
@@ -264,6 +344,12 @@ class FilterManager:
                     summary_parts.append(f"{label}: {', '.join(str(v) for v in value)}")
                 elif filter_type == "slider":
                     summary_parts.append(f"{label}: {value}")
+                elif filter_type == "range":
+                    summary_parts.append(f"{label}: {value[0]} to {value[1]}")
+                elif filter_type == "text":
+                    summary_parts.append(f'{label}: "{value}"')
+                elif filter_type == "top_n":
+                    summary_parts.append(f"{label}: {value}")
                 elif filter_type == "date_range" and value:
                     try:
                         start_date, end_date = value
@@ -287,104 +373,201 @@ class FilterManager:
         summary = " | ".join(summary_parts) if summary_parts else "No filters selected."
         st.markdown(f"**Active filters:** {summary}")
 
-    def apply_filters(self, df):
+    def get_predicates(self, df, filters):
         """
-        Apply current filters to a dataframe.
+        Translate the filter state into backend predicates (see utils/duckdb_backend.py).
 
         Args:
-            df: DataFrame to filter
+            df: DataFrame the filters apply to
+            filters: Filter state, as returned by get_filter_state()
 
         Returns:
-            Filtered DataFrame
+            Tuple (predicates, remaining filters that must be applied with pandas)
         """
-        if df is None:
-            return None
-
-        filters = self.get_filter_state()
-        df_filtered = df.copy()
-
-        # Apply each configured filter
+        predicates = []
+        remaining = {}
         for col_name, value in filters.items():
-            # Skip if column doesn't exist or value is not set
-            if col_name not in df_filtered.columns or value is None:
+            if col_name not in df.columns or value is None:
                 continue
-
             if col_name not in self.filter_config:
                 continue
 
-            config = self.filter_config[col_name]
-            filter_type = config["type"]
-
-            # Apply based on filter type
-            if filter_type == "multiselect" and value:
-                df_filtered = df_filtered[df_filtered[col_name].isin(value)]
-
-            elif filter_type == "slider":
-                min_val, max_val = value
-                df_filtered = df_filtered[
-                    (df_filtered[col_name] >= min_val)
-                    & (df_filtered[col_name] <= max_val)
-                ]
-
-            # elif filter_type == "date" and value is not None:
-            elif filter_type == "date" and isinstance(value, datetime.date):
-                # Filter for items on or after the selected date
-                df_filtered[col_name] = pd.to_datetime(
-                    df_filtered[col_name], errors="coerce"
+            filter_type = self.filter_config[col_name]["type"]
+            # Only tz-naive datetimes: date comparisons then match the .dt.date path
+            dtype = df[col_name].dtype
+            is_datetime = isinstance(dtype, np.dtype) and dtype.kind == "M"
+
+            if filter_type == "multiselect":
+                if value:
+                    predicates.append((col_name, "in", list(value)))
+            elif filter_type in ("slider", "range"):
+                predicates.append((col_name, "between", tuple(value)))
+            elif filter_type in ("boolean", "segmented"):
+                predicates.append((col_name, "==", value))
+            elif (
+                filter_type == "date"
+                and is_datetime
+                and isinstance(value, datetime.date)
+            ):
+                predicates.append((col_name, ">=", pd.Timestamp(value)))
+            elif (
+                filter_type == "date_range"
+                and is_datetime
+                and isinstance(value, (tuple, list))
+                and len(value) == 2
+            ):
+                start_date, end_date = value
+                predicates.append((col_name, ">=", pd.Timestamp(start_date)))
+                predicates.append(
+                    (col_name, "<", pd.Timestamp(end_date) + pd.Timedelta(days=1))
                 )
-                df_filtered = df_filtered[df_filtered[col_name].dt.date >= value]
+            else:
+                # Text, top-N (on the pushed-down rows) and custom filters
+                remaining[col_name] = value
+        return predicates, remaining
 
-            elif filter_type == "date_range" and value is not None:
-                try:
-                    # Handle date range - by this point, value should always be a tuple of (start_date, end_date)
-                    # thanks to our normalization in the render_filters method
-                    if isinstance(value, (tuple, list)) and len(value) == 2:
-                        start_date, end_date = value
-                    else:
-                        # If somehow we got a single date, use it for both start and end
-                        if isinstance(value, datetime.date):
-                            start_date = end_date = value
-                        else:
-                            # Skip filtering if value is not in expected format
-                            st.warning(
-                                f"Unexpected date format for {col_name}: {value}. Skipping filter."
-                            )
-                            continue
-
-                    # Apply filter
-                    if col_name in df_filtered.columns:
-                        # Convert column to datetime if it's not already
-                        if df_filtered[col_name].dtype.kind not in ["M"]:
-                            df_filtered[col_name] = pd.to_datetime(
-                                df_filtered[col_name], errors="coerce"
-                            )
+    def compile_plan(self, df, filters=None):
+        """
+        Compile a filter state into a FilterPlan for df (see utils/filter_plan.py).
 
-                        # Handle NaT values - skip rows with missing dates
-                        df_filtered = df_filtered.dropna(subset=[col_name])
+        Args:
+            df: DataFrame the filters apply to
+            filters: Filter state (defaults to the current one)
+        """
+        if filters is None:
+            filters = self.get_filter_state()
+        return FilterPlan.compile(self.filter_config, filters, df.columns)
 
-                        # Apply date range filter - convert column dates to date objects for comparison
-                        mask = (df_filtered[col_name].dt.date >= start_date) & (
-                            df_filtered[col_name].dt.date <= end_date
-                        )
-                        df_filtered = df_filtered[mask]
-                except Exception as e:
-                    st.warning(f"Error applying date filter for {col_name}: {e}")
-                    # Skip this filter if there's an error
-                    continue
+    def explain(self, df):
+        """Text description of how the current filters run on df (FilterPlan.explain)."""
+        return self.compile_plan(df).explain(df)
 
-            elif filter_type == "boolean" and value is not None:
-                # For boolean toggle, we filter by exact match (True or False)
-                # Note: if value is None, we don't filter ("All" option)
-                df_filtered = df_filtered[df_filtered[col_name] == value]
+    def _filter_columns(self):
+        """Columns the filters read (the key of their rows in the filter cache)."""
+        columns = []
+        for col_name, config in self.filter_config.items():
+            if config["type"] == "custom":
+                continue  # applied after the take, not part of the cached rows
+            columns.append(col_name)
+            if config["type"] == "top_n":
+                columns.extend(c for c in (config["group_by"], config.get("latest_by")) if c)
+        return columns
+
+    def apply_filters(self, df, cache_key=None, top_n=True):
+        """
+        Apply current filters to a dataframe.
 
-            elif filter_type == "segmented" and value is not None:
-                # For segmented, we filter by the exact value (not a list)
-                df_filtered = df_filtered[df_filtered[col_name] == value]
+        All filters are evaluated as boolean masks over df itself and the result is
+        materialised once; df is never copied or modified (see utils/filter_plan.py).
 
-            elif filter_type == "custom" and "apply_func" in config:
-                df_filtered = config["apply_func"](df_filtered, value)
+        Args:
+            df: DataFrame to filter
+            cache_key: dataloader.load_key() of the table df is a view of; the selected rows
+                are then shared with every session through utils/filter_cache.py. Looked up
+                from df's filter columns when None (utils/facets.source_load_key)
+            top_n: False to ignore the top-N filters (every matching row)
 
-        return df_filtered
+        Returns:
+            Filtered DataFrame
+        """
+        if df is None:
+            return None
+
+        state = self.get_filter_state()
+        record_commit(self.namespace, self.mode, state)
+        if not top_n:
+            state = {
+                col_name: value
+                for col_name, value in state.items()
+                if self.filter_config.get(col_name, {}).get("type") != "top_n"
+            }
+        filters = state
+        predicates = None
+        backend = resolve_backend(self.backend)
+        if backend != "pandas":
+            # Push the standard filters down to DuckDB/Polars, keep the rest (custom) for pandas
+            predicates, filters = self.get_predicates(df, filters)
+
+        plan = self.compile_plan(df, filters)
+        for warning in plan.warnings:
+            st.warning(warning)
+
+        def compute_rows():
+            positions = None
+            if predicates:
+                positions = filter_positions(df, predicates, backend=backend)
+            return plan.rows(df, positions, top_n=False)
+
+        if cache_key is None:
+            cache_key = source_load_key(df, self._filter_columns())
+        if cache_key is None:
+            return plan.apply(df, rows=plan.select_top_n(df, compute_rows()))
+        rows = cached_filter_rows(self.filter_config, df, plan, state, cache_key, compute_rows)
+        return plan.apply(df, rows=rows)
+
+
+def range_bounds(config, series):
+    """
+    (min, max) of a "range" filter: configured bounds, else the column's (facet catalogue).
+    None when a bound is neither configured nor known (empty or all-missing column).
+    """
+    min_val, max_val = config.get("min"), config.get("max")
+    if min_val is None or max_val is None:
+        facet = column_facet(series)
+        min_val = facet.min if min_val is None else min_val
+        max_val = facet.max if max_val is None else max_val
+    if pd.isna(min_val) or pd.isna(max_val):
+        return None
+    extra_params = config.get("extra_params", {})
+    cast = (
+        int
+        if isinstance(extra_params.get("step"), int) or pd.api.types.is_integer_dtype(series)
+        else float
+    )
+    return cast(min_val), cast(max_val)
+
+
+def cached_filter_rows(filter_config, df, plan, state, cache_key, compute_rows):
+    """
+    Rows of a filter state from the filter cache (utils/filter_cache.py): the rows of the
+    filters other than top-N (compute_rows on a miss), then the top-N selection of them.
+    """
+    ranks = {name for name, config in filter_config.items() if config["type"] == "top_n"}
+    selections = [
+        name for name, config in filter_config.items() if config["type"] == "multiselect"
+    ]
+    matching = {name: value for name, value in state.items() if name not in ranks}
+    key = filter_cache_key(cache_key, df, matching, selections, filter_config)
+    rows = FILTER_CACHE.rows(key, compute_rows)
+    if plan.top_n:
+        key = filter_cache_key(cache_key, df, state, selections, filter_config)
+        rows = FILTER_CACHE.rows(key, lambda: plan.select_top_n(df, rows))
+    return rows
+
+
+def default_filter_state(filter_config, df):
+    """Filter state a new session commits before touching any widget (ranges: full bounds)."""
+    state = {}
+    for col_name, config in filter_config.items():
+        value = config.get("default")
+        if config["type"] == "range" and value is None and col_name in df.columns:
+            value = range_bounds(config, df[col_name])
+        state[col_name] = value
+    return state
+
+
+def warm_filter_cache(filter_config, df, cache_key):
+    """
+    Put the rows of the default filters (with and without the top-N filters) in the filter
+    cache, so the first session of a page finds them (see utils/prewarm.py). No session needed.
+    """
+    state = default_filter_state(filter_config, df)
+    ranks = {name for name, config in filter_config.items() if config["type"] == "top_n"}
+    for filters in (state, {name: value for name, value in state.items() if name not in ranks}):
+        plan = FilterPlan.compile(filter_config, filters, df.columns)
+        cached_filter_rows(
+            filter_config, df, plan, filters, cache_key, lambda: plan.rows(df, top_n=False)
+        )
 
 
 # Helper function to create common filter configurations
@@ -437,7 +620,8 @@ def create_filter_config(df_name, df=None):
         if df is not None:
             for col_name in ["channel_title", "video_type", "default_audio_language"]:
                 if col_name in df.columns:
-                    unique_values = df[col_name].dropna().unique().tolist()
+                    # Facet catalogue: computed once per table version, not per rerun
+                    unique_values = list(column_facet(df[col_name]).values)
                     if col_name in config:
                         if config[col_name]["type"] == "multiselect":
                             config[col_name]["options"] = unique_values
@@ -460,6 +644,7 @@ def create_filter_config(df_name, df=None):
                 "depends_on": "playlist_channel_title",  # This makes playlists depend on channel selection
                 "extra_params": {
                     "sort": True,
+                    "show_counts": True,  # rows per playlist in the labels (utils/facets.py)
                     "help": "Select playlists to include",
                     "placeholder": "Choose one or more playlists",
                 },
@@ -499,22 +684,20 @@ def create_filter_config(df_name, df=None):
                 if col_name in df.columns:
                     # For all columns except those with dependencies, populate options directly
                     if "depends_on" not in config[col_name]:
-                        config[col_name]["options"] = (
-                            df[col_name].dropna().unique().tolist()
-                        )
+                        # Facet catalogue: computed once per table version, not per rerun
+                        facet = column_facet(df[col_name])
+                        config[col_name]["options"] = list(facet.values)
 
                         # Sort if requested
                         if "extra_params" in config[col_name] and config[col_name][
                             "extra_params"
                         ].get("sort", False):
-                            config[col_name]["options"] = sorted(
-                                config[col_name]["options"]
-                            )
+                            config[col_name]["options"] = list(facet.sorted_values)
 
             # For playlist_title, we'll pre-populate but it will be filtered in render_filters
             if "playlist_title" in config and "playlist_title" in df.columns:
-                config["playlist_title"]["options"] = (
-                    df["playlist_title"].dropna().unique().tolist()
+                config["playlist_title"]["options"] = list(
+                    column_facet(df["playlist_title"]).values
                 )
 
             # # Set full-range defaults for date filters so they include all data initially
@@ -529,6 +712,68 @@ def create_filter_config(df_name, df=None):
             #             default_range = (min_ts.date(), max_ts.date())
             #         config[date_col]["default"] = default_range
 
+        return config
+    elif df_name == "df_slope_full" or df_name == "tbl_slope_full":
+        config = {
+            "published_at": {
+                "type": "date_range",
+                "label": "Published At Range",
+                "default": None,
+            },
+            "default_audio_language": {
+                "type": "multiselect",
+                "label": "Audio Language",
+                "default": [],
+            },
+            "video_type": {
+                "type": "multiselect",
+                "label": "Video Type",
+                "default": [],
+            },
+            "channel_title": {
+                "type": "multiselect",
+                "label": "Channel",
+                "default": [],
+            },
+            "view_count_slope": {
+                "type": "top_n",
+                "label": "Top N Results",
+                "default": 10,
+                "min": 1,
+                "max": 50,
+                "group_by": "video_id",
+                "latest_by": "slope_date",
+                "extra_params": {
+                    "help": "Videos with the largest view_count_slope at their latest slope_date"
+                },
+            },
+            "duration_formatted_seconds": {
+                "type": "range",
+                "label": "Duration (seconds)",
+                "default": None,  # full range
+                "extra_params": {"step": 1},
+            },
+            "title": {"type": "text", "label": "Title contains", "default": ""},
+            "description": {"type": "text", "label": "Description contains", "default": ""},
+            "video_id": {"type": "text", "label": "Video ID contains", "default": ""},
+        }
+
+        # Options and defaults from the DataFrame: every language and channel, Regular
+        # videos, published in the last year
+        if df is not None:
+            for col_name in ["default_audio_language", "video_type", "channel_title"]:
+                if col_name in df.columns:
+                    config[col_name]["options"] = list(column_facet(df[col_name]).values)
+            for col_name in ["default_audio_language", "channel_title"]:
+                config[col_name]["default"] = list(config[col_name].get("options", []))
+            if "Regular" in config["video_type"].get("options", []):
+                config["video_type"]["default"] = ["Regular"]
+            if "published_at" in df.columns:
+                bounds = column_facet(df["published_at"]).date_bounds
+                if bounds is not None:
+                    one_year_ago = bounds[1] - datetime.timedelta(days=365)
+                    config["published_at"]["default"] = (max(bounds[0], one_year_ago), bounds[1])
+
         return config
     # Add more configurations for other DataFrames as needed
     return {}
@@ -0,0 +1,392 @@
+"""
+Compiled filter plans for FilterManager.apply_filters (utils/filter_manager_v2.py).
+
+The filter state is compiled once into a FilterPlan. Its predicates are evaluated as numpy
+boolean masks over the untouched base frame and combined in place, then the result is
+materialised once (df.take, or a zero-copy slice when only a date window applies). No
+intermediate frames are built and the shared table is never copied or converted.
+
+- Date filters on a date-sorted column (utils/date_layout.py) cut a row window with two
+  binary searches first; the other masks are then computed over that window only.
+- Multiselect and segmented filters on indexed columns read the rows of the selected values
+  from the table's row-id index (utils/row_index.py); other multiselects on categoricals
+  compare the integer codes.
+- Date filters on other date columns with a timestamp index (utils/row_index.py) mark only
+  the rows between two binary searches of the index.
+- Text filters ("contains", case-insensitive, literal) run last, on the rows the other steps
+  kept only; on categoricals they are evaluated once per category, not per row.
+- Top-N filters (the N groups with the largest value at their latest date, e.g. the top 10
+  videos by view_count_slope) select from the matching rows, before the take.
+- Custom filters (apply_func on a DataFrame) cannot be masks: they run after the take.
+
+    plan = FilterPlan.compile(filter_config, filter_state, df.columns)
+    print(plan.explain(df))
+    df_filtered = plan.apply(df)
+
+Compare with per-filter slicing with:
+    python -m benchmarks filters --rows 1000000
+"""
+
+import datetime
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.date_layout import _int64_view, day_bounds
+from utils.dtype_optimizer import drop_unused_categories
+from utils.row_index import column_index, date_index, date_sorted
+
+DATE_TYPES = ("date", "date_range")
+# Operators evaluated on the rows kept by the other steps only
+DEFERRED_OPS = ("contains",)
+
+
+def _bool_array(result: pd.Series) -> np.ndarray:
+    """numpy bool array of a comparison result, missing values counting as False."""
+    return result.to_numpy(dtype=bool, na_value=False)
+
+
+def _date_values(series: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+    """int64 view of a date column (parsed when it is not a datetime) and the datetime series."""
+    values = _int64_view(series)
+    if values is None:
+        series = pd.to_datetime(series, errors="coerce")
+        values = _int64_view(series)
+    return values, series
+
+
+def top_n_positions(
+    df: pd.DataFrame,
+    positions: np.ndarray,
+    order_by: str,
+    n: int,
+    group_by: str,
+    latest_by: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Positions (among positions) of the n groups of group_by with the largest order_by value
+    on their latest latest_by row (last non-missing order_by value per group), like
+    df.sort_values(latest_by).groupby(group_by).last().nlargest(n, order_by).
+    """
+    columns = [group_by, order_by] + ([latest_by] if latest_by and latest_by != order_by else [])
+    rows = df[columns].take(positions)
+    groups = rows[group_by]
+    if latest_by:
+        rows = rows.sort_values(latest_by, kind="stable")
+    latest = rows.groupby(group_by, as_index=False, observed=True)[order_by].last()
+    top = latest.nlargest(n, order_by)[group_by]
+    return positions[_bool_array(groups.isin(top))]
+
+
+class FilterPlan:
+    """
+    Filter state compiled into steps (column, filter type, operator, value), top-N selections
+    (order_by, n, group_by, latest_by) applied to the matching rows, and custom filters
+    applied after the take. Build with FilterPlan.compile.
+    """
+
+    def __init__(
+        self,
+        steps: List[Tuple],
+        custom: List[Tuple],
+        warnings: List[str],
+        top_n: Optional[List[Tuple]] = None,
+    ):
+        self.steps = steps
+        self.custom = custom
+        self.warnings = warnings
+        self.top_n = top_n or []
+
+    @classmethod
+    def compile(
+        cls,
+        filter_config: Dict[str, dict],
+        filters: Dict[str, object],
+        columns: Iterable[str],
+    ) -> "FilterPlan":
+        """
+        Compile a FilterManager state.
+
+        Args:
+            filter_config: FilterManager filter configuration
+            filters: Filter state, as returned by FilterManager.get_filter_state()
+            columns: Columns of the frame the plan will run on (filters on others are skipped)
+
+        Returns:
+            FilterPlan with the date steps first and the text steps last
+        """
+        columns = set(columns)
+        steps, custom, warnings, top_n = [], [], [], []
+        for col_name, value in filters.items():
+            if col_name not in columns or value is None or col_name not in filter_config:
+                continue
+            config = filter_config[col_name]
+            filter_type = config["type"]
+
+            if filter_type == "multiselect":
+                if value:
+                    steps.append((col_name, filter_type, "in", list(value)))
+            elif filter_type in ("slider", "range"):
+                steps.append((col_name, filter_type, "between", tuple(value)))
+            elif filter_type == "text":
+                if isinstance(value, str) and value:
+                    steps.append((col_name, filter_type, "contains", value))
+            elif filter_type == "top_n":
+                group_by, latest_by = config["group_by"], config.get("latest_by")
+                if value and group_by in columns and (latest_by is None or latest_by in columns):
+                    top_n.append((col_name, int(value), group_by, latest_by))
+            elif filter_type in ("boolean", "segmented"):
+                steps.append((col_name, filter_type, "==", value))
+            elif filter_type == "date":
+                if isinstance(value, datetime.date):
+                    # On or after the selected date
+                    steps.append((col_name, filter_type, "date_range", (value, None)))
+            elif filter_type == "date_range":
+                if isinstance(value, (tuple, list)) and len(value) == 2:
+                    steps.append((col_name, filter_type, "date_range", tuple(value)))
+                elif isinstance(value, datetime.date):
+                    steps.append((col_name, filter_type, "date_range", (value, value)))
+                else:
+                    # Includes the 1-tuple of a range picker whose end date is not chosen
+                    # yet: the filter is skipped until the range is complete
+                    warnings.append(
+                        f"Unexpected date format for {col_name}: {value}. Skipping filter."
+                    )
+            elif filter_type == "custom" and "apply_func" in config:
+                custom.append((col_name, config["apply_func"], value))
+
+        # Date windows first: on date-sorted tables they bound every other mask; text last
+        steps.sort(key=lambda step: (step[2] in DEFERRED_OPS, step[1] not in DATE_TYPES))
+        return cls(steps, custom, warnings, top_n)
+
+    def __bool__(self) -> bool:
+        return bool(self.steps or self.custom or self.top_n)
+
+    def _window(self, df: pd.DataFrame) -> Tuple[int, int, List[Tuple]]:
+        """Row window [lo, hi) from the date steps on sorted columns, and the remaining steps."""
+        lo, hi = 0, len(df)
+        remaining = []
+        for step in self.steps:
+            col_name, _, op, value = step
+            if op == "date_range" and date_sorted(df[col_name]):
+                series = df[col_name]
+                low, high = day_bounds(series, *value)
+                first, last = np.searchsorted(_int64_view(series), [low, high], side="left")
+                lo, hi = max(lo, int(first)), min(hi, int(last))
+            else:
+                remaining.append(step)
+        return lo, max(lo, hi), remaining
+
+    @staticmethod
+    def _step_mask(series: pd.Series, op: str, value) -> np.ndarray:
+        """Boolean mask of one step over a (window of a) column."""
+        if op == "in":
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes = series.cat.codes.to_numpy()
+                wanted = series.cat.categories.get_indexer(pd.Index(value).dropna())
+                return np.isin(codes, wanted[wanted >= 0])
+            return _bool_array(series.isin(value))
+        if op == "between":
+            return _bool_array(series.between(value[0], value[1]))
+        if op == "contains":
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # One test per category, then a lookup per row (code -1: missing, no match)
+                matched = _bool_array(
+                    series.cat.categories.to_series().astype(str).str.contains(
+                        value, case=False, regex=False, na=False
+                    )
+                )
+                return np.append(matched, False)[series.cat.codes.to_numpy()]
+            return _bool_array(series.str.contains(value, case=False, regex=False, na=False))
+        if op == "==":
+            return _bool_array(series == value)
+        if op == "date_range":
+            values, series = _date_values(series)
+            low, high = day_bounds(series, *value)
+            return (values >= low) & (values < high)
+        raise ValueError(f"Unsupported filter operator '{op}'")
+
+    @staticmethod
+    def _indexed(df: pd.DataFrame, col_name: str, op: str, value):
+        """(row index, selected values) when the step can be read from a row-id index."""
+        if op not in ("in", "==") or (op == "==" and pd.api.types.is_scalar(value) and pd.isna(value)):
+            return None  # == NaN matches nothing, the index would return the missing rows
+        index = column_index(df[col_name])
+        if index is None:
+            return None
+        return index, (value if op == "in" else [value])
+
+    def positions(self, df: pd.DataFrame) -> Tuple[int, int, Optional[np.ndarray]]:
+        """
+        Rows matching every step.
+
+        Returns:
+            (lo, hi, positions): the matching rows are all of df.iloc[lo:hi] when positions
+            is None, else exactly the (sorted) positions
+        """
+        lo, hi, remaining = self._window(df)
+        if len(remaining) == 1:
+            # One indexed filter: its rows are the result, no mask at all
+            indexed = self._indexed(df, *[remaining[0][i] for i in (0, 2, 3)])
+            if indexed is not None:
+                index, values = indexed
+                return lo, hi, index.rows_for(values, lo, hi)
+        mask = None
+        for col_name, _, op, value in remaining:
+            if hi == lo:
+                break
+            indexed = self._indexed(df, col_name, op, value)
+            if op in DEFERRED_OPS and mask is not None:
+                # Only the rows still matching are tested
+                kept = np.flatnonzero(mask)
+                mask[kept] = self._step_mask(df[col_name].iloc[lo:hi].take(kept), op, value)
+                continue
+            if indexed is not None:
+                index, values = indexed
+                step_mask = index.mask(values, lo, hi)
+            elif op == "date_range" and date_index(df[col_name]) is not None:
+                series = df[col_name]
+                step_mask = date_index(series).mask(*day_bounds(series, *value), lo, hi)
+            else:
+                step_mask = self._step_mask(df[col_name].iloc[lo:hi], op, value)
+            if mask is None:
+                mask = step_mask
+            else:
+                np.logical_and(mask, step_mask, out=mask)
+        if mask is None:
+            return lo, hi, None
+        return lo, hi, lo + np.flatnonzero(mask)
+
+    def rows(self, df: pd.DataFrame, positions: Optional[np.ndarray] = None, top_n: bool = True):
+        """
+        Rows selected by the mask steps and top-N selections (custom filters excluded): a
+        slice for a date window alone or no step at all, else the sorted positions.
+        Cacheable, see utils/filter_cache.py.
+
+        Args:
+            df: Base frame (not modified)
+            positions: Optional rows already selected (e.g. by a DuckDB/Polars pushdown) that
+                the plan's own steps are intersected with
+            top_n: False for the rows before the top-N selections (see select_top_n)
+        """
+        if not self.steps:
+            matched = slice(0, len(df)) if positions is None else positions
+        else:
+            lo, hi, matched = self.positions(df)
+            if matched is None and positions is None:
+                matched = slice(lo, hi)
+            else:
+                if matched is None:
+                    matched = np.arange(lo, hi)
+                if positions is not None:
+                    matched = np.intersect1d(matched, positions, assume_unique=True)
+        return self.select_top_n(df, matched) if top_n else matched
+
+    def select_top_n(self, df: pd.DataFrame, rows):
+        """Top-N selections applied to rows (a result of rows(df, top_n=False))."""
+        if not self.top_n:
+            return rows
+        if isinstance(rows, slice):
+            rows = np.arange(rows.start, rows.stop)
+        for order_by, n, group_by, latest_by in self.top_n:
+            rows = top_n_positions(df, rows, order_by, n, group_by, latest_by)
+        return rows
+
+    def apply(
+        self,
+        df: pd.DataFrame,
+        positions: Optional[np.ndarray] = None,
+        rows=None,
+    ) -> pd.DataFrame:
+        """
+        Filtered frame, materialised once, with unused categories dropped.
+
+        Args:
+            df: Base frame (not modified)
+            positions: Optional rows already selected (e.g. by a DuckDB/Polars pushdown) that
+                the plan's own steps are intersected with
+            rows: Optional result of rows() for df (e.g. from the filter cache)
+        """
+        if rows is None:
+            rows = self.rows(df, positions)
+        if isinstance(rows, slice):
+            if rows == slice(0, len(df)):
+                # Shallow (copy-on-write) copy: drop_unused_categories must not touch the shared frame
+                df_filtered = df.copy(deep=False)
+            else:
+                # Only a date window: zero-copy slice
+                df_filtered = df.iloc[rows]
+        else:
+            df_filtered = df.take(rows)
+
+        for _, apply_func, value in self.custom:
+            df_filtered = apply_func(df_filtered, value)
+        return drop_unused_categories(df_filtered)
+
+    def explain(self, df: Optional[pd.DataFrame] = None) -> str:
+        """
+        Human-readable plan. With df, each step is also run and reports the rows it keeps and
+        its time (steps are timed separately, so the total is higher than apply()).
+        """
+        lines = [
+            f"FilterPlan: {len(self.steps)} mask step(s), {len(self.top_n)} top-N, "
+            f"{len(self.custom)} custom filter(s)"
+        ]
+        if df is not None:
+            lines[0] += f" over {len(df):,} rows"
+            lo, hi, _ = self._window(df)
+            if (lo, hi) != (0, len(df)):
+                lines.append(f"  date window (binary search): rows {lo:,}..{hi:,}")
+
+        for index, (col_name, filter_type, op, value) in enumerate(self.steps, start=1):
+            if op == "in":
+                shown = f"in {len(value)} value(s)"
+            elif op == "date_range":
+                shown = f"date in [{value[0]}, {value[1] if value[1] is not None else '...'}]"
+            elif op == "contains":
+                shown = f"contains {value!r} (case-insensitive)"
+            else:
+                shown = f"{op} {value!r}"
+            line = f"  {index}. {col_name} ({filter_type}): {shown}"
+            if df is not None:
+                series = df[col_name]
+                if op == "date_range" and date_sorted(series):
+                    line += " -> sorted, part of the date window"
+                else:
+                    indexed = self._indexed(df, col_name, op, value)
+                    timestamps = date_index(series) if op == "date_range" else None
+                    if indexed is not None:
+                        line += " [row index]"
+                    elif timestamps is not None:
+                        line += " [timestamp index]"
+                    elif op in ("in", "contains") and isinstance(
+                        series.dtype, pd.CategoricalDtype
+                    ):
+                        line += " [categorical codes]"
+                    if op in DEFERRED_OPS:
+                        line += " (on the rows the other steps keep)"
+                    start = time.perf_counter()
+                    if indexed is not None:
+                        kept = len(indexed[0].rows_for(indexed[1]))
+                    elif timestamps is not None:
+                        kept = len(timestamps.positions(*day_bounds(series, *value)))
+                    else:
+                        kept = int(self._step_mask(series, op, value).sum())
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    line += f" -> keeps {kept:,} rows alone, {elapsed_ms:,.2f} ms"
+            lines.append(line)
+
+        for order_by, n, group_by, latest_by in self.top_n:
+            latest = f" at the latest {latest_by}" if latest_by else ""
+            lines.append(f"  top {n} {group_by} by {order_by}{latest} (on the matching rows)")
+        for col_name, _, _ in self.custom:
+            lines.append(f"  custom: {col_name} (apply_func after the take)")
+        if df is not None:
+            rows = self.rows(df)
+            how = "zero-copy slice" if isinstance(rows, slice) else "one take"
+            rows = rows.stop - rows.start if isinstance(rows, slice) else len(rows)
+            lines.append(f"  result: {rows:,} rows ({how})")
+        lines.extend(f"  warning: {warning}" for warning in self.warnings)
+        return "\n".join(lines)
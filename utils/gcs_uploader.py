@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """
+# 2026-10-16: Heavy imports (google-cloud-storage) are lazy (utils/lazy_imports.py)
 # 2024-03-27: Utilitário para upload de arquivos no Google Cloud Storage
 """
 
@@ -11,9 +12,11 @@ import os
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from google.cloud import storage
-
 from utils.config import GCS_BUCKET, GCS_VISION_PREFIX
+from utils.lazy_imports import lazy_module
+
+# Imported on first upload/check, not when the Thumbnails page opens
+storage = lazy_module("google.cloud.storage")
 
 # Configure logging
 logger = logging.getLogger(__name__)
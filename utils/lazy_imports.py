@@ -0,0 +1,96 @@
+"""
+Lazy imports for heavy optional dependencies of the page modules.
+
+Page and block modules are imported when the user opens the page (main.py uses importlib),
+so everything they import at top level is paid on the first render, even for a chart the
+user never expands. Heavy packages are bound as lazy proxies instead:
+
+    from utils.lazy_imports import lazy_module, lazy_attr
+
+    plt = lazy_module("matplotlib.pyplot")
+    sns = lazy_module("seaborn")
+    make_subplots = lazy_attr("plotly.subplots", "make_subplots")
+
+The real import happens on first attribute access (plt.subplots(...)) or call, and is
+then reused. statsmodels needs no proxy: plotly imports it only when a trendline is drawn.
+
+Page modules must also be free of other import-time side effects (no load_data() at module
+level): load data inside render(), the loaders are cached.
+
+Measure the import cost of each page with:
+    python -m benchmarks importtime
+"""
+
+import importlib
+import sys
+import threading
+
+# Heavy packages kept out of page import time (checked by the importtime benchmark)
+HEAVY_MODULES = [
+    "google.cloud.vision_v1",
+    "openai",
+    "statsmodels",
+    "seaborn",
+    "matplotlib",
+    "plotly.subplots",
+]
+
+_IMPORT_LOCK = threading.Lock()
+
+
+class LazyModule:
+    """Proxy for a module, imported on first attribute access."""
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            with _IMPORT_LOCK:
+                module = self.__dict__["_module"]
+                if module is None:
+                    module = importlib.import_module(self.__dict__["_name"])
+                    self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_module(name: str):
+    """The module itself when already imported, else a LazyModule proxy for it."""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+def lazy_attr(module_name: str, attr: str):
+    """
+    Callable standing for `from module_name import attr` (functions and classes to call),
+    importing the module on first call.
+    """
+    module = lazy_module(module_name)
+
+    def call(*args, **kwargs):
+        return getattr(module, attr)(*args, **kwargs)
+
+    call.__name__ = attr
+    call.__qualname__ = attr
+    call.__doc__ = f"Lazy {module_name}.{attr}"
+    return call
+
+
+def loaded_heavy_modules():
+    """The HEAVY_MODULES already imported in this process."""
+    return [name for name in HEAVY_MODULES if name in sys.modules]
@@ -0,0 +1,108 @@
+"""
+Local-directory stand-in for the google-cloud-storage client, for running the GCS sync
+(utils/dataretriever.py) offline.
+
+A bucket is a sub-directory of the root and a blob is a file under it, so
+    <root>/creators_engine_production/data/duckdb_mirror/tbl_nerdalytics.parquet
+is served as gs://creators_engine_production/data/duckdb_mirror/tbl_nerdalytics.parquet.
+Blobs expose the metadata the sync compares (size, generation, md5_hash, crc32c); the
+generation is the file's mtime in nanoseconds, so touching or replacing a file publishes
+a new generation.
+
+Select it with GCS_FAKE_DIR=<root>:
+    GCS_FAKE_DIR=/tmp/fake_gcs LOCAL_DATA_DIR=/tmp/data python -m utils.dataretriever
+"""
+
+import base64
+import hashlib
+import os
+import shutil
+
+_CHUNK_BYTES = 8 * 2**20
+
+
+def _b64(digest: bytes) -> str:
+    return base64.b64encode(digest).decode("ascii")
+
+
+class LocalBlob:
+    """File under a LocalBucket, with the google.cloud.storage.Blob attributes the sync uses."""
+
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.path = os.path.join(bucket.path, *name.split("/"))
+        self.reload()
+
+    def reload(self):
+        """Refresh size, generation and checksums from the file (like Blob.reload)."""
+        self.size = self.generation = self.md5_hash = self.crc32c = None
+        if not os.path.isfile(self.path):
+            return
+        stat = os.stat(self.path)
+        self.size = stat.st_size
+        self.generation = stat.st_mtime_ns
+        md5 = hashlib.md5()
+        crc = _crc32c()
+        with open(self.path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_BYTES), b""):
+                md5.update(chunk)
+                if crc is not None:
+                    crc.update(chunk)
+        self.md5_hash = _b64(md5.digest())
+        self.crc32c = _b64(crc.digest()) if crc is not None else None
+
+    def exists(self):
+        return os.path.isfile(self.path)
+
+    def download_to_filename(self, filename):
+        if not self.exists():
+            raise FileNotFoundError(f"No such object: {self.bucket.name}/{self.name}")
+        shutil.copyfile(self.path, filename)
+
+
+class LocalBucket:
+    """Directory <root>/<bucket name>."""
+
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+        self.path = os.path.join(client.root, name)
+
+    def blob(self, name):
+        return LocalBlob(self, name)
+
+    def get_blob(self, name):
+        """Blob with its metadata, or None when it does not exist (like Bucket.get_blob)."""
+        blob = LocalBlob(self, name)
+        return blob if blob.exists() else None
+
+
+class LocalDirectoryClient:
+    """storage.Client look-alike serving buckets from sub-directories of root."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def bucket(self, bucket_name):
+        return LocalBucket(self, bucket_name)
+
+    def list_blobs(self, bucket_name, prefix=""):
+        bucket = self.bucket(bucket_name)
+        names = []
+        for directory, _, files in os.walk(bucket.path):
+            for file_name in files:
+                relative = os.path.relpath(os.path.join(directory, file_name), bucket.path)
+                name = relative.replace(os.sep, "/")
+                if name.startswith(prefix):
+                    names.append(name)
+        return [LocalBlob(bucket, name) for name in sorted(names)]
+
+
+def _crc32c():
+    """New CRC32C checksum object (google-crc32c), None when the package is missing."""
+    try:
+        import google_crc32c
+    except ImportError:
+        return None
+    return google_crc32c.Checksum()
@@ -1,9 +1,13 @@
 """
 Shared navigation/render logic for modular Streamlit pages.
 Call render_page(blocks_config) from your page's render() function.
+
+Blocks may declare the columns they read per table with an optional "columns" key:
+    {"name": "Radar", "func": block, "columns": {"tbl_playlist_full_dedup": ["video_id", ...]}}
+Use page_columns(PAGE_BLOCKS, table_name) to get the projection to pass to load_data().
 """
 import streamlit as st
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, Optional
 
 def render_page(blocks_config: List[Dict[str, Callable]]):
     tab_names = [block["name"] for block in blocks_config]
@@ -12,3 +16,20 @@ def render_page(blocks_config: List[Dict[str, Callable]]):
         if block["name"] == selected_tab:
             block["func"]()
             break
+
+
+def page_columns(blocks_config: List[Dict], table_name: str) -> Optional[List[str]]:
+    """
+    Union of the columns the blocks declare for table_name.
+
+    A block without a "columns" key is assumed to need every column, so the result is None
+    (load the full table). A block whose "columns" dict omits table_name does not use it.
+    """
+    columns = []
+    for block in blocks_config:
+        if "columns" not in block:
+            return None
+        for col in block["columns"].get(table_name, []):
+            if col not in columns:
+                columns.append(col)
+    return columns
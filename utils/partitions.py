@@ -0,0 +1,128 @@
+"""
+Date-partitioned Parquet layout for append-only tables (e.g. tbl_slope_full).
+
+Layout:
+    <root>/<column>=YYYY-MM-DD/part.parquet
+
+Each partition holds the rows of one day, so a daily refresh only adds a directory:
+dataretriever downloads just the new partitions and the dataloader reads just those
+and appends them to the table already in memory.
+
+Split an existing single-file table into partitions with:
+    python -m utils.partitions data/tbl_slope_full.parquet slope_date
+"""
+
+import argparse
+import os
+import tempfile
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from utils.date_layout import DATE_ROW_GROUP_SIZE
+
+PARTITION_FILE = "part.parquet"
+
+
+def partition_dir(root: str, column: str, value) -> str:
+    """Directory of the partition holding the rows where column == value (a date)."""
+    return os.path.join(root, f"{column}={pd.Timestamp(value):%Y-%m-%d}")
+
+
+def list_partitions(root: str, column: str) -> List[Tuple[str, str]]:
+    """
+    Partitions present under root, oldest first.
+
+    Returns:
+        List of (partition value as YYYY-MM-DD, path of its Parquet file)
+    """
+    if not os.path.isdir(root):
+        return []
+    prefix = f"{column}="
+    partitions = []
+    for name in os.listdir(root):
+        path = os.path.join(root, name, PARTITION_FILE)
+        if name.startswith(prefix) and os.path.isfile(path):
+            partitions.append((name[len(prefix) :], path))
+    return sorted(partitions)
+
+
+def partition_columns(partitions: Sequence[Tuple[str, str]], column: str) -> List[str]:
+    """Columns of a partitioned table, read from the newest partition's footer."""
+    names = pq.read_schema(partitions[-1][1]).names
+    names = [name for name in names if not name.startswith("__index_level_")]
+    return names if column in names else names + [column]
+
+
+def read_partitions(
+    partitions: Sequence[Tuple[str, str]],
+    column: str,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Read and concatenate partitions, restoring the partition column from the directory
+    name when the files do not carry it.
+
+    Args:
+        partitions: (value, path) pairs from list_partitions
+        column: Partition column name
+        columns: Optional column projection
+    """
+    tables = []
+    for value, path in partitions:
+        available = pq.read_schema(path).names
+        read_columns = None
+        if columns is not None:
+            read_columns = [col for col in columns if col in available]
+        table = pq.read_table(path, columns=read_columns)
+        if column not in available and (columns is None or column in columns):
+            day = np.datetime64(value, "ns")
+            table = table.append_column(column, pa.array(np.full(len(table), day)))
+        tables.append(table)
+    if not tables:
+        return pd.DataFrame(columns=list(columns or []))
+    return pa.concat_tables(tables, promote_options="default").to_pandas()
+
+
+def write_partitions(df: pd.DataFrame, root: str, column: str) -> List[str]:
+    """
+    Write df as one partition per day of `column` (temp file + rename per partition).
+
+    Returns:
+        Paths of the written partition files
+    """
+    written = []
+    days = pd.to_datetime(df[column], errors="coerce").dt.normalize()
+    for day, part in df.groupby(days):
+        directory = partition_dir(root, column, day)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            part.to_parquet(tmp_path, index=False, row_group_size=DATE_ROW_GROUP_SIZE)
+            os.replace(tmp_path, os.path.join(directory, PARTITION_FILE))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        written.append(os.path.join(directory, PARTITION_FILE))
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split a Parquet file into daily partitions")
+    parser.add_argument("source", help="single-file table, e.g. data/tbl_slope_full.parquet")
+    parser.add_argument("column", help="date column to partition on, e.g. slope_date")
+    parser.add_argument("--root", help="output directory (default: source without .parquet)")
+    args = parser.parse_args()
+
+    root = args.root or os.path.splitext(args.source)[0]
+    written = write_partitions(pd.read_parquet(args.source), root, args.column)
+    print(f"Wrote {len(written)} partitions under {root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Optional Polars execution engine for the data layer (DATA_ENGINE=polars in utils/config.py).
+
+Filters and group aggregations run as Polars lazy queries: predicates are pushed into the
+scan and the work is spread over all cores (pandas uses one). Results are converted back to
+pandas only where page code needs them (plots, st.dataframe):
+- filter_positions returns row positions, so filtered frames are taken from the shared pandas
+  table and keep its exact dtypes and index;
+- group_aggregate returns a small pandas frame, equal to the pandas groupby it replaces;
+- lazy_frame wraps a prepared table (its memory-mapped Arrow snapshot when available) for
+  pages that stay in Polars until to_pandas().
+
+Predicates and aggregations use the format of utils/duckdb_backend.py. When polars is not
+installed every caller falls back to pandas.
+
+Parity with pandas is tested in tests/test_polars_engine.py; time the engine with:
+    python -m benchmarks polars --rows 100000
+"""
+
+import logging
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.config import DATA_ENGINE
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ("pandas", "polars")
+
+# Column holding the original row positions in the frames sent to Polars
+_ROW_COLUMN = "__row_position"
+
+
+def polars_available() -> bool:
+    """True when the polars package can be imported."""
+    try:
+        import polars  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_engine(engine: Optional[str] = None) -> str:
+    """Engine actually used (None means DATA_ENGINE; "polars" falls back to "pandas" if missing)."""
+    engine = engine or DATA_ENGINE
+    if engine == "polars" and polars_available():
+        return "polars"
+    if engine not in ENGINES:
+        logger.warning(f"Unknown data engine '{engine}', using pandas")
+    return "pandas"
+
+
+def _from_pandas(df: pd.DataFrame, columns: Sequence[str]):
+    """Polars frame of the given columns plus the row positions."""
+    import polars as pl
+
+    frame = pl.from_pandas(df[list(columns)], nan_to_null=True)
+    return frame.with_columns(pl.Series(_ROW_COLUMN, np.arange(len(df), dtype=np.int64)))
+
+
+def _literal(value):
+    """Python value usable in a Polars expression."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value
+
+
+def predicate_expr(predicates: Sequence[Tuple]):
+    """Single Polars expression combining the (column, op, value) predicates with AND."""
+    import polars as pl
+
+    expr = pl.lit(True)
+    for col, op, value in predicates:
+        column = pl.col(col)
+        if op == "in":
+            clause = column.is_in([_literal(v) for v in value])
+        elif op == "between":
+            clause = column.is_between(_literal(value[0]), _literal(value[1]))
+        elif op == "==":
+            clause = column == _literal(value)
+        elif op == ">=":
+            clause = column >= _literal(value)
+        elif op == "<=":
+            clause = column <= _literal(value)
+        elif op == "<":
+            clause = column < _literal(value)
+        elif op == ">":
+            clause = column > _literal(value)
+        else:
+            raise ValueError(f"Unsupported predicate operator '{op}'")
+        # Rows where the predicate is null (missing values) are dropped, like pandas
+        expr = expr & clause.fill_null(False)
+    return expr
+
+
+def filter_positions(df: pd.DataFrame, predicates: Sequence[Tuple]) -> np.ndarray:
+    """Sorted positions of the rows of df matching all predicates."""
+    if not predicates:
+        return np.arange(len(df))
+    columns = list(dict.fromkeys(col for col, _, _ in predicates))
+    result = (
+        _from_pandas(df, columns)
+        .lazy()
+        .filter(predicate_expr(predicates))
+        .select(_ROW_COLUMN)
+        .collect()
+    )
+    return result[_ROW_COLUMN].to_numpy()
+
+
+_AGGREGATIONS = {
+    "sum": lambda col: col.sum(),
+    "mean": lambda col: col.mean(),
+    "count": lambda col: col.count(),
+    "nunique": lambda col: col.drop_nulls().n_unique(),
+    "min": lambda col: col.min(),
+    "max": lambda col: col.max(),
+}
+
+
+def group_aggregate(
+    df: pd.DataFrame,
+    by: Sequence[str],
+    aggregations: Dict[str, Tuple[str, str]],
+    predicates: Optional[Sequence[Tuple]] = None,
+) -> pd.DataFrame:
+    """
+    Grouped aggregation on Polars, equivalent to
+        df.groupby(by, observed=True, as_index=False).agg(**aggregations)
+    (see utils.duckdb_backend.group_aggregate for the arguments).
+    """
+    import polars as pl
+
+    by = list(by)
+    for out, (col, func) in aggregations.items():
+        if func not in _AGGREGATIONS:
+            raise ValueError(f"Unsupported aggregation '{func}' for '{out}'")
+
+    columns = list(
+        dict.fromkeys(
+            by
+            + [col for col, _ in aggregations.values()]
+            + [col for col, _, _ in predicates or []]
+        )
+    )
+    query = (
+        _from_pandas(df, columns)
+        .lazy()
+        .filter(predicate_expr(predicates or []))
+        .drop_nulls(subset=by)
+        .group_by(by)
+        .agg(
+            [
+                _AGGREGATIONS[func](pl.col(col)).alias(out)
+                for out, (col, func) in aggregations.items()
+            ]
+        )
+        .sort(by)
+    )
+    result = query.collect().to_pandas()
+
+    # Match the pandas result dtypes (Polars counts as u32, keeps Utf8 keys)
+    for out, (col, func) in aggregations.items():
+        if func in ("count", "nunique") or (
+            func == "sum" and pd.api.types.is_integer_dtype(df[col].dtype)
+        ):
+            result[out] = result[out].astype("int64")
+    for col in by:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            result[col] = result[col].astype(df[col].dtype)
+    return result
+
+
+def lazy_frame(
+    df: Optional[pd.DataFrame],
+    snapshot: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+):
+    """
+    Polars LazyFrame over a prepared table.
+
+    Args:
+        df: The prepared pandas table (used when there is no snapshot)
+        snapshot: Optional Arrow IPC snapshot of the same table version (utils/snapshot.py);
+            it is memory-mapped and only the selected columns are handed to Polars
+        columns: Optional column projection
+
+    Returns:
+        pl.LazyFrame
+    """
+    import polars as pl
+    import pyarrow as pa
+
+    if snapshot is not None:
+        try:
+            # pyarrow reads the mapped file: Polars' own IPC reader rejects the dictionary
+            # indices pyarrow writes under null categoricals
+            table = pa.ipc.open_file(pa.memory_map(snapshot, "r")).read_all()
+            if columns is not None:
+                table = table.select([col for col in table.column_names if col in columns])
+            return pl.from_arrow(table).lazy()
+        except Exception as e:
+            if df is None:
+                raise
+            logger.warning(f"Could not read snapshot {snapshot}, converting the table: {e}")
+    if columns is not None:
+        df = df[[col for col in df.columns if col in columns]]
+    return pl.from_pandas(df, nan_to_null=True).lazy()
+
+
+def to_pandas(frame) -> pd.DataFrame:
+    """Collect a Polars (lazy) frame into pandas, at the plotting boundary."""
+    if hasattr(frame, "collect"):
+        frame = frame.collect()
+    df = frame.to_pandas()
+    # Missing strings come back as None; the prepared pandas tables use NaN (see treat_nulls)
+    for col in df.columns:
+        if df[col].dtype == object and df[col].isna().any():
+            df[col] = df[col].fillna(np.nan)
+    return df
@@ -0,0 +1,86 @@
+"""
+Background pre-warming of the pages, so the first visit after a deploy does not pay for
+imports, Parquet parsing and enrichment.
+
+Started once per process by main.py on the first request (PREWARM_PAGES in utils/config.py,
+PREWARM_PAGES=0 disables it). A daemon thread then, for every module of PAGE_CONFIG:
+1. imports it (lazy heavy imports stay lazy, see utils/lazy_imports.py);
+2. loads the data it declares in PAGE_COLUMNS ({table: columns or None for all}) into the
+   shared load cache, which also builds the derived tables and snapshots;
+3. calls its optional module-level prewarm() for anything else worth computing up front,
+   e.g. the rows of a page's default filters when they are not empty (modules/ai_labs.py).
+
+When the app runs under warm start (utils/warm_start.py) the pre-warmer waits for the
+data to be ready first. Per-page timings are logged and kept in prewarm_status().
+"""
+
+import importlib
+import logging
+import threading
+import time
+
+import streamlit as st
+
+from config.pages import PAGE_CONFIG
+from utils.config import PREWARM_PAGES
+from utils.dataloader import load_data
+from utils.warm_start import is_ready
+
+logger = logging.getLogger(__name__)
+
+_STATUS = {"state": "idle", "pages": {}, "total_s": None}
+
+
+def prewarm_status() -> dict:
+    """State of the pre-warmer and {page key: {"import_ms", "data_ms", "error"}} timings."""
+    return {**_STATUS, "pages": dict(_STATUS["pages"])}
+
+
+def prewarm_page(module_name: str) -> dict:
+    """Import one page module and warm its declared data. Returns its timings."""
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    import_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for table, columns in getattr(module, "PAGE_COLUMNS", {}).items():
+        load_data(table, columns)
+    hook = getattr(module, "prewarm", None)
+    if callable(hook):
+        hook()
+    data_ms = (time.perf_counter() - start) * 1000
+    return {"import_ms": round(import_ms, 1), "data_ms": round(data_ms, 1), "error": None}
+
+
+def _run() -> None:
+    while not is_ready():
+        time.sleep(1)
+
+    _STATUS["state"] = "running"
+    start = time.perf_counter()
+    for key, (_, _, module_name) in PAGE_CONFIG.items():
+        try:
+            timings = prewarm_page(module_name)
+        except Exception as e:
+            # The page will load on demand, as without pre-warming
+            logger.warning(f"Prewarm {key} failed: {e}")
+            timings = {"import_ms": None, "data_ms": None, "error": str(e)}
+        else:
+            logger.info(
+                f"Prewarm {key}: import {timings['import_ms']:,.0f} ms, "
+                f"data {timings['data_ms']:,.0f} ms"
+            )
+        _STATUS["pages"][key] = timings
+    _STATUS["total_s"] = round(time.perf_counter() - start, 2)
+    _STATUS["state"] = "done"
+    logger.info(f"Prewarm finished: {len(PAGE_CONFIG)} pages in {_STATUS['total_s']:.1f}s")
+
+
+@st.cache_resource
+def start_prewarm() -> bool:
+    """Start the pre-warmer once per process (no-op when PREWARM_PAGES is off)."""
+    if not PREWARM_PAGES:
+        _STATUS["state"] = "disabled"
+        return False
+    threading.Thread(target=_run, name="page-prewarm", daemon=True).start()
+    return True
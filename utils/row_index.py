@@ -0,0 +1,291 @@
+"""
+Row-id indexes of the categorical filter columns, built once per table version at load.
+
+For every column of INDEX_COLUMNS a loaded table has, the index stores the row positions
+grouped by value (rows sorted by value code, ascending within a value, plus offsets).
+A multiselect or segmented filter then reads the rows of the selected values instead of
+comparing every row with Series.isin on each Streamlit rerun:
+- OR within a column: the selected values' row lists set one boolean mask;
+- AND across columns: the masks are combined (utils/filter_plan.py);
+- a single value gives its (sorted) rows directly, without any mask.
+
+Indexes are found from the column itself: session views of a cached table
+(dataloader.shared_view) share its column buffers, so isin_mask(df[col], values) uses the
+index of the loaded table and falls back to Series.isin for any other frame (filtered,
+modified or not indexed). Index sizes are part of dataloader.get_memory_report().
+
+Date columns of DATE_INDEX_COLUMNS that are not the table's sort key (utils/date_layout.py)
+get a timestamp index instead: the row positions in timestamp order, so date_mask resolves
+a date range with two binary searches and marks only the matching rows. Whether a datetime
+column is already sorted is checked once at load too (date_sorted), so a date filter never
+scans the column to find out.
+"""
+
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.date_layout import _int64_view, day_bounds, is_date_sorted
+
+# Columns indexed when a table has them
+INDEX_COLUMNS = [
+    "channel_title",
+    "playlist_channel_title",
+    "playlist_title",
+    "video_type",
+    "default_audio_language",
+    "category_id",
+]
+
+# Date columns given a sorted timestamp index when a table has them and is not sorted by them
+DATE_INDEX_COLUMNS = [
+    "published_at",
+    "video_added_at",
+    "playlist_published_at",
+    "playlist_item_published_at",
+    "slope_date",
+]
+
+# Indexed table builds kept (same bound as the dataloader load cache)
+MAX_INDEXED_TABLES = 32
+
+
+def _codes_array(series: pd.Series) -> Optional[np.ndarray]:
+    """The array whose buffer identifies a column: categorical codes or numpy values."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return np.asarray(series.array.codes)
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        return _int64_view(series)
+    return None  # extension arrays: to_numpy() may copy, no stable identity
+
+
+def _buffer_key(series: pd.Series) -> Optional[Tuple]:
+    array = _codes_array(series)
+    if array is None:
+        return None
+    return (array.__array_interface__["data"][0], array.strides, len(array), array.dtype.str)
+
+
+class ColumnIndex:
+    """Row positions of one column grouped by value."""
+
+    def __init__(self, series: pd.Series):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = np.asarray(series.array.codes)
+            self.categories = series.cat.categories
+        else:
+            codes, self.categories = pd.factorize(series, use_na_sentinel=True)
+        # Keeps the indexed buffer alive, so its address cannot be reused by another column
+        self._anchor = _codes_array(series)
+        self.length = len(series)
+        row_dtype = np.int32 if self.length < 2**31 else np.int64
+        # Stable sort: rows ascending inside every value; missing values (-1) first
+        self.rows = np.argsort(codes, kind="stable").astype(row_dtype, copy=False)
+        counts = np.bincount(codes.astype(np.int64) + 1, minlength=len(self.categories) + 1)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    @property
+    def nbytes(self) -> int:
+        return self.rows.nbytes + self.offsets.nbytes
+
+    def _groups(self, values: Iterable[Hashable]):
+        """(start, end) of the rows of each selected value (missing values match NaN, like isin)."""
+        values = pd.Index(list(values))
+        codes = self.categories.get_indexer(values.dropna())
+        groups = [(self.offsets[c + 1], self.offsets[c + 2]) for c in np.unique(codes[codes >= 0])]
+        if values.hasnans:
+            groups.append((self.offsets[0], self.offsets[1]))
+        return groups
+
+    def rows_for(self, values: Iterable[Hashable], lo: int = 0, hi: Optional[int] = None) -> np.ndarray:
+        """Sorted positions in [lo, hi) whose value is one of values."""
+        hi = self.length if hi is None else hi
+        parts = []
+        for start, end in self._groups(values):
+            rows = self.rows[start:end]
+            if (lo, hi) != (0, self.length):
+                first, last = np.searchsorted(rows, [lo, hi], side="left")
+                rows = rows[first:last]
+            parts.append(rows)
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        if len(parts) == 1:
+            return parts[0].astype(np.int64)
+        return np.sort(np.concatenate(parts)).astype(np.int64)
+
+    def mask(self, values: Iterable[Hashable], lo: int = 0, hi: Optional[int] = None) -> np.ndarray:
+        """Boolean mask over rows [lo, hi): True where the value is one of values."""
+        hi = self.length if hi is None else hi
+        mask = np.zeros(hi - lo, dtype=bool)
+        for start, end in self._groups(values):
+            rows = self.rows[start:end]
+            if (lo, hi) != (0, self.length):
+                first, last = np.searchsorted(rows, [lo, hi], side="left")
+                rows = rows[first:last]
+            mask[rows - lo] = True
+        return mask
+
+
+class DateIndex:
+    """Row positions of one datetime column in timestamp order (NaT first)."""
+
+    def __init__(self, series: pd.Series):
+        values = _int64_view(series)
+        self._anchor = _codes_array(series)
+        self.length = len(series)
+        row_dtype = np.int32 if self.length < 2**31 else np.int64
+        self.order = np.argsort(values, kind="stable").astype(row_dtype, copy=False)
+        self.sorted_values = values[self.order]
+
+    @property
+    def nbytes(self) -> int:
+        return self.order.nbytes + self.sorted_values.nbytes
+
+    def positions(self, low: int, high: int) -> np.ndarray:
+        """Unsorted positions of the rows with low <= timestamp (int64) < high."""
+        first, last = np.searchsorted(self.sorted_values, [low, high], side="left")
+        return self.order[first:last]
+
+    def mask(self, low: int, high: int, lo: int = 0, hi: Optional[int] = None) -> np.ndarray:
+        """Boolean mask over rows [lo, hi): True where low <= timestamp (int64) < high."""
+        hi = self.length if hi is None else hi
+        mask = np.zeros(hi - lo, dtype=bool)
+        rows = self.positions(low, high)
+        if (lo, hi) != (0, self.length):
+            rows = rows[(rows >= lo) & (rows < hi)]
+        mask[rows - lo] = True
+        return mask
+
+
+class SortedDates:
+    """Marks a datetime column already in timestamp order (NaT first): searched in place."""
+
+    nbytes = 0
+
+    def __init__(self, series: pd.Series):
+        self._anchor = _codes_array(series)
+        self.length = len(series)
+
+
+_LOCK = threading.Lock()
+# (table, columns, version) -> {column: ColumnIndex, DateIndex or SortedDates}, oldest first
+_TABLE_INDEXES = OrderedDict()
+# buffer key of an indexed column -> its ColumnIndex, DateIndex or SortedDates
+_BY_BUFFER: Dict[Tuple, object] = {}
+
+
+def build_table_indexes(key: Tuple, df: pd.DataFrame) -> Dict[str, object]:
+    """
+    Index the INDEX_COLUMNS and the unsorted DATE_INDEX_COLUMNS of a loaded table, and
+    record which of its datetime columns are sorted.
+
+    Args:
+        key: (table, columns, version) of the load; older builds beyond MAX_INDEXED_TABLES
+            are dropped
+        df: The cached table (must not be modified afterwards)
+    """
+    indexes = {}
+    for col in INDEX_COLUMNS:
+        if col in df.columns and _buffer_key(df[col]) is not None:
+            indexes[col] = ColumnIndex(df[col])
+    for col in df.columns:
+        if _int64_view(df[col]) is None or _buffer_key(df[col]) is None:
+            continue
+        # Sorted columns are binary-searched in place, the others read a timestamp index
+        if is_date_sorted(df[col]):
+            indexes[col] = SortedDates(df[col])
+        elif col in DATE_INDEX_COLUMNS:
+            indexes[col] = DateIndex(df[col])
+    with _LOCK:
+        _drop(key)
+        _TABLE_INDEXES[key] = indexes
+        for col, index in indexes.items():
+            _BY_BUFFER[_buffer_key(df[col])] = index
+        while len(_TABLE_INDEXES) > MAX_INDEXED_TABLES:
+            _drop(next(iter(_TABLE_INDEXES)))
+    return indexes
+
+
+def _drop(key: Tuple) -> None:
+    for index in _TABLE_INDEXES.pop(key, {}).values():
+        for buffer_key, known in list(_BY_BUFFER.items()):
+            if known is index:
+                del _BY_BUFFER[buffer_key]
+
+
+def column_index(series: pd.Series) -> Optional[ColumnIndex]:
+    """Index of a column of a loaded table (or of a shared view of it), None otherwise."""
+    key = _buffer_key(series)
+    if key is None:
+        return None
+    index = _BY_BUFFER.get(key)
+    if not isinstance(index, ColumnIndex):
+        return None
+    return index if index.length == len(series) else None
+
+
+def date_index(series: pd.Series) -> Optional[DateIndex]:
+    """Timestamp index of a date column of a loaded table (or of a shared view of it)."""
+    key = _buffer_key(series)
+    if key is None:
+        return None
+    index = _BY_BUFFER.get(key)
+    if not isinstance(index, DateIndex):
+        return None
+    return index if index.length == len(series) else None
+
+
+def date_sorted(series: pd.Series) -> bool:
+    """
+    True when a datetime column is ascending with its missing dates first. Known without a
+    scan for the columns of a loaded table (or a shared view of it), checked otherwise.
+    """
+    key = _buffer_key(series)
+    known = _BY_BUFFER.get(key) if key is not None else None
+    if isinstance(known, (SortedDates, DateIndex)) and known.length == len(series):
+        return isinstance(known, SortedDates)
+    return is_date_sorted(series)
+
+
+def date_mask(
+    series: pd.Series,
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+) -> np.ndarray:
+    """
+    Boolean numpy mask of start_date <= series.dt.date <= end_date (None for open ends),
+    without building a date object per row: binary searches on the timestamp index or on a
+    sorted column, else one int64 comparison.
+    """
+    values = _int64_view(series)
+    if values is None:
+        raise TypeError(f"Column '{series.name}' is not a datetime column ({series.dtype})")
+    low, high = day_bounds(series, start_date, end_date)
+    index = date_index(series)
+    if index is not None:
+        return index.mask(low, high)
+    if date_sorted(series):
+        mask = np.zeros(len(values), dtype=bool)
+        first, last = np.searchsorted(values, [low, high], side="left")
+        mask[first:last] = True
+        return mask
+    return (values >= low) & (values < high)
+
+
+def isin_mask(series: pd.Series, values: Iterable[Hashable]) -> np.ndarray:
+    """Boolean numpy mask of series.isin(values), read from the row index when there is one."""
+    index = column_index(series)
+    if index is not None:
+        return index.mask(values)
+    return series.isin(list(values)).to_numpy(dtype=bool, na_value=False)
+
+
+def index_bytes(key: Tuple) -> int:
+    """Memory held by the indexes of one load (0 when not indexed)."""
+    return sum(index.nbytes for index in _TABLE_INDEXES.get(key, {}).values())
@@ -0,0 +1,123 @@
+"""
+Memory-mapped Arrow IPC snapshots of the prepared (typed, cleaned, enriched) tables.
+
+A snapshot is an uncompressed Arrow IPC file named <table>-<version>-v<format>.arrow.
+Loading it memory-maps the file instead of parsing and decompressing Parquet and rerunning the
+type conversions; numeric columns reference the mapped pages directly, so only the
+columns (and pages) a page reads are brought into memory.
+
+Snapshots are written by the dataloader after a full build, or ahead of time with:
+    python -m utils.snapshot
+"""
+
+import glob
+import json
+import logging
+import os
+import tempfile
+from typing import Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Bump when the preparation steps (type conversion, null treatment, dtypes) change
+SNAPSHOT_FORMAT_VERSION = 2
+
+# Schema metadata key holding the null-token conversion counts recorded at build time
+NULL_TOKENS_METADATA_KEY = b"null_tokens_converted"
+
+
+def snapshot_path(snapshot_dir: str, table_name: str, version: str) -> str:
+    """Path of the snapshot of table_name at the given table version."""
+    return os.path.join(
+        snapshot_dir, f"{table_name}-{version}-v{SNAPSHOT_FORMAT_VERSION}.arrow"
+    )
+
+
+def write_snapshot(
+    df: pd.DataFrame,
+    snapshot_dir: str,
+    table_name: str,
+    version: str,
+    null_tokens: Optional[dict] = None,
+) -> str:
+    """
+    Write df as an uncompressed Arrow IPC file (temp file + rename) and remove older
+    snapshots of the same table.
+
+    Args:
+        df: Prepared table
+        snapshot_dir: Directory holding the snapshots
+        table_name: Registry table name
+        version: Table version the snapshot was built from
+        null_tokens: Optional {column: count} stored in the schema metadata
+
+    Returns:
+        Path of the written snapshot
+    """
+    path = snapshot_path(snapshot_dir, table_name, version)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if null_tokens:
+        metadata = dict(table.schema.metadata or {})
+        metadata[NULL_TOKENS_METADATA_KEY] = json.dumps(null_tokens).encode("utf-8")
+        table = table.replace_schema_metadata(metadata)
+
+    os.makedirs(snapshot_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=snapshot_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    for old in glob.glob(os.path.join(snapshot_dir, f"{table_name}-*.arrow")):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError as e:
+                logger.warning(f"Could not remove stale snapshot {old}: {e}")
+    return path
+
+
+def read_snapshot(path: str, columns: Optional[Sequence[str]] = None):
+    """
+    Memory-map a snapshot and convert the requested columns to pandas.
+
+    Args:
+        path: Snapshot file
+        columns: Optional column projection; columns missing from the snapshot are skipped
+
+    Returns:
+        Tuple (DataFrame, null token counts recorded at build time)
+    """
+    source = pa.memory_map(path, "r")
+    table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select([col for col in table.column_names if col in columns])
+
+    metadata = table.schema.metadata or {}
+    null_tokens = json.loads(metadata.get(NULL_TOKENS_METADATA_KEY, b"{}"))
+
+    # split_blocks keeps one block per column so numeric columns stay views of the mapped file
+    df = table.to_pandas(split_blocks=True)
+    return df, null_tokens
+
+
+def main():
+    """Build snapshots of every public table at its current version."""
+    logging.basicConfig(level=logging.INFO)
+    from utils.dataloader import PUBLIC_TABLES, load_table
+
+    for table_name in PUBLIC_TABLES:
+        df = load_table(table_name)
+        logger.info(f"Snapshot ready for {table_name}: {df.shape}")
+
+
+if __name__ == "__main__":
+    main()
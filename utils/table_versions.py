@@ -0,0 +1,48 @@
+"""
+Content versions of the data files, used as cache keys instead of time-based expiry.
+
+A file's version is the hash of its contents. The hash is memoised on the file's
+(mtime, size), so checking versions on every rerun costs one os.stat per file and the
+file is only re-read after dataretriever (or anything else) replaced it.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Iterable
+
+from utils.derived_cache import file_hash
+
+# Version reported for a file that does not exist (yet)
+MISSING_VERSION = "missing"
+
+# path -> (mtime_ns, size, content hash)
+_HASH_MEMO = {}
+_MEMO_LOCK = threading.Lock()
+
+
+def file_version(path: str) -> str:
+    """Content hash of the file at path, recomputed only when its mtime or size changed."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return MISSING_VERSION
+    signature = (stat.st_mtime_ns, stat.st_size)
+    memo = _HASH_MEMO.get(path)
+    if memo is not None and memo[:2] == signature:
+        return memo[2]
+    with _MEMO_LOCK:
+        memo = _HASH_MEMO.get(path)
+        if memo is None or memo[:2] != signature:
+            memo = (*signature, file_hash(path))
+            _HASH_MEMO[path] = memo
+    return memo[2]
+
+
+def combine_versions(versions: Iterable[str]) -> str:
+    """Single version for something computed from several versioned inputs."""
+    digest = hashlib.blake2b(digest_size=8)
+    for version in versions:
+        digest.update(version.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
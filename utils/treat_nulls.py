@@ -2,13 +2,47 @@
 Utility functions for treating null values in DataFrames.
 """
 
-import numpy as np
+import pandas as pd
+
+# String representations of null values found in the source tables
+NULL_REPRESENTATIONS = [
+    "null",
+    "N/A",
+    "None",
+    "na",
+    "n/a",
+    "none",
+    "NULL",
+    "NA",
+    "",
+]
+
+# df.attrs key holding {column: number of null tokens converted}
+NULL_TOKENS_ATTR = "null_tokens_converted"
+
+
+def _mask_null_tokens(series):
+    """
+    Return a boolean mask of the values in series that are null tokens.
+
+    The column is dictionary-encoded once (pd.factorize) and the tokens are looked up
+    in the small array of distinct values, instead of comparing every row against
+    every token.
+    """
+    codes, uniques = pd.factorize(series)
+    is_token = pd.Index(uniques).isin(NULL_REPRESENTATIONS)
+    if not is_token.any():
+        return None
+    # codes == -1 marks values that are already null
+    return (codes >= 0) & is_token[codes]
 
 
 def treat_nulls(df, verbose=False):
     """
     Treat various string representations of null values in a DataFrame.
 
+    Per-column conversion counts are stored in df.attrs[NULL_TOKENS_ATTR].
+
     Args:
         df: The DataFrame to treat
         verbose: If True, print diagnostic information
@@ -16,22 +50,6 @@ def treat_nulls(df, verbose=False):
     Returns:
         The treated DataFrame (modified in-place)
     """
-    # Create a copy to avoid modifying the original if needed
-    # df = df.copy()
-
-    # Define null representations
-    null_representations = [
-        "null",
-        "N/A",
-        "None",
-        "na",
-        "n/a",
-        "none",
-        "NULL",
-        "NA",
-        "",
-    ]
-
     # Get columns with object dtype (strings)
     object_columns = df.select_dtypes(include=["object"]).columns.tolist()
 
@@ -40,22 +58,14 @@ def treat_nulls(df, verbose=False):
 
     # Process each column
     for col in object_columns:
-        if col in df.columns:
-            # Count before replacement
-            before_count = df[col].isnull().sum()
-
-            # Replace various null representations with np.nan
-            # First perform the replacement, then explicitly call infer_objects() as a separate step
-            # This addresses the FutureWarning about silent downcasting in replace()
-            result = df[col].replace(null_representations, np.nan)
-            df[col] = result.infer_objects(copy=False)
-
-            # Count after replacement
-            after_count = df[col].isnull().sum()
-            new_nulls = after_count - before_count
-
-            if new_nulls > 0:
-                changes_made[col] = new_nulls
+        mask = _mask_null_tokens(df[col])
+        if mask is None:
+            continue
+        # mask() + infer_objects() so columns left with only numbers/NaN get a proper dtype
+        df[col] = df[col].mask(mask).infer_objects()
+        changes_made[col] = int(mask.sum())
+
+    df.attrs[NULL_TOKENS_ATTR] = changes_made
 
     # Print diagnostic information if requested
     if verbose and changes_made:
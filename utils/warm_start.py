@@ -0,0 +1,161 @@
+"""
+Warm start: serve the UI immediately and download/load the data in the background.
+
+Launch the app with
+    python -m utils.warm_start main.py --server.port=8080 --server.address=0.0.0.0
+instead of `python utils/dataretriever.py && streamlit run main.py`. The launcher starts
+Streamlit in this process right away and, in a background thread:
+1. syncs the Parquet files from GCS (utils/dataretriever.py);
+2. loads every public table into the shared cache, one stage per table;
+3. marks the instance ready.
+
+Pages that need data show a progress placeholder until then (render_progress_until_ready,
+called from main.py); pages listed in DATA_FREE_PAGES (config/pages.py) render at once.
+
+Readiness, for deployment probes:
+- HTTP: GET http://<host>:WARM_START_HEALTH_PORT/ready -> 200 when ready, 503 before
+  (JSON body with the current stage); 0 disables the endpoint
+- File: WARM_START_READY_FILE is created when ready (removed at launch)
+
+With plain `streamlit run main.py` warm start is not active and pages render as before.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+WARM_START_HEALTH_PORT = int(os.environ.get("WARM_START_HEALTH_PORT", "8081"))
+WARM_START_READY_FILE = os.environ.get("WARM_START_READY_FILE", "/tmp/creators_engine_ready")
+
+# Stages: "disabled" (not launched through warm start), "syncing", "loading", "ready", "failed"
+_STATE = {
+    "stage": "disabled",
+    "detail": "",
+    "done": 0,
+    "total": 0,
+    "started_at": None,
+    "ready_at": None,
+    "error": None,
+}
+_STATE_LOCK = threading.Lock()
+
+
+def _update(**changes) -> None:
+    with _STATE_LOCK:
+        _STATE.update(changes)
+
+
+def status() -> dict:
+    """Copy of the warm-start state."""
+    with _STATE_LOCK:
+        return dict(_STATE)
+
+
+def is_ready() -> bool:
+    """True once the data is loaded, or when warm start is not active."""
+    return status()["stage"] in ("ready", "disabled", "failed")
+
+
+def _warm() -> None:
+    """Background thread: sync the files, then load every public table."""
+    from utils.dataloader import PUBLIC_TABLES, load_table
+    from utils.dataretriever import main as sync_data
+
+    total = 1 + len(PUBLIC_TABLES)
+    try:
+        _update(stage="syncing", detail="Downloading data files", done=0, total=total)
+        start = time.perf_counter()
+        sync_data()
+        logger.info(f"Warm start: data sync took {time.perf_counter() - start:.1f}s")
+
+        for done, table in enumerate(PUBLIC_TABLES, start=1):
+            _update(stage="loading", detail=f"Loading {table}", done=done)
+            start = time.perf_counter()
+            load_table(table)
+            logger.info(f"Warm start: {table} loaded in {time.perf_counter() - start:.1f}s")
+
+        _update(stage="ready", detail="", done=total, ready_at=time.time())
+        with open(WARM_START_READY_FILE, "w") as f:
+            f.write("ready\n")
+        logger.info("Warm start: ready")
+    except Exception as e:
+        # Pages then load their data on demand, as without warm start
+        logger.exception("Warm start failed")
+        _update(stage="failed", error=str(e))
+
+
+class _ReadinessHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        state = status()
+        ready = state["stage"] == "ready"
+        if self.path.rstrip("/") == "/ready":
+            code = 200 if ready else 503
+        elif self.path.rstrip("/") in ("", "/health"):
+            code = 200  # process alive
+        else:
+            code = 404
+        body = json.dumps(state).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Probes hit this every few seconds: keep them out of the logs
+        pass
+
+
+def start() -> None:
+    """Start the background warm-up (and the readiness endpoint) in this process."""
+    if os.path.exists(WARM_START_READY_FILE):
+        os.remove(WARM_START_READY_FILE)
+    _update(stage="syncing", detail="Starting", started_at=time.time())
+    if WARM_START_HEALTH_PORT:
+        server = ThreadingHTTPServer(("0.0.0.0", WARM_START_HEALTH_PORT), _ReadinessHandler)
+        threading.Thread(
+            target=server.serve_forever, name="warm-start-health", daemon=True
+        ).start()
+    threading.Thread(target=_warm, name="warm-start", daemon=True).start()
+
+
+def render_progress_until_ready(poll_seconds: float = 1.0) -> None:
+    """
+    Show the loading progress in place of a page while warm start is still running,
+    rerunning until the data is ready. Returns immediately when it is.
+    """
+    if is_ready():
+        return
+    state = status()
+    st.info("Loading data, this page will open as soon as it is ready.")
+    st.progress(
+        state["done"] / max(state["total"], 1),
+        text=f"{state['detail']} ({state['done']}/{state['total']})",
+    )
+    time.sleep(poll_seconds)
+    st.rerun()
+
+
+def launch(argv) -> None:
+    """Start the warm-up, then run Streamlit in this process with `streamlit run <argv>`."""
+    from streamlit.web import cli as streamlit_cli
+
+    start()
+    sys.argv = ["streamlit", "run", *argv]
+    sys.exit(streamlit_cli.main())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    # Import the module by name so main.py (run by Streamlit) sees the same state
+    from utils.warm_start import launch as _launch
+
+    _launch(sys.argv[1:] or ["main.py"])